@@ -1,9 +1,56 @@
+import time
+
+_run_started = time.perf_counter()
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import functools
+import json
+import os
+from streamlit.logger import get_logger
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# pandas, plotly.express and the catalog modules are imported on first use:
+# the catalog loads on a worker thread and the SVG scatter path imports px.
+from rocketsim import (
+    MAX_STEPS,
+    ORBIT_ALT_M,
+    REPORT_FORMATS,
+    Envelope,
+    Profiler,
+    ResultCache,
+    build_report,
+    code_version,
+    collect_trajectory,
+    quantize_sliders,
+    run_dispersion,
+    run_simulation,
+    run_simulation_adaptive,
+    run_simulation_atmospheric,
+    run_simulation_closed_form,
+    solve_parameter,
+    stream_simulation,
+    stream_simulation_atmospheric,
+    validate_closed_form,
+)
+from rocketsim.charts import (
+    RenderPolicy,
+    downsample_rows,
+    figure_json,
+    line_trace,
+    memoize_figure,
+    register_template,
+    scatter,
+)
+
+_imports_done = time.perf_counter()
+
+# Goes through Streamlit's log handler, so `--logger.level` controls it.
+log = get_logger("rocketlauncher")
 
 # ── Page config ──────────────────────────────────────────────────────────────
 st.set_page_config(
@@ -207,72 +254,148 @@ footer { visibility: hidden; }
 </style>
 """, unsafe_allow_html=True)
 
+# ── Profiling ─────────────────────────────────────────────────────────────────
+@st.cache_resource
+def get_profiler():
+    # Off unless ROCKET_PROFILE=1. ROCKET_PROFILE_PATH also writes the metrics
+    # after every rerun, as JSON (.json) or Prometheus text (anything else).
+    return Profiler.from_env()
+
+profiler = get_profiler()
+timed = profiler.section
+profiler.begin_rerun(getattr(get_script_run_ctx(), "session_id", None))
+
+def profiled(fragment):
+    # A widget inside a fragment reruns only that fragment, which never reaches
+    # begin_rerun/end_rerun above; give such reruns a breakdown of their own.
+    if not profiler.enabled:
+        return fragment
+
+    @functools.wraps(fragment)
+    def body(*args, **kwargs):
+        ctx = get_script_run_ctx()
+        alone = bool(getattr(ctx, "fragment_ids_this_run", None))
+        with profiler.fragment(fragment.__name__, getattr(ctx, "session_id", None), alone):
+            result = fragment(*args, **kwargs)
+        if alone and profiler.path:
+            profiler.write(cache_stats())  # full reruns write theirs with the diagnostics
+        return result
+    return body
+
 # ── Mission Data ──────────────────────────────────────────────────────────────
-@st.cache_data
+def _load_catalog():
+    # Frame, filter index, aggregation cube and fingerprint; the timing includes
+    # importing pandas, which happens here on first use, and replaying the inbox.
+    started = time.perf_counter()
+    with profiler.capture("data.load"), timed("data.load"):
+        from rocketsim.missions import APP_COLUMNS, CatalogStore, load_catalog
+
+        loaded = load_catalog(os.environ.get("ROCKET_MISSIONS_PATH"), columns=APP_COLUMNS)
+        store = CatalogStore(loaded, inbox=os.environ.get("ROCKET_MISSIONS_INBOX"))
+        store.refresh()
+    store.catalog = store.catalog._replace(seconds=time.perf_counter() - started)
+    return store
+
+@st.cache_resource
+def get_catalog():
+    # One read-only catalog shared by every session, loaded on a worker thread so
+    # the header and tab bar paint while pandas imports and the file is read.
+    # Point ROCKET_MISSIONS_PATH at a Parquet, Arrow/Feather or CSV catalog to
+    # replace the built-in sample. Mission files dropped into ROCKET_MISSIONS_INBOX
+    # are appended to it as they arrive, without reloading what is already in.
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="catalog").submit(_load_catalog)
+
+def catalog():
+    future = get_catalog()
+    if not future.done():
+        with timed("data.wait"):
+            future.exception()
+        profiler.attach("data.load")  # ran on the catalog thread while this rerun waited
+    if future.exception() is not None:
+        get_catalog.clear()  # retry on the next run instead of caching the failure
+    return future.result().refresh()
+
 def load_data():
-    missions = [
-        # ISS Resupply
-        dict(name="CRS-1",      type="ISS",        year=2012, payload=905,   fuel=505000, cost=133,  duration=18,      distance=7700,       crew=0, success=True,  sci_yield=2),
-        dict(name="CRS-3",      type="ISS",        year=2014, payload=2095,  fuel=510000, cost=139,  duration=35,      distance=15500,      crew=0, success=True,  sci_yield=3),
-        dict(name="CRS-5",      type="ISS",        year=2015, payload=1898,  fuel=508000, cost=141,  duration=28,      distance=12200,      crew=0, success=True,  sci_yield=3),
-        dict(name="CRS-7",      type="ISS",        year=2015, payload=1898,  fuel=512000, cost=143,  duration=0,       distance=0,          crew=0, success=False, sci_yield=0),
-        dict(name="CRS-9",      type="ISS",        year=2016, payload=2257,  fuel=515000, cost=150,  duration=34,      distance=14800,      crew=0, success=True,  sci_yield=4),
-        dict(name="CRS-11",     type="ISS",        year=2017, payload=2708,  fuel=520000, cost=152,  duration=27,      distance=11800,      crew=0, success=True,  sci_yield=3),
-        dict(name="CRS-13",     type="ISS",        year=2017, payload=2205,  fuel=518000, cost=148,  duration=29,      distance=12600,      crew=0, success=True,  sci_yield=3),
-        dict(name="CRS-15",     type="ISS",        year=2018, payload=2697,  fuel=521000, cost=153,  duration=33,      distance=14400,      crew=0, success=True,  sci_yield=4),
-        dict(name="CRS-17",     type="ISS",        year=2019, payload=2490,  fuel=519000, cost=155,  duration=27,      distance=11800,      crew=0, success=True,  sci_yield=3),
-        dict(name="CRS-20",     type="ISS",        year=2020, payload=1977,  fuel=516000, cost=157,  duration=62,      distance=27000,      crew=0, success=True,  sci_yield=5),
-        dict(name="CRS-22",     type="ISS",        year=2021, payload=3328,  fuel=525000, cost=162,  duration=91,      distance=39700,      crew=0, success=True,  sci_yield=6),
-        dict(name="CRS-24",     type="ISS",        year=2022, payload=3005,  fuel=523000, cost=165,  duration=34,      distance=14800,      crew=0, success=True,  sci_yield=4),
-        # Scientific
-        dict(name="Mars Odyssey",  type="Scientific", year=2001, payload=376,  fuel=340000, cost=297,  duration=2373, distance=460000000,  crew=0, success=True,  sci_yield=9),
-        dict(name="Mars Express",  type="Scientific", year=2003, payload=666,  fuel=365000, cost=330,  duration=7300, distance=400000000,  crew=0, success=True,  sci_yield=9),
-        dict(name="MER-A Spirit",  type="Scientific", year=2003, payload=185,  fuel=330000, cost=400,  duration=2555, distance=480000000,  crew=0, success=True,  sci_yield=10),
-        dict(name="Cassini",       type="Scientific", year=2004, payload=2523, fuel=720000, cost=3270, duration=7300, distance=1500000000, crew=0, success=True,  sci_yield=10),
-        dict(name="New Horizons",  type="Scientific", year=2006, payload=478,  fuel=290000, cost=700,  duration=3468, distance=5900000000, crew=0, success=True,  sci_yield=10),
-        dict(name="Phoenix",       type="Scientific", year=2007, payload=350,  fuel=280000, cost=420,  duration=300,  distance=680000000,  crew=0, success=True,  sci_yield=7),
-        dict(name="LRO",           type="Scientific", year=2009, payload=1916, fuel=340000, cost=583,  duration=1825, distance=384000,     crew=0, success=True,  sci_yield=8),
-        dict(name="Curiosity",     type="Scientific", year=2011, payload=899,  fuel=440000, cost=2500, duration=4380, distance=560000000,  crew=0, success=True,  sci_yield=10),
-        dict(name="MAVEN",         type="Scientific", year=2013, payload=809,  fuel=420000, cost=671,  duration=3650, distance=710000000,  crew=0, success=True,  sci_yield=8),
-        dict(name="OSIRIS-REx",    type="Scientific", year=2016, payload=2110, fuel=550000, cost=800,  duration=2555, distance=270000000,  crew=0, success=True,  sci_yield=9),
-        dict(name="InSight",       type="Scientific", year=2018, payload=694,  fuel=310000, cost=813,  duration=1460, distance=485000000,  crew=0, success=True,  sci_yield=8),
-        dict(name="Perseverance",  type="Scientific", year=2020, payload=1025, fuel=450000, cost=2700, duration=1460, distance=500000000,  crew=0, success=True,  sci_yield=10),
-        dict(name="DART",          type="Scientific", year=2021, payload=610,  fuel=290000, cost=330,  duration=365,  distance=11000000,   crew=0, success=True,  sci_yield=7),
-        # Commercial
-        dict(name="AsiaSat 6",    type="Commercial", year=2014, payload=4200,  fuel=525000,  cost=62,  duration=0,  distance=35786, crew=0, success=True,  sci_yield=1),
-        dict(name="Eutelsat 115W",type="Commercial", year=2015, payload=4707,  fuel=538000,  cost=65,  duration=0,  distance=35786, crew=0, success=True,  sci_yield=1),
-        dict(name="SES-9",        type="Commercial", year=2016, payload=5271,  fuel=545000,  cost=70,  duration=0,  distance=35786, crew=0, success=True,  sci_yield=1),
-        dict(name="Iridium-1",    type="Commercial", year=2017, payload=9600,  fuel=560000,  cost=82,  duration=1,  distance=780,   crew=0, success=True,  sci_yield=2),
-        dict(name="Arabsat-6A",   type="Commercial", year=2019, payload=6465,  fuel=1150000, cost=150, duration=0,  distance=35786, crew=0, success=True,  sci_yield=1),
-        dict(name="Starlink-1",   type="Commercial", year=2019, payload=15400, fuel=550000,  cost=50,  duration=0,  distance=550,   crew=0, success=True,  sci_yield=1),
-        dict(name="Starlink-10",  type="Commercial", year=2020, payload=15400, fuel=548000,  cost=50,  duration=0,  distance=550,   crew=0, success=True,  sci_yield=1),
-        dict(name="ViaSat-3",     type="Commercial", year=2023, payload=6400,  fuel=1160000, cost=165, duration=1,  distance=35786, crew=0, success=True,  sci_yield=2),
-        dict(name="Astra-1P",     type="Commercial", year=2024, payload=5200,  fuel=530000,  cost=68,  duration=0,  distance=35786, crew=0, success=True,  sci_yield=1),
-        # Military
-        dict(name="USA-193",    type="Military", year=2006, payload=2300, fuel=490000, cost=800,  duration=1, distance=350,   crew=0, success=False, sci_yield=1),
-        dict(name="WGS-1",      type="Military", year=2007, payload=5987, fuel=542000, cost=350,  duration=1, distance=35786, crew=0, success=True,  sci_yield=1),
-        dict(name="MUOS-1",     type="Military", year=2012, payload=6740, fuel=555000, cost=500,  duration=1, distance=35786, crew=0, success=True,  sci_yield=1),
-        dict(name="GPS-IIF-4",  type="Military", year=2013, payload=1630, fuel=440000, cost=120,  duration=1, distance=20200, crew=0, success=True,  sci_yield=2),
-        dict(name="SBIRS Geo-3",type="Military", year=2017, payload=4500, fuel=535000, cost=1400, duration=1, distance=35786, crew=0, success=True,  sci_yield=2),
-        dict(name="USA-290",    type="Military", year=2019, payload=3800, fuel=520000, cost=950,  duration=1, distance=35786, crew=0, success=True,  sci_yield=1),
-        dict(name="GPS-III SV04",type="Military",year=2021, payload=4311, fuel=530000, cost=500,  duration=1, distance=20200, crew=0, success=True,  sci_yield=2),
-        dict(name="AEHF-6",     type="Military", year=2020, payload=6170, fuel=548000, cost=2000, duration=1, distance=35786, crew=0, success=True,  sci_yield=1),
-        # Lunar / Crewed
-        dict(name="Crew Dragon DM-2",type="Lunar", year=2020, payload=12200, fuel=549000, cost=55,   duration=62,  distance=8500,  crew=2, success=True, sci_yield=7),
-        dict(name="Crew-1",          type="Lunar", year=2020, payload=12200, fuel=549000, cost=55,   duration=167, distance=72000, crew=4, success=True, sci_yield=8),
-        dict(name="Crew-2",          type="Lunar", year=2021, payload=12200, fuel=549000, cost=55,   duration=199, distance=86000, crew=4, success=True, sci_yield=8),
-        dict(name="Crew-3",          type="Lunar", year=2021, payload=12200, fuel=549000, cost=55,   duration=175, distance=76000, crew=4, success=True, sci_yield=8),
-        dict(name="Artemis I",       type="Lunar", year=2022, payload=27000, fuel=2770000,cost=4100, duration=25,  distance=450000,crew=0, success=True, sci_yield=9),
-        dict(name="Crew-4",          type="Lunar", year=2022, payload=12200, fuel=549000, cost=55,   duration=170, distance=74000, crew=4, success=True, sci_yield=8),
-        dict(name="Crew-5",          type="Lunar", year=2022, payload=12200, fuel=549000, cost=55,   duration=157, distance=68000, crew=4, success=True, sci_yield=8),
-        dict(name="Crew-6",          type="Lunar", year=2023, payload=12200, fuel=549000, cost=55,   duration=186, distance=81000, crew=4, success=True, sci_yield=9),
-    ]
-    df = pd.DataFrame(missions)
-    df["fuel_tonnes"] = df["fuel"] / 1000
-    df["success_label"] = df["success"].map({True: "Success", False: "Failure"})
-    return df
+    return catalog().data
+
+def get_cube():
+    return catalog().cube
+
+def get_type_stats():
+    return catalog().stats
+
+@st.cache_resource(max_entries=2)
+def get_quantile_check(version, _data, _stats):
+    # Sketched against exact quantiles on the loaded catalog, once per version.
+    from rocketsim import check_quantiles
+
+    with timed("aggregate.quantile_check"):
+        return check_quantiles(_data, _stats)
+
+def get_mission_index():
+    return catalog().index
+
+def get_catalog_version():
+    return catalog().version
+
+# ── Catalog replay ────────────────────────────────────────────────────────────
+REPLAY_MODELS = {"Fixed-step Euler": "euler", "Closed form": "closed"}
+
+def _replay(data, method, progress):
+    from rocketsim.replay import replay_missions
+
+    def update(done, total):
+        progress[:] = done, total
+
+    with timed(f"replay.{method}"):
+        return replay_missions(data, method, progress=update)
 
-df_all = load_data()
+@st.cache_resource(max_entries=4)
+def get_replay(version, method, _data):
+    # Every mission run through the launch model once per catalog version and
+    # model, on a worker thread shared by all sessions: viewers poll the
+    # returned [done, total] configurations instead of each starting a replay.
+    progress = [0, 0]
+    future = ThreadPoolExecutor(max_workers=1, thread_name_prefix="replay").submit(_replay, _data, method, progress)
+    return future, progress
+
+def replay(method):
+    loaded = catalog()
+    return get_replay(loaded.version, method, loaded.data)
+
+# ── Simulation result cache (shared by every session in this process) ────────
+@st.cache_resource
+def get_sim_cache():
+    # Set ROCKET_CACHE_PATH to a local .sqlite file to keep results across restarts;
+    # results stored by a different version of the models are not read back.
+    import rocketsim.atmosphere
+    import rocketsim.simulation
+
+    return ResultCache(path=os.environ.get("ROCKET_CACHE_PATH"),
+                       version=code_version(rocketsim.simulation, rocketsim.atmosphere))
+
+@st.cache_resource
+def get_envelope():
+    # Built offline with `python -m rocketsim.envelope build --out envelope.npy`.
+    path = os.environ.get("ROCKET_ENVELOPE_PATH",
+                          os.path.join(os.path.dirname(os.path.abspath(__file__)), "envelope.npy"))
+    return Envelope(path) if os.path.exists(path) else None
+
+@st.cache_resource
+def get_figure_cache():
+    # Serialized figure JSON, keyed on chart, catalog fingerprint and filter state.
+    return ResultCache(max_bytes=32 * 2**20)
+
+INTEGRATORS = {
+    "Fixed-step Euler (dt = 2 s)":     ("euler",      run_simulation),
+    "Adaptive RK45 · event detection": ("adaptive",   run_simulation_adaptive),
+    "Closed form · analytic":          ("closed",     run_simulation_closed_form),
+    "Euler · drag + 1976 atmosphere":  ("atmosphere", run_simulation_atmospheric),
+}
+# Stepped models that can also stream their trajectory in chunks while they run.
+MODEL_NAMES = {method: label for label, (method, _) in INTEGRATORS.items()}
+STREAMS = {"euler": stream_simulation, "atmosphere": stream_simulation_atmospheric}
+PAINT_INTERVAL = 0.1    # s between progressive repaints of a running simulation
 
 # ── Plotly theme ──────────────────────────────────────────────────────────────
 COLORS = {
@@ -292,9 +415,320 @@ PLOTLY_LAYOUT = dict(
     legend=dict(bgcolor="rgba(0,0,0,0)", bordercolor="#0d2a5e", borderwidth=1, font=dict(color="#c8e0ff")),
     margin=dict(l=60, r=40, t=50, b=60),
 )
+# Registered once per process as the default template, so figures are born themed
+# instead of re-validating PLOTLY_LAYOUT per figure. Charts render with theme=None
+# because Streamlit merges its own theme into the template on the client.
+@st.cache_resource
+def get_template():
+    return register_template("rocket", PLOTLY_LAYOUT)
+
+get_template()
+
+POINT_MARKER = dict(size=9, opacity=0.85, line=dict(width=1, color="rgba(255,255,255,0.2)"))
+# Row/point thresholds for WebGL, density binning and line downsampling, and the
+# trajectory decimation; override with ROCKET_WEBGL_ROWS, ROCKET_DENSITY_ROWS,
+# ROCKET_DENSITY_BINS, ROCKET_LINE_POINTS and ROCKET_SAMPLE_EVERY.
+RENDER_POLICY = RenderPolicy.from_env()
+# Every model's trajectory has as many samples as the fixed-step ones keep.
+SAMPLING = {
+    "euler":      dict(sample_every=RENDER_POLICY.sample_every),
+    "atmosphere": dict(sample_every=RENDER_POLICY.sample_every),
+    "adaptive":   dict(n_samples=MAX_STEPS // RENDER_POLICY.sample_every + 1),
+    "closed":     dict(n_points=MAX_STEPS // RENDER_POLICY.sample_every + 1),
+}
+
+def show_figure(spec, container=st):
+    with timed("chart.send"):
+        container.plotly_chart(json.loads(spec), theme=None, width="stretch")
+
+# ── Figures ───────────────────────────────────────────────────────────────────
+# Builders take filter state, never data, and return figure JSON memoized per
+# catalog version: a repeat view is a cache lookup. Figures of the models and
+# fixed tables skip the version, so they neither wait for the catalog to load
+# nor drop out of the cache when missions are appended.
+figure = memoize_figure(get_figure_cache(), get_catalog_version, section=timed)
+
+def pandas_imported():
+    # Plotly looks pandas up in sys.modules when it validates arrays and trips
+    # over the half-imported module while the catalog thread imports it; an
+    # import here waits for that import to finish, not for the whole load.
+    import pandas  # noqa: F401
+
+model_figure = memoize_figure(get_figure_cache(), pandas_imported, section=timed)
+
+def simulate(method, *sim_key, on_chunk=None):
+    # On a miss, streamable models call `on_chunk` as their trajectory grows.
+    run = dict(INTEGRATORS.values())[method]
+
+    sampling = SAMPLING[method]
+
+    def compute():
+        with timed(f"simulate.{method}"):
+            if on_chunk and method in STREAMS:
+                return collect_trajectory(STREAMS[method](*sim_key, **sampling), on_chunk)
+            return run(*sim_key, **sampling)
+
+    return get_sim_cache().get_or_compute((method,) + sim_key + (RENDER_POLICY.sample_every,), compute)
+
+@figure
+def payload_fuel_chart(mission_type, year_max):
+    with timed("filter.overview"):
+        df = get_mission_index().select(mission_type, year_max)
+    return scatter(
+        df, "payload", "fuel_tonnes", RENDER_POLICY, marker=POINT_MARKER,
+        color="type", color_discrete_map=COLORS, category_orders={"type": list(COLORS)},
+        hover_name="name",
+        hover_data={"year": True, "cost": True, "success_label": True},
+        labels={"payload": "Payload Mass (kg)", "fuel_tonnes": "Fuel Consumption (tonnes)", "type": "Mission Type"},
+        title="Payload Mass vs Fuel Consumption",
+    )
+
+@figure
+def cost_success_chart(mission_type, year_max):
+    with timed("aggregate.cost_buckets"):
+        bucket_labels, success_rates, counts = get_cube().cost_bucket_rates(mission_type, year_max)
+
+    bar_colors = ["#39ff14" if r >= 90 else "#00d4ff" if r >= 70 else "#ff4d6d" for r in success_rates]
+    fig = go.Figure(go.Bar(
+        x=bucket_labels, y=success_rates,
+        marker_color=bar_colors,
+        marker_line_color=[c for c in bar_colors],
+        marker_line_width=1.5,
+        text=[f"{r}%" for r in success_rates],
+        textposition="outside",
+        textfont=dict(color="#c8e0ff"),
+        customdata=counts,
+        hovertemplate="<b>%{x}</b><br>Success Rate: %{y}%<br>Missions: %{customdata}<extra></extra>",
+    ))
+    fig.update_layout(
+        title="Mission Cost vs Success Rate",
+        yaxis=dict(range=[0, 115], title="Success Rate (%)"),
+        xaxis_title="Mission Cost Range",
+    )
+    return fig
+
+@figure
+def replay_chart(mission_type, year_max, method):
+    with timed("filter.overview"):
+        df = get_mission_index().select(mission_type, year_max)
+    df = df.join(replay(method)[0].result()[["pred_apogee_km"]])
+    return scatter(
+        df, "distance", "pred_apogee_km", RENDER_POLICY, marker=POINT_MARKER, log_x=True, log_y=True,
+        color="success_label", color_discrete_map={"Success": "#39ff14", "Failure": "#ff4d6d"},
+        hover_name="name",
+        hover_data={"type": True, "year": True, "payload": True},
+        labels={"distance": "Recorded Distance (km)", "pred_apogee_km": "Predicted Apogee (km)",
+                "success_label": "Recorded Outcome"},
+        title="Predicted Apogee vs Recorded Distance",
+    )
+
+@figure
+def duration_distance_chart(mission_type, year_max):
+    with timed("filter.overview"):
+        df = get_mission_index().select(mission_type, year_max)
+    with timed("filter.duration_line"):
+        df_line = df[(df["success"]) & (df["distance"] > 0)].sort_values("duration", kind="stable")
+        df_line = downsample_rows(df_line, np.log10(df_line["distance"].to_numpy() + 1), RENDER_POLICY)
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(go.Scatter(
+        x=df_line["name"], y=np.log10(df_line["distance"] + 1),
+        mode="lines+markers", name="log₁₀(Distance km)",
+        line=dict(color="#00d4ff", width=2),
+        marker=dict(size=5),
+        fill="tozeroy", fillcolor="rgba(0,212,255,0.07)",
+        customdata=df_line["distance"],
+        hovertemplate="<b>%{x}</b><br>Distance: %{customdata:,.0f} km<extra></extra>",
+    ), secondary_y=False)
+    fig.add_trace(go.Scatter(
+        x=df_line["name"], y=df_line["duration"],
+        mode="lines+markers", name="Duration (days)",
+        line=dict(color="#ff4d6d", width=1.5, dash="dot"),
+        marker=dict(size=4),
+        hovertemplate="<b>%{x}</b><br>Duration: %{y} days<extra></extra>",
+    ), secondary_y=True)
+    fig.update_layout(title="Mission Duration vs Distance Traveled")
+    fig.update_xaxes(tickangle=45, tickfont=dict(size=9))
+    fig.update_yaxes(title_text="log₁₀(Distance km)", gridcolor="#0d2a5e", secondary_y=False)
+    fig.update_yaxes(title_text="Duration (days)", gridcolor="rgba(0,0,0,0)", secondary_y=True)
+    return fig
+
+@figure
+def crew_success_chart():
+    with timed("aggregate.crew"):
+        crew_labels, crew_rates, crew_counts = get_cube().crew_rates()
+
+    fig = go.Figure(go.Bar(
+        x=crew_labels, y=crew_rates,
+        marker_color=["#00d4ff","#39ff14","#bf5fff","#ff9500"],
+        marker_line_color=["#00d4ff","#39ff14","#bf5fff","#ff9500"],
+        marker_line_width=2,
+        text=[f"{r}%" for r in crew_rates],
+        textposition="outside",
+        textfont=dict(color="#c8e0ff"),
+        customdata=crew_counts,
+        hovertemplate="<b>%{x}</b><br>Success Rate: %{y}%<br>Missions: %{customdata}<extra></extra>",
+    ))
+    fig.update_layout(
+        title="Crew Size vs Mission Success Rate",
+        yaxis=dict(range=[0, 115], title="Success Rate (%)"),
+        xaxis_title="Crew Size",
+    )
+    return fig
+
+@figure
+def yield_cost_chart():
+    return scatter(
+        load_data(), "cost", "sci_yield", RENDER_POLICY, marker=POINT_MARKER,
+        color="type", color_discrete_map=COLORS,
+        hover_name="name",
+        hover_data={"year": True, "success_label": True},
+        log_x=True,
+        labels={"cost": "Mission Cost ($M, log scale)", "sci_yield": "Scientific Yield (1–10)", "type": "Mission Type"},
+        title="Scientific Yield vs Mission Cost",
+    )
+
+@figure
+def outcomes_chart():
+    with timed("aggregate.outcomes"):
+        types, success_counts, fail_counts = get_cube().outcomes_by_type()
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=types, y=success_counts, name="Success",
+                         marker_color="rgba(57,255,20,0.5)", marker_line_color="#39ff14", marker_line_width=1.5))
+    fig.add_trace(go.Bar(x=types, y=fail_counts, name="Failure",
+                         marker_color="rgba(255,77,109,0.5)", marker_line_color="#ff4d6d", marker_line_width=1.5))
+    fig.update_layout(
+        title="Mission Outcomes by Type (Success / Failure)",
+        barmode="group",
+        xaxis_title="Mission Type",
+        yaxis_title="Mission Count",
+    )
+    return fig
+
+@model_figure
+def trajectory_chart(method, *sim_key):
+    return trajectory_figure(*simulate(method, *sim_key)[:6])
+
+def trajectory_figure(times, alts, vels, max_alt, max_vel, burn_end, done=True):
+    # Also drawn unmemoized from partial trajectories while a run streams in.
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(line_trace(
+        times, alts, RENDER_POLICY, name="Altitude (km)",
+        mode="lines",
+        line=dict(color="#39ff14", width=2.5),
+        fill="tozeroy", fillcolor="rgba(57,255,20,0.07)",
+        hovertemplate="t=%{x:,.1~f}s<br>Alt=%{y:,.3~f} km<extra></extra>",
+    ), secondary_y=False)
+    fig.add_trace(line_trace(
+        times, vels, RENDER_POLICY, name="Velocity (m/s)",
+        mode="lines",
+        line=dict(color="#ff9500", width=1.5, dash="dot"),
+        hovertemplate="t=%{x:,.1~f}s<br>Vel=%{y:,.1~f} m/s<extra></extra>",
+    ), secondary_y=True)
+
+    # Burn-end marker
+    if burn_end > 0 and burn_end < times[-1]:
+        fig.add_vline(x=burn_end, line_dash="dash", line_color="#ff4d6d",
+                      annotation_text="Fuel Exhausted", annotation_font_color="#ff4d6d",
+                      annotation_position="top right")
+
+    # Orbit line, once the run has finished or climbed past it, so a partial
+    # chart is not scaled to an altitude the flight may never reach
+    if done or max_alt >= ORBIT_ALT_M:
+        fig.add_hline(y=200, line_dash="dot", line_color="#00d4ff",
+                      annotation_text="LEO Threshold (200 km)",
+                      annotation_font_color="#00d4ff",
+                      annotation_position="bottom right",
+                      secondary_y=False)
+
+    fig.update_layout(title="Altitude & Velocity vs Time — Real-time Simulation" if done else
+                      f"Altitude & Velocity vs Time — Simulating · t = {times[-1]:,.0f} s")
+    fig.update_yaxes(title_text="Altitude (km)", gridcolor="#0d2a5e",
+                     tickcolor="#39ff14", tickfont=dict(color="#39ff14"), secondary_y=False)
+    fig.update_yaxes(title_text="Velocity (m/s)", gridcolor="rgba(0,0,0,0)",
+                     tickcolor="#ff9500", tickfont=dict(color="#ff9500"), secondary_y=True)
+    fig.update_xaxes(title_text="Time (s)")
+    return fig
+
+@model_figure
+def envelope_chart(payload_t):
+    envelope = get_envelope()
+    model = MODEL_NAMES.get(envelope.method, envelope.method)
+    fig = go.Figure(go.Heatmap(
+        x=envelope.axes[3], y=envelope.axes[1], z=envelope.min_thrust_for_orbit(payload_t),
+        colorscale=[[0, "#39ff14"], [0.5, "#00d4ff"], [1, "#ff4d6d"]],
+        colorbar=dict(title="kN"),
+        hovertemplate="Burn %{x} t/s · Fuel %{y} t<br>Min thrust: %{z:,.0f} kN<extra></extra>",
+    ))
+    fig.update_layout(
+        title=f"Minimum Thrust Reaching 200 km · Payload {payload_t} t · {model}",
+        xaxis_title="Burn Rate (t/s)", yaxis_title="Initial Fuel Mass (tonnes)",
+    )
+    return fig
 
-def apply_theme(fig):
-    fig.update_layout(**PLOTLY_LAYOUT)
+@figure
+def avg_payload_chart():
+    with timed("aggregate.mean_payload"):
+        types, avg_payload = get_cube().mean_payload_by_type()
+    type_colors = [COLORS.get(t, "#aaa") for t in types]
+    fig = go.Figure(go.Bar(
+        x=types, y=avg_payload,
+        marker_color=type_colors, marker_line_color=type_colors, marker_line_width=2,
+        hovertemplate="<b>%{x}</b><br>Avg Payload: %{y:,.0f} kg<extra></extra>",
+    ))
+    fig.update_layout(
+        title="Avg Payload Mass by Mission Type",
+        xaxis_title="Mission Type", yaxis_title="Avg Payload Mass (kg)",
+    )
+    return fig
+
+# Insights distribution views: label -> (metric, axis title, log axis).
+DISTRIBUTIONS = {
+    "Payload":     ("payload", "Payload Mass (kg)", False),
+    "Cost":        ("cost", "Mission Cost ($M)", False),
+    "Cost per kg": ("cost_per_kg", "Cost per kg of Payload (USD)", True),
+}
+
+@figure
+def distribution_chart(view):
+    metric, axis_title, log_y = DISTRIBUTIONS[view]
+    with timed("aggregate.quantiles"):
+        stats = get_type_stats()
+        types, counts, means, medians, p90s = stats.summary(metric)
+    bound = f"±{stats.relative_error:.0%}"
+    fig = go.Figure()
+    for name, values, color, note in (("Mean", means, "#00d4ff", "exact"), ("Median", medians, "#39ff14", bound),
+                                      ("P90", p90s, "#ff9500", bound)):
+        fig.add_trace(go.Bar(
+            name=name, x=types, y=values, customdata=counts,
+            marker_color=color, marker_line_color=color, marker_line_width=2,
+            hovertemplate=f"<b>%{{x}}</b><br>{name}: %{{y:,.0f}} ({note})<br>%{{customdata:,}} missions<extra></extra>",
+        ))
+    fig.update_layout(
+        title=f"{view} by Mission Type · Mean, Median & P90",
+        barmode="group", xaxis_title="Mission Type", yaxis_title=axis_title,
+        yaxis_type="log" if log_y else None,
+    )
+    return fig
+
+@model_figure
+def cost_efficiency_chart():
+    from rocketsim import COST_PER_KG_TO_LEO
+
+    rockets     = list(COST_PER_KG_TO_LEO)
+    efficiency  = list(COST_PER_KG_TO_LEO.values())
+    eff_colors  = ["#39ff14" if v < 4000 else "#00d4ff" if v < 10000 else "#ff4d6d" for v in efficiency]
+    fig = go.Figure(go.Bar(
+        x=rockets, y=efficiency,
+        marker_color=eff_colors, marker_line_color=eff_colors, marker_line_width=2,
+        hovertemplate="<b>%{x}</b><br>Cost: $%{y:,}/kg<extra></extra>",
+        text=[f"${v:,}" for v in efficiency],
+        textposition="outside", textfont=dict(color="#c8e0ff", size=10),
+    ))
+    fig.update_layout(
+        title="Cost Efficiency Index by Rocket Family ($/kg to LEO)",
+        xaxis_title="Rocket Family", yaxis_title="Cost per kg to LEO (USD)",
+    )
     return fig
 
 # ── Header ────────────────────────────────────────────────────────────────────
@@ -303,23 +737,31 @@ st.markdown('<div class="rocket-sub">Interactive analysis of historical rocket m
 st.markdown('<div class="scanline"></div>', unsafe_allow_html=True)
 
 # ── Tabs ──────────────────────────────────────────────────────────────────────
-tab1, tab2, tab3, tab4 = st.tabs(["◈ OVERVIEW", "◈ ANALYSIS", "◈ SIMULATION", "◈ INSIGHTS"])
+# Lazy tabs: switching tabs reruns the script, and only the open tab is built.
+tab1, tab2, tab3, tab4 = st.tabs(["◈ OVERVIEW", "◈ ANALYSIS", "◈ SIMULATION", "◈ INSIGHTS"],
+                                 key="active_tab", on_change="rerun")
+_first_paint = time.perf_counter()
+
+# Header and tab bar are on screen; warm the catalog while the open tab starts.
+# Mission charts key on the catalog version and wait for it; the simulation and
+# envelope figures do not, so the SIMULATION tab draws while the catalog loads.
+get_catalog()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 1 — OVERVIEW
 # ═══════════════════════════════════════════════════════════════════════════════
-with tab1:
+# Each tab is a fragment, so its own widgets rerun only that tab.
+@st.fragment
+@profiled
+def overview_tab():
     st.markdown('<div class="section-header">Mission Overview · All Launches</div>', unsafe_allow_html=True)
 
     col_f1, col_f2 = st.columns([1, 2])
     with col_f1:
-        mission_type = st.selectbox("Filter by Mission Type", ["All"] + sorted(df_all["type"].unique().tolist()))
+        mission_type = st.selectbox("Filter by Mission Type", ["All"] + get_mission_index().types)
     with col_f2:
         year_max = st.slider("Max Year", 2000, 2024, 2024)
-
-    df = df_all[df_all["year"] <= year_max].copy()
-    if mission_type != "All":
-        df = df[df["type"] == mission_type]
+    st.session_state.report_filters = (mission_type, year_max)
 
     st.divider()
 
@@ -327,158 +769,219 @@ with tab1:
     col1, col2 = st.columns(2)
 
     with col1:
-        fig1 = px.scatter(
-            df, x="payload", y="fuel_tonnes",
-            color="type", color_discrete_map=COLORS,
-            hover_name="name",
-            hover_data={"year": True, "cost": True, "success_label": True},
-            labels={"payload": "Payload Mass (kg)", "fuel_tonnes": "Fuel Consumption (tonnes)", "type": "Mission Type"},
-            title="Payload Mass vs Fuel Consumption",
-        )
-        fig1.update_traces(marker=dict(size=9, opacity=0.85, line=dict(width=1, color="rgba(255,255,255,0.2)")))
-        apply_theme(fig1)
-        st.plotly_chart(fig1, use_container_width=True)
+        show_figure(payload_fuel_chart(mission_type, year_max))
 
     # ── Chart 2: Mission Cost vs Success Rate (bar) ────────────────────────────
     with col2:
-        buckets = [
-            ("$0–100M",   0,    100),
-            ("$100–300M", 100,  300),
-            ("$300–800M", 300,  800),
-            ("$800M–2B",  800,  2000),
-            (">$2B",      2000, 1e9),
-        ]
-        bucket_labels, success_rates, counts = [], [], []
-        for label, lo, hi in buckets:
-            sub = df[(df["cost"] >= lo) & (df["cost"] < hi)]
-            if len(sub):
-                rate = round(sub["success"].mean() * 100, 1)
-            else:
-                rate = 0
-            bucket_labels.append(label)
-            success_rates.append(rate)
-            counts.append(len(sub))
-
-        bar_colors = ["#39ff14" if r >= 90 else "#00d4ff" if r >= 70 else "#ff4d6d" for r in success_rates]
-        fig2 = go.Figure(go.Bar(
-            x=bucket_labels, y=success_rates,
-            marker_color=bar_colors,
-            marker_line_color=[c for c in bar_colors],
-            marker_line_width=1.5,
-            text=[f"{r}%" for r in success_rates],
-            textposition="outside",
-            textfont=dict(color="#c8e0ff"),
-            customdata=counts,
-            hovertemplate="<b>%{x}</b><br>Success Rate: %{y}%<br>Missions: %{customdata}<extra></extra>",
-        ))
-        fig2.update_layout(
-            title="Mission Cost vs Success Rate",
-            yaxis=dict(range=[0, 115], title="Success Rate (%)"),
-            xaxis_title="Mission Cost Range",
-        )
-        apply_theme(fig2)
-        st.plotly_chart(fig2, use_container_width=True)
+        show_figure(cost_success_chart(mission_type, year_max))
 
     # ── Chart 3: Duration vs Distance (line) ──────────────────────────────────
-    df_line = df[(df["success"]) & (df["distance"] > 0)].sort_values("duration")
-    fig3 = make_subplots(specs=[[{"secondary_y": True}]])
-    fig3.add_trace(go.Scatter(
-        x=df_line["name"], y=np.log10(df_line["distance"] + 1),
-        mode="lines+markers", name="log₁₀(Distance km)",
-        line=dict(color="#00d4ff", width=2),
-        marker=dict(size=5),
-        fill="tozeroy", fillcolor="rgba(0,212,255,0.07)",
-        hovertemplate="<b>%{x}</b><br>Distance: %{text}<extra></extra>",
-        text=[f"{d:,.0f} km" for d in df_line["distance"]],
-    ), secondary_y=False)
-    fig3.add_trace(go.Scatter(
-        x=df_line["name"], y=df_line["duration"],
-        mode="lines+markers", name="Duration (days)",
-        line=dict(color="#ff4d6d", width=1.5, dash="dot"),
-        marker=dict(size=4),
-        hovertemplate="<b>%{x}</b><br>Duration: %{y} days<extra></extra>",
-    ), secondary_y=True)
-    fig3.update_layout(title="Mission Duration vs Distance Traveled", **PLOTLY_LAYOUT)
-    fig3.update_xaxes(tickangle=45, tickfont=dict(size=9))
-    fig3.update_yaxes(title_text="log₁₀(Distance km)", gridcolor="#0d2a5e", secondary_y=False)
-    fig3.update_yaxes(title_text="Duration (days)", gridcolor="rgba(0,0,0,0)", secondary_y=True)
-    st.plotly_chart(fig3, use_container_width=True)
+    show_figure(duration_distance_chart(mission_type, year_max))
+
+    replay_section(mission_type, year_max)
+
+# Opt-in and a nested fragment: its toggle and model choice rerun only this section.
+@st.fragment
+@profiled
+def replay_section(mission_type, year_max):
+    # ── Chart 4: Catalog replay (predicted vs recorded) ───────────────────────
+    st.markdown('<div class="section-header">Catalog Replay · Launch Model vs Record</div>', unsafe_allow_html=True)
+    rc1, rc2 = st.columns([1, 2])
+    with rc1:
+        enabled = st.toggle("Replay every mission through the launch model")
+    with rc2:
+        model = st.radio("Replay model", list(REPLAY_MODELS), horizontal=True, disabled=not enabled)
+    st.session_state.report_replay = REPLAY_MODELS[model] if enabled else None
+    if not enabled:
+        return
+
+    from rocketsim.replay import ISP_S, LIFTOFF_TWR, TANK_FRACTION
+
+    method = REPLAY_MODELS[model]
+    future, progress = replay(method)
+    if not future.done():
+        bar = st.progress(0.0, text="Replaying the catalog…")
+        while not future.done():
+            done, total = progress
+            bar.progress(done / total if total else 0.0, text=f"{done:,} / {total:,} distinct configurations")
+            time.sleep(0.25)
+        bar.empty()
+    if future.exception() is not None:
+        get_replay.clear()  # retry on the next run instead of caching the failure
+    predicted = future.result()
+
+    rows = get_mission_index().select(mission_type, year_max)
+    if len(rows):
+        orbit = predicted["pred_orbit"].loc[rows.index].to_numpy()
+        success = rows["success"].to_numpy()
+        r1, r2, r3 = st.columns(3)
+        r1.metric("Predicted to Reach Orbit", f"{orbit.mean():.0%}")
+        r2.metric("Recorded Success", f"{success.mean():.0%}")
+        r3.metric("Model Agrees with Record", f"{(orbit == success).mean():.0%}")
+    show_figure(replay_chart(mission_type, year_max, method))
+    st.caption(f"Each mission flown with its recorded payload and fuel · liftoff thrust/weight {LIFTOFF_TWR} · "
+               f"Isp {ISP_S} s · tankage {TANK_FRACTION:.0%} of fuel · computed once per catalog version · "
+               "failed missions have no recorded distance and fall off the log axis")
+
+with tab1:
+    if tab1.open:
+        overview_tab()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 2 — ANALYSIS
 # ═══════════════════════════════════════════════════════════════════════════════
-with tab2:
+@st.fragment
+@profiled
+def analysis_tab():
     st.markdown('<div class="section-header">Deep Analysis · Crew & Scientific Yield</div>', unsafe_allow_html=True)
 
     col1, col2 = st.columns(2)
 
     # ── Chart 4: Crew Size vs Success Rate (grouped bar) ─────────────────────
     with col1:
-        crew_groups = {"0 (Unmanned)": (0,0), "1–2": (1,2), "3–5": (3,5), "6+": (6,99)}
-        crew_labels, crew_rates, crew_counts = [], [], []
-        for label, (lo, hi) in crew_groups.items():
-            sub = df_all[(df_all["crew"] >= lo) & (df_all["crew"] <= hi)]
-            crew_labels.append(label)
-            crew_rates.append(round(sub["success"].mean() * 100, 1) if len(sub) else 0)
-            crew_counts.append(len(sub))
-
-        fig4 = go.Figure(go.Bar(
-            x=crew_labels, y=crew_rates,
-            marker_color=["#00d4ff","#39ff14","#bf5fff","#ff9500"],
-            marker_line_color=["#00d4ff","#39ff14","#bf5fff","#ff9500"],
-            marker_line_width=2,
-            text=[f"{r}%" for r in crew_rates],
-            textposition="outside",
-            textfont=dict(color="#c8e0ff"),
-            customdata=crew_counts,
-            hovertemplate="<b>%{x}</b><br>Success Rate: %{y}%<br>Missions: %{customdata}<extra></extra>",
-        ))
-        fig4.update_layout(
-            title="Crew Size vs Mission Success Rate",
-            yaxis=dict(range=[0, 115], title="Success Rate (%)"),
-            xaxis_title="Crew Size",
-        )
-        apply_theme(fig4)
-        st.plotly_chart(fig4, use_container_width=True)
+        show_figure(crew_success_chart())
 
     # ── Chart 5: Scientific Yield vs Cost (scatter) ───────────────────────────
     with col2:
-        fig5 = px.scatter(
-            df_all, x="cost", y="sci_yield",
-            color="type", color_discrete_map=COLORS,
-            hover_name="name",
-            hover_data={"year": True, "success_label": True},
-            log_x=True,
-            labels={"cost": "Mission Cost ($M, log scale)", "sci_yield": "Scientific Yield (1–10)", "type": "Mission Type"},
-            title="Scientific Yield vs Mission Cost",
-        )
-        fig5.update_traces(marker=dict(size=9, opacity=0.85, line=dict(width=1, color="rgba(255,255,255,0.2)")))
-        apply_theme(fig5)
-        st.plotly_chart(fig5, use_container_width=True)
+        show_figure(yield_cost_chart())
 
     # ── Mission Outcomes by Type ───────────────────────────────────────────────
-    types = df_all["type"].unique().tolist()
-    success_counts = [df_all[(df_all["type"] == t) & (df_all["success"])].shape[0] for t in types]
-    fail_counts    = [df_all[(df_all["type"] == t) & (~df_all["success"])].shape[0] for t in types]
-
-    fig6 = go.Figure()
-    fig6.add_trace(go.Bar(x=types, y=success_counts, name="Success",
-                          marker_color="rgba(57,255,20,0.5)", marker_line_color="#39ff14", marker_line_width=1.5))
-    fig6.add_trace(go.Bar(x=types, y=fail_counts, name="Failure",
-                          marker_color="rgba(255,77,109,0.5)", marker_line_color="#ff4d6d", marker_line_width=1.5))
-    fig6.update_layout(
-        title="Mission Outcomes by Type (Success / Failure)",
-        barmode="group",
-        xaxis_title="Mission Type",
-        yaxis_title="Mission Count",
-    )
-    apply_theme(fig6)
-    st.plotly_chart(fig6, use_container_width=True)
+    show_figure(outcomes_chart())
+
+with tab2:
+    if tab2.open:
+        analysis_tab()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 3 — SIMULATION
 # ═══════════════════════════════════════════════════════════════════════════════
-with tab3:
+# The solver, envelope and dispersion sections are nested fragments: pressing
+# Solve or Run Dispersion leaves the main simulation chart untouched.
+@st.fragment
+@profiled
+def solver_section(sim_key, method, integrator):
+    # ── Inverse solver ────────────────────────────────────────────────────────
+    st.markdown('<div class="section-header">Inverse Solver · Hit a Target</div>', unsafe_allow_html=True)
+    solve_params = {
+        "Thrust (kN)": "thrust_kn",
+        "Initial Fuel Mass (tonnes)": "fuel_t",
+        "Payload Mass (tonnes)": "payload_t",
+        "Burn Rate (t/s)": "burn_tps",
+    }
+    iv1, iv2, iv3 = st.columns(3)
+    with iv1:
+        solve_for = st.selectbox("Solve for", list(solve_params))
+    with iv2:
+        target_kind = st.radio("Target", ["Apogee (km)", "Burnout velocity (m/s)"], horizontal=True)
+    with iv3:
+        target_val = st.number_input(target_kind, min_value=1.0,
+                                     value=200.0 if target_kind.startswith("Apogee") else 8000.0)
+    st.caption(f"The other three sliders stay fixed · {integrator} model · "
+               f"payload is maximised, the other parameters minimised")
+
+    if st.button("▶ Solve"):
+        if target_kind.startswith("Apogee"):
+            sol = solve_parameter(solve_params[solve_for], target_val * 1000, *sim_key,
+                                  quantity="max_alt", method=method)
+            achieved = f"{sol.achieved / 1000:,.1f} km"
+        else:
+            sol = solve_parameter(solve_params[solve_for], target_val, *sim_key,
+                                  quantity="max_vel", method=method)
+            achieved = f"{sol.achieved:,.0f} m/s"
+        if sol.converged:
+            s1, s2, s3, s4 = st.columns(4)
+            s1.metric(f"{solve_for}", f"{sol.slider_value:g}", help=f"Exact crossing: {sol.value:.4g}")
+            s2.metric("Achieved", achieved)
+            s3.metric("Iterations", f"{sol.iterations} ({sol.evaluations} runs)")
+            s4.metric("Wall Time", f"{sol.seconds * 1000:.1f} ms")
+        else:
+            st.warning(f"{solve_for}: {sol.message}.")
+
+
+@st.fragment
+@profiled
+def envelope_section(payload_t, method):
+    # ── Performance envelope ──────────────────────────────────────────────────
+    st.markdown('<div class="section-header">Performance Envelope · Minimum Thrust to LEO</div>', unsafe_allow_html=True)
+    envelope = get_envelope()
+    if envelope is None:
+        st.info("No envelope table found. Build one with "
+                "`python -m rocketsim.envelope build --out envelope.npy`.")
+    else:
+        min_thrust = envelope.min_thrust_for_orbit(payload_t)
+        show_figure(envelope_chart(payload_t))
+        reachable = np.isfinite(min_thrust)
+        model = MODEL_NAMES.get(envelope.method, envelope.method)
+        if reachable.any():
+            st.caption(f"{model} model · lowest thrust reaching LEO with this payload: "
+                       f"{np.nanmin(min_thrust):,.0f} kN · {reachable.mean():.0%} of fuel/burn settings can reach it")
+        else:
+            st.caption(f"{model} model · no tabulated thrust reaches LEO with this payload")
+        if envelope.method != method:
+            st.caption(f"The cards above use the {MODEL_NAMES[method]} model, so near the boundary "
+                       "they can disagree with this map")
+
+
+@st.fragment
+@profiled
+def dispersion_section(sim_key):
+    # ── Monte Carlo dispersion ────────────────────────────────────────────────
+    st.markdown('<div class="section-header">Monte Carlo Dispersion · Altitude Uncertainty</div>', unsafe_allow_html=True)
+    dc1, dc2, dc3, dc4, dc5 = st.columns(5)
+    with dc1:
+        thrust_tol = st.slider("Thrust σ (%)", 0.0, 10.0, 2.0, step=0.5)
+    with dc2:
+        burn_tol   = st.slider("Burn Rate σ (%)", 0.0, 10.0, 2.0, step=0.5)
+    with dc3:
+        dry_tol    = st.slider("Dry Mass σ (%)", 0.0, 10.0, 2.0, step=0.5)
+    with dc4:
+        n_samples  = st.select_slider("Samples", [500, 1000, 2000, 5000, 10000, 20000], 2000)
+    with dc5:
+        workers    = st.number_input("Workers", 1, 64, min(64, os.cpu_count() or 1))
+
+    if st.button("▶ Run Dispersion"):
+        progress = st.progress(0.0)
+        disp_metric = st.empty()
+        disp_chart = st.empty()
+        for snap in run_dispersion(*sim_key,
+                                   thrust_tol / 100, burn_tol / 100, dry_tol / 100,
+                                   n_samples=n_samples, workers=int(workers)):
+            progress.progress(snap.done / snap.total, text=f"{snap.done:,} / {snap.total:,} samples")
+            disp_metric.metric("P(Orbit Reached)", f"{snap.p_orbit:.1%}")
+
+            fig_disp = go.Figure()
+            fig_disp.add_trace(go.Scatter(
+                x=snap.times, y=snap.p95, name="95th percentile",
+                mode="lines", line=dict(color="rgba(57,255,20,0.4)", width=1),
+                hovertemplate="t=%{x}s<br>P95=%{y:,.1f} km<extra></extra>",
+            ))
+            fig_disp.add_trace(go.Scatter(
+                x=snap.times, y=snap.p5, name="5th percentile",
+                mode="lines", line=dict(color="rgba(57,255,20,0.4)", width=1),
+                fill="tonexty", fillcolor="rgba(57,255,20,0.12)",
+                hovertemplate="t=%{x}s<br>P5=%{y:,.1f} km<extra></extra>",
+            ))
+            fig_disp.add_trace(go.Scatter(
+                x=snap.times, y=snap.p50, name="Median",
+                mode="lines", line=dict(color="#39ff14", width=2.5),
+                hovertemplate="t=%{x}s<br>Median=%{y:,.1f} km<extra></extra>",
+            ))
+            fig_disp.add_hline(y=200, line_dash="dot", line_color="#00d4ff",
+                               annotation_text="LEO Threshold (200 km)",
+                               annotation_font_color="#00d4ff",
+                               annotation_position="bottom right")
+            fig_disp.update_layout(
+                title=f"Altitude Dispersion · Median with 5–95% Band ({snap.done:,} samples)",
+                xaxis_title="Time (s)", yaxis_title="Altitude (km)",
+            )
+            disp_chart.plotly_chart(fig_disp, theme=None, width="stretch")
+        progress.empty()
+        st.caption(f"Percentiles from streaming histograms · resolution ≤ {snap.bin_width.max():,.1f} km")
+
+
+@st.fragment
+@profiled
+def simulation_tab():
     st.markdown('<div class="section-header">Launch Simulation · Altitude vs Time</div>', unsafe_allow_html=True)
 
     sc1, sc2, sc3, sc4 = st.columns(4)
@@ -491,139 +994,103 @@ with tab3:
     with sc4:
         burn_tps  = st.slider("Burn Rate (t/s)", 0.5, 5.0, 1.5, step=0.1)
 
-    # ── Physics simulation ────────────────────────────────────────────────────
-    def run_simulation(thrust_kn, fuel_t, payload_t, burn_tps):
-        thrust_n  = thrust_kn * 1000       # N
-        fuel_kg   = fuel_t   * 1000        # kg
-        payload_kg = payload_t * 1000      # kg
-        burn_kgs  = burn_tps  * 100        # kg/s
-        g = 9.81
-        dt = 2  # seconds
-
-        fuel, vel, alt = fuel_kg, 0.0, 0.0
-        dry_mass = payload_kg + 5000
-        times, alts, vels = [0], [0.0], [0.0]
-        max_alt = max_vel = burn_end = 0
-
-        for step in range(1, 1501):
-            t = step * dt
-            total_mass = dry_mass + fuel
-            if fuel > 0:
-                fuel = max(0, fuel - burn_kgs * dt)
-                if fuel == 0 and burn_end == 0:
-                    burn_end = t
-                accel = (thrust_n / total_mass) - g
-            else:
-                accel = -g
-            vel += accel * dt
-            alt += vel * dt
-            if alt < 0 and vel < 0:
-                alt = 0
-                break
-            if alt < 0:
-                alt = 0
-            max_alt = max(max_alt, alt)
-            max_vel = max(max_vel, vel)
-            if step % 5 == 0:
-                times.append(t)
-                alts.append(round(alt / 1000, 3))
-                vels.append(round(vel, 1))
-
-        return times, alts, vels, max_alt, max_vel, burn_end
-
-    times, alts, vels, max_alt, max_vel, burn_end = run_simulation(thrust_kn, fuel_t, payload_t, burn_tps)
+    integrator = st.radio("Integrator", list(INTEGRATORS), horizontal=True)
+    method = INTEGRATORS[integrator][0]
+    sim_cache = get_sim_cache()
+    sim_key = quantize_sliders(thrust_kn, fuel_t, payload_t, burn_tps)
+    st.session_state.report_simulation = (method,) + sim_key
+    notes = st.container()
+    cards = [col.empty() for col in st.columns(4)]
+    chart = st.empty()
 
     # ── Stat cards ────────────────────────────────────────────────────────────
-    m1, m2, m3, m4 = st.columns(4)
-    m1.metric("Max Altitude", f"{max_alt/1000:.1f} km")
-    m2.metric("Max Velocity", f"{max_vel:.0f} m/s")
-    m3.metric("Burn Duration", f"{burn_end:.0f} s")
-    m4.metric("Orbit Reached", "✓ YES" if max_alt > 200_000 else "✗ NO")
+    def show_cards(max_alt, max_vel, burn_end, done=True):
+        cards[0].metric("Max Altitude", f"{max_alt/1000:.1f} km")
+        cards[1].metric("Max Velocity", f"{max_vel:.0f} m/s")
+        cards[2].metric("Burn Duration", f"{burn_end:.0f} s" if burn_end or done else "burning…")
+        cards[3].metric("Orbit Reached", "✓ YES" if max_alt > ORBIT_ALT_M else "✗ NO" if done else "…")
+
+    # A run that misses the cache streams in: cards and chart repaint at most
+    # every PAINT_INTERVAL, so quick runs draw once and long ones show progress
+    # from the first interval. A slider move raises out of the next repaint,
+    # which abandons the superseded run before it reaches the cache.
+    last_paint = [time.perf_counter()]
+
+    # With an envelope table built by this integrator, the cards show its
+    # interpolated values rather than the partial run's while the chart streams.
+    envelope = get_envelope()
+    estimate = envelope.interpolate(*sim_key) if envelope is not None and envelope.method == method else None
+
+    def paint(times, alts, vels, chunk):
+        if chunk.done or time.perf_counter() - last_paint[0] < PAINT_INTERVAL:
+            return
+        if estimate:
+            show_cards(estimate["max_alt"], estimate["max_vel"], estimate["burn_end"])
+        else:
+            show_cards(*chunk[3:6], done=False)
+        show_figure(figure_json(trajectory_figure(times, alts, vels, *chunk[3:6], done=False)), chart)
+        last_paint[0] = time.perf_counter()
+
+    sim = simulate(method, *sim_key, on_chunk=paint)
+    max_alt, max_vel, burn_end = sim[3:6]
+    show_cards(max_alt, max_vel, burn_end)
 
     # ── Simulation chart ──────────────────────────────────────────────────────
-    fig_sim = make_subplots(specs=[[{"secondary_y": True}]])
-    fig_sim.add_trace(go.Scatter(
-        x=times, y=alts, name="Altitude (km)",
-        mode="lines",
-        line=dict(color="#39ff14", width=2.5),
-        fill="tozeroy", fillcolor="rgba(57,255,20,0.07)",
-        hovertemplate="t=%{x}s<br>Alt=%{y} km<extra></extra>",
-    ), secondary_y=False)
-    fig_sim.add_trace(go.Scatter(
-        x=times, y=vels, name="Velocity (m/s)",
-        mode="lines",
-        line=dict(color="#ff9500", width=1.5, dash="dot"),
-        hovertemplate="t=%{x}s<br>Vel=%{y} m/s<extra></extra>",
-    ), secondary_y=True)
+    show_figure(trajectory_chart(method, *sim_key), chart)
 
-    # Burn-end marker
-    if burn_end > 0 and burn_end < times[-1]:
-        fig_sim.add_vline(x=burn_end, line_dash="dash", line_color="#ff4d6d",
-                          annotation_text="Fuel Exhausted", annotation_font_color="#ff4d6d",
-                          annotation_position="top right")
+    with notes:
+        if method == "adaptive":
+            st.caption(f"{sim.n_steps} steps · {sim.n_evals} derivative evaluations · "
+                       f"apogee at t = {sim.apogee_t:,.1f} s · impact at t = {sim.impact_t:,.1f} s")
+        elif method == "closed":
+            with st.expander("Validate against the stepped integrators"):
+                rows = sim_cache.get_or_compute(("validate",) + sim_key, lambda: validate_closed_form(*sim_key))
+                st.dataframe(rows, hide_index=True, width="stretch")
+        elif method == "atmosphere":
+            vacuum = simulate("euler", *sim_key)
+            gained = max_alt - vacuum[3]
+            # Drag only acts in the lowest ~100 km, while gravity keeps falling off
+            # with altitude (to g₀/4 one Earth radius up), so flights that climb
+            # high coast much further than under a constant g₀.
+            why = ("gravity weakening with altitude outweighs the drag, so the coast runs higher" if gained > 0
+                   else "drag low in the atmosphere outweighs the weaker gravity higher up" if gained < 0 else "")
+            st.caption(f"Standard-atmosphere drag and inverse-square gravity from altitude tables · "
+                       f"apogee {gained / 1000:+,.1f} km and peak velocity "
+                       f"{max_vel - vacuum[4]:+,.0f} m/s against the vacuum, constant-g Euler run"
+                       + (f" · {why}" if why else ""))
 
-    # Orbit line
-    fig_sim.add_hline(y=200, line_dash="dot", line_color="#00d4ff",
-                      annotation_text="LEO Threshold (200 km)",
-                      annotation_font_color="#00d4ff",
-                      annotation_position="bottom right",
-                      secondary_y=False)
+    cache_stats = sim_cache.stats()
+    st.caption(f"Result cache · {cache_stats['entries']} entries · "
+               f"{cache_stats['hits'] + cache_stats['disk_hits']} hits / {cache_stats['misses']} misses "
+               f"({cache_stats['hit_rate']:.0%})")
 
-    fig_sim.update_layout(
-        title="Altitude & Velocity vs Time — Real-time Simulation",
-        **PLOTLY_LAYOUT,
-    )
-    fig_sim.update_yaxes(title_text="Altitude (km)", gridcolor="#0d2a5e",
-                         tickcolor="#39ff14", tickfont=dict(color="#39ff14"), secondary_y=False)
-    fig_sim.update_yaxes(title_text="Velocity (m/s)", gridcolor="rgba(0,0,0,0)",
-                         tickcolor="#ff9500", tickfont=dict(color="#ff9500"), secondary_y=True)
-    fig_sim.update_xaxes(title_text="Time (s)")
+    solver_section(sim_key, method, integrator)
+    envelope_section(payload_t, method)
+    dispersion_section(sim_key)
 
-    st.plotly_chart(fig_sim, use_container_width=True)
+with tab3:
+    if tab3.open:
+        simulation_tab()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 4 — INSIGHTS
 # ═══════════════════════════════════════════════════════════════════════════════
-with tab4:
+@st.fragment
+@profiled
+def insights_tab():
     st.markdown('<div class="section-header">Key Insights · Mission Intelligence</div>', unsafe_allow_html=True)
 
     col1, col2 = st.columns(2)
 
     with col1:
         # Avg payload by type
-        avg_payload = df_all.groupby("type")["payload"].mean().reset_index()
-        avg_payload.columns = ["type", "avg_payload"]
-        type_colors = [COLORS.get(t, "#aaa") for t in avg_payload["type"]]
-        fig7 = go.Figure(go.Bar(
-            x=avg_payload["type"], y=avg_payload["avg_payload"],
-            marker_color=type_colors, marker_line_color=type_colors, marker_line_width=2,
-            hovertemplate="<b>%{x}</b><br>Avg Payload: %{y:,.0f} kg<extra></extra>",
-        ))
-        fig7.update_layout(
-            title="Avg Payload Mass by Mission Type",
-            xaxis_title="Mission Type", yaxis_title="Avg Payload Mass (kg)",
-        )
-        apply_theme(fig7)
-        st.plotly_chart(fig7, use_container_width=True)
+        show_figure(avg_payload_chart())
 
     with col2:
         # Cost efficiency
-        rockets     = ["Falcon 9", "Atlas V", "Delta IV Heavy", "SLS", "Falcon Heavy", "Electron"]
-        efficiency  = [2780, 8500, 13000, 54500, 1900, 7500]
-        eff_colors  = ["#39ff14" if v < 4000 else "#00d4ff" if v < 10000 else "#ff4d6d" for v in efficiency]
-        fig8 = go.Figure(go.Bar(
-            x=rockets, y=efficiency,
-            marker_color=eff_colors, marker_line_color=eff_colors, marker_line_width=2,
-            hovertemplate="<b>%{x}</b><br>Cost: $%{y:,}/kg<extra></extra>",
-            text=[f"${v:,}" for v in efficiency],
-            textposition="outside", textfont=dict(color="#c8e0ff", size=10),
-        ))
-        fig8.update_layout(
-            title="Cost Efficiency Index by Rocket Family ($/kg to LEO)",
-            xaxis_title="Rocket Family", yaxis_title="Cost per kg to LEO (USD)",
-        )
-        apply_theme(fig8)
-        st.plotly_chart(fig8, use_container_width=True)
+        show_figure(cost_efficiency_chart())
+
+    distribution_section()
 
     # Insight cards
     st.markdown("---")
@@ -651,10 +1118,220 @@ with tab4:
             </div>
             """, unsafe_allow_html=True)
 
+# Nested fragment: switching the metric reruns only this chart.
+@st.fragment
+@profiled
+def distribution_section():
+    st.markdown('<div class="section-header">Distributions · Median & P90 by Type</div>', unsafe_allow_html=True)
+    view = st.radio("Distribution of", list(DISTRIBUTIONS), horizontal=True)
+    st.session_state.report_distribution = view
+    show_figure(distribution_chart(view))
+    stats = get_type_stats()
+    st.caption(f"{stats.rows:,} missions summarised chunk by chunk from mergeable partial states · means exact · "
+               f"medians and P90s from quantile sketches, within ±{stats.relative_error:.0%} of the exact value · "
+               "cost per kg skips missions with no recorded payload")
+    with st.expander("Check against exact quantiles"):
+        loaded = catalog()
+        rows = get_quantile_check(loaded.version, loaded.data, loaded.stats)
+        st.dataframe(rows, hide_index=True, width="stretch")
+        st.caption(f"Largest relative error {max((r['rel_err'] for r in rows), default=0.0):.2%}")
+
+with tab4:
+    if tab4.open:
+        insights_tab()
+
 # ── Footer status bar ─────────────────────────────────────────────────────────
 st.divider()
 fc1, fc2, fc3, fc4 = st.columns(4)
-fc1.markdown(f"**MISSIONS LOADED:** `{len(df_all)}`")
+fc1.markdown(f"**MISSIONS LOADED:** `{len(load_data())}`")
 fc2.markdown("**DATA RANGE:** `2001 – 2024`")
 fc3.markdown("**CHARTS:** `7 interactive`")
-fc4.markdown("**STATUS:** `● LIVE`")
\ No newline at end of file
+fc4.markdown("**STATUS:** `● LIVE`")
+st.session_state.catalog_version = get_catalog_version()
+
+# Sessions rerun only when they interact; while an inbox is watched, poll for
+# appended missions so open sessions pick them up without a click.
+store = get_catalog().result()
+for name, error in store.rejected.items():
+    st.warning(f"Skipped {name} from the mission inbox · {error}")
+
+@st.fragment(run_every=store.poll_seconds)
+@profiled
+def watch_catalog():
+    if get_catalog_version() != st.session_state.get("catalog_version"):
+        st.rerun()
+
+if store.inbox:
+    watch_catalog()
+
+# ── Report export ─────────────────────────────────────────────────────────────
+@st.cache_resource
+def get_report_jobs():
+    # Report jobs from every session share these threads, so an export never
+    # runs on a script thread and a burst of them queues instead of piling up.
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="report")
+
+@st.cache_resource
+def get_report_pool():
+    # Figures render to HTML or PNG and tables to CSV in a child process, where
+    # large exports cannot hold the GIL other sessions' reruns need.
+    return ProcessPoolExecutor(max_workers=max(1, min(2, (os.cpu_count() or 1) - 1)))
+
+def report_contents(mission_type, year_max, simulation, replay_method, distribution):
+    # Callables over the memoized builders, resolved on the job thread: charts
+    # the session has already drawn are figure cache lookups.
+    method, *sim_key = simulation
+    figures = [
+        ("payload_fuel", lambda: payload_fuel_chart(mission_type, year_max)),
+        ("cost_success", lambda: cost_success_chart(mission_type, year_max)),
+        ("duration_distance", lambda: duration_distance_chart(mission_type, year_max)),
+        ("crew_success", crew_success_chart),
+        ("yield_cost", yield_cost_chart),
+        ("outcomes", outcomes_chart),
+        ("trajectory", lambda: trajectory_chart(method, *sim_key)),
+        ("avg_payload", avg_payload_chart),
+        ("cost_efficiency", cost_efficiency_chart),
+        ("distribution", lambda: distribution_chart(distribution)),
+    ]
+    if replay_method:
+        figures.insert(3, ("replay", lambda: replay_chart(mission_type, year_max, replay_method)))
+    if get_envelope() is not None:
+        figures.append(("envelope", lambda: envelope_chart(sim_key[2])))
+
+    def trajectory():
+        import pandas as pd
+
+        times, alts, vels = simulate(method, *sim_key)[:3]
+        return pd.DataFrame({"time_s": times, "altitude_km": alts, "velocity_ms": vels})
+
+    tables = [("missions", lambda: get_mission_index().select(mission_type, year_max)), ("trajectory", trajectory)]
+    max_alt, max_vel, burn_end = simulate(method, *sim_key)[3:6]
+    meta = {
+        "mission type": mission_type, "max year": year_max,
+        "missions": len(get_mission_index().select(mission_type, year_max)),
+        "integrator": method, "thrust kN": sim_key[0], "fuel t": sim_key[1],
+        "payload t": sim_key[2], "burn rate t/s": sim_key[3],
+        "max altitude km": round(max_alt / 1000, 1), "max velocity m/s": round(max_vel),
+        "burn duration s": round(burn_end), "replay model": replay_method or "off",
+        "catalog version": get_catalog_version(),
+    }
+    return figures, tables, meta
+
+def _build_report(fmt, state, progress):
+    # Runs without the session's script context, so a rerun or a closed tab in
+    # that session cannot interrupt it; the builders only touch shared caches.
+    def update(done, total, label):
+        progress[:] = done, total, label
+
+    with timed(f"report.{fmt}"):
+        figures, tables, meta = report_contents(*state)
+        try:
+            return build_report("Rocket Launch Report", figures, tables, fmt, meta,
+                                executor=get_report_pool(), progress=update)
+        except BrokenProcessPool:
+            get_report_pool.clear()  # a fresh pool for the next export
+            raise
+
+def submit_report(fmt):
+    # Filter state as last seen in each tab, or the defaults of one never opened.
+    state = (
+        *st.session_state.get("report_filters", ("All", 2024)),
+        st.session_state.get("report_simulation", ("euler",) + quantize_sliders(3500, 200, 20, 1.5)),
+        st.session_state.get("report_replay"),
+        st.session_state.get("report_distribution", "Payload"),
+    )
+    progress = [0, 0, "queued"]
+    return get_report_jobs().submit(_build_report, fmt, state, progress), progress
+
+def export_section():
+    with st.expander("⇩ EXPORT REPORT", expanded="report_job" in st.session_state):
+        ec1, ec2 = st.columns([3, 1])
+        with ec1:
+            fmt = st.radio("Report format", list(REPORT_FORMATS), format_func=lambda f: REPORT_FORMATS[f][0],
+                           horizontal=True)
+        with ec2:
+            if st.button("▶ Build Report"):
+                st.session_state.report_job = submit_report(fmt)
+                st.rerun()  # re-register this section with polling while the job runs
+        st.caption("Every chart and the simulation run at the current filters and sliders · built in the "
+                   "background, so the dashboard stays usable · the data bundle adds the filtered missions "
+                   "and the trajectory as CSV")
+
+        job = st.session_state.get("report_job")
+        if job is None:
+            return
+        future, progress = job
+        if not future.done():
+            done, total, label = progress
+            st.progress(done / total if total else 0.0, text=f"Building the report · {label}")
+            return
+        if not st.session_state.get("report_polled", True):
+            st.session_state.report_polled = True
+            st.rerun()  # stop polling
+        if future.exception() is not None:
+            st.error(f"Report failed · {future.exception()}")
+            return
+        report = future.result()
+        st.download_button(f"⇩ {report.file_name} · {len(report.data) / 2**20:,.1f} MB", report.data,
+                           file_name=report.file_name, mime=report.mime, on_click="ignore")
+        st.caption(f"Built in {report.seconds:.1f} s")
+
+# Sessions poll a running job from the browser, one short fragment run per tick,
+# so waiting on a large export never holds this session's script thread.
+report_job = st.session_state.get("report_job")
+report_running = report_job is not None and not report_job[0].done()
+st.session_state.report_polled = not report_running
+st.fragment(profiled(export_section), run_every=0.5 if report_running else None)()
+
+# ── Diagnostics ───────────────────────────────────────────────────────────────
+def cache_stats():
+    filters = get_mission_index().select.cache_info()
+    lookups = filters.hits + filters.misses
+    return {
+        "simulation": get_sim_cache().stats(),
+        "figures":    get_figure_cache().stats(),
+        "filters":    dict(entries=filters.currsize, hits=filters.hits, misses=filters.misses,
+                           hit_rate=filters.hits / lookups if lookups else 0.0),
+    }
+
+if profiler.enabled:
+    rerun_seconds = time.perf_counter() - _run_started
+    rerun_sections = profiler.end_rerun(rerun_seconds)
+    caches = cache_stats()
+    if profiler.path:
+        profiler.write(caches)
+    with st.expander(f"⚙ DIAGNOSTICS · rerun {rerun_seconds * 1000:,.0f} ms"):
+        active, seen = profiler.sessions()
+        st.caption(f"{active} active sessions · {seen} seen · {profiler.reruns} full reruns in this process · "
+                   "section times include nested sections")
+        st.dataframe([dict(section=s.name, calls=s.calls, ms=round(s.seconds * 1000, 2),
+                           alloc_kb=round(s.alloc_bytes / 1024, 1), peak_kb=round(s.peak_bytes / 1024, 1))
+                      for s in rerun_sections], hide_index=True, width="stretch")
+        fragment_reruns = profiler.fragment_reruns(getattr(get_script_run_ctx(), "session_id", None))
+        if fragment_reruns:
+            st.caption("Latest rerun of each tab or panel on its own in this session")
+            st.dataframe([dict(fragment=f.name, ms=round(f.seconds * 1000, 2),
+                               slowest=" · ".join(f"{s.name} {s.seconds * 1000:,.1f} ms" for s in f.sections[:3]))
+                          for f in fragment_reruns], hide_index=True, width="stretch")
+        st.dataframe([dict(cache=name, entries=c["entries"], hits=c["hits"] + c.get("disk_hits", 0),
+                           misses=c["misses"], hit_rate=f"{c['hit_rate']:.0%}")
+                      for name, c in caches.items()], hide_index=True, width="stretch")
+        st.download_button("Download metrics (JSON)", json.dumps(profiler.snapshot(caches), indent=1),
+                           file_name="rocket-metrics.json", mime="application/json")
+
+# ── Startup report ────────────────────────────────────────────────────────────
+@st.cache_resource
+def get_startup_report():
+    # Filled by the first complete run in this process and logged once, so cold
+    # starts of autoscaled replicas can be compared.
+    return {}
+
+startup = get_startup_report()
+if not startup:
+    startup.update({
+        "imports":      _imports_done - _run_started,
+        "first paint":  _first_paint - _run_started,
+        "data load":    catalog().seconds,
+        "first render": time.perf_counter() - _run_started,
+    })
+    log.info("startup · %s", " · ".join(f"{phase} {seconds:.2f} s" for phase, seconds in startup.items()))
\ No newline at end of file
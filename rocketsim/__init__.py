@@ -0,0 +1,144 @@
+"""Physics and analytics behind the Rocket Launch Path Visualisation app.
+
+Submodules are imported on first attribute access, so `import rocketsim.simulation`
+does not pay for pandas and a cold app process only loads what it renders.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "aggregates": ("COST_BUCKETS", "CREW_GROUPS", "SUMMARY_METRICS", "MissionCube", "QuantileSketch", "TypeStats",
+                   "check_quantiles"),
+    "atmosphere": ("standard_density",),
+    "batch": ("BatchSummary", "evaluate_configs", "read_configs", "run_batch"),
+    "bench": ("BenchResult", "run_benchmarks"),
+    "cache": ("ResultCache", "code_version", "quantize_sliders"),
+    "dispersion": ("DispersionSnapshot", "StreamingHistogram", "run_dispersion"),
+    "envelope": ("Envelope", "build_envelope", "flight_metrics"),
+    "loadtest": ("run_load_test",),
+    "missions": (
+        "COST_PER_KG_TO_LEO",
+        "MISSION_SCHEMA",
+        "Catalog",
+        "CatalogStore",
+        "MissionIndex",
+        "append_catalog",
+        "catalog_fingerprint",
+        "iter_missions",
+        "load_catalog",
+        "load_missions",
+        "scan_type_stats",
+        "synthetic_missions",
+        "write_missions",
+    ),
+    "profiling": ("FragmentRerun", "Profiler", "SectionStats"),
+    "replay": ("REPLAY_COLUMNS", "mission_configs", "replay_missions"),
+    "report": ("REPORT_FORMATS", "Report", "build_report"),
+    "simulation": (
+        "CHUNK_SAMPLES",
+        "MAX_STEPS",
+        "ORBIT_ALT_M",
+        "AdaptiveResult",
+        "BatchResult",
+        "ClosedFormMetrics",
+        "ClosedFormResult",
+        "TrajectoryChunk",
+        "closed_form_metrics",
+        "closed_form_state",
+        "collect_trajectory",
+        "run_simulation",
+        "run_simulation_adaptive",
+        "run_simulation_atmospheric",
+        "run_simulation_batch",
+        "run_simulation_closed_form",
+        "stream_simulation",
+        "stream_simulation_atmospheric",
+        "validate_closed_form",
+    ),
+    "solver": ("SolveResult", "solve_parameter"),
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__ = [
+    "CHUNK_SAMPLES",
+    "COST_BUCKETS",
+    "COST_PER_KG_TO_LEO",
+    "CREW_GROUPS",
+    "MAX_STEPS",
+    "MISSION_SCHEMA",
+    "ORBIT_ALT_M",
+    "REPLAY_COLUMNS",
+    "REPORT_FORMATS",
+    "SUMMARY_METRICS",
+    "AdaptiveResult",
+    "BatchResult",
+    "BatchSummary",
+    "BenchResult",
+    "Catalog",
+    "CatalogStore",
+    "ClosedFormMetrics",
+    "ClosedFormResult",
+    "DispersionSnapshot",
+    "Envelope",
+    "FragmentRerun",
+    "MissionCube",
+    "MissionIndex",
+    "Profiler",
+    "QuantileSketch",
+    "Report",
+    "ResultCache",
+    "SectionStats",
+    "SolveResult",
+    "StreamingHistogram",
+    "TrajectoryChunk",
+    "TypeStats",
+    "append_catalog",
+    "build_envelope",
+    "build_report",
+    "catalog_fingerprint",
+    "check_quantiles",
+    "closed_form_metrics",
+    "closed_form_state",
+    "code_version",
+    "collect_trajectory",
+    "evaluate_configs",
+    "flight_metrics",
+    "iter_missions",
+    "load_catalog",
+    "load_missions",
+    "mission_configs",
+    "quantize_sliders",
+    "read_configs",
+    "replay_missions",
+    "run_batch",
+    "run_benchmarks",
+    "run_dispersion",
+    "run_load_test",
+    "run_simulation",
+    "run_simulation_adaptive",
+    "run_simulation_atmospheric",
+    "run_simulation_batch",
+    "run_simulation_closed_form",
+    "scan_type_stats",
+    "solve_parameter",
+    "standard_density",
+    "stream_simulation",
+    "stream_simulation_atmospheric",
+    "synthetic_missions",
+    "validate_closed_form",
+    "write_missions",
+]
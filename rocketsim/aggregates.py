@@ -0,0 +1,283 @@
+"""Mission aggregation cube behind the bar charts."""
+
+import numpy as np
+import pandas as pd
+
+COST_BUCKETS = [
+    ("$0–100M",   0,    100),
+    ("$100–300M", 100,  300),
+    ("$300–800M", 300,  800),
+    ("$800M–2B",  800,  2000),
+    (">$2B",      2000, 1e9),
+]
+CREW_GROUPS = {"0 (Unmanned)": (0, 0), "1–2": (1, 2), "3–5": (3, 5), "6+": (6, 99)}
+
+
+def _rate(successes, counts):
+    return [round(int(s) / int(n) * 100, 1) if n else 0 for s, n in zip(successes, counts)]
+
+
+def _bin(values, edges, closed_right):
+    # Bucket index per row, -1 where a value falls outside every bucket.
+    lo, hi = edges
+    idx = np.full(len(values), -1, dtype=np.int64)
+    for i, (a, b) in enumerate(zip(lo, hi)):
+        inside = (values >= a) & ((values <= b) if closed_right else (values < b))
+        idx[inside & (idx < 0)] = i
+    return idx
+
+
+class MissionCube:
+    """Mission counts and successes per (type, year, cost bucket, crew group).
+
+    Built once per dataset load in a single pass over the frame. The year
+    axis is stored as a running total, so "year <= year_max" views are one
+    index lookup and every chart is answered from a few hundred cells
+    instead of rescanning the catalog.
+    """
+
+    def __init__(self, df):
+        # Types in order of first appearance, as the charts list them.
+        self.types = pd.unique(df["type"].astype(str)).tolist()
+        self.years = np.unique(df["year"].to_numpy())
+        self.cost_labels = [label for label, _, _ in COST_BUCKETS]
+        self.crew_labels = list(CREW_GROUPS)
+        self.counts, self.successes, self.payload_sums = self._tally(df)
+
+    def _tally(self, df):
+        # (counts, successes, payload sums) of `df` on this cube's axes, cumulative over years.
+        t = pd.Categorical(df["type"].astype(str), categories=self.types).codes.astype(np.int64)
+        y = np.searchsorted(self.years, df["year"].to_numpy())
+        c = _bin(df["cost"].to_numpy(), ([lo for _, lo, _ in COST_BUCKETS], [hi for _, _, hi in COST_BUCKETS]), False)
+        k = _bin(df["crew"].to_numpy(), ([lo for lo, _ in CREW_GROUPS.values()], [hi for _, hi in CREW_GROUPS.values()]), True)
+
+        shape = (len(self.types), len(self.years), len(COST_BUCKETS) + 1, len(CREW_GROUPS) + 1)
+        # Out-of-bucket rows land in the trailing "other" slot of each axis.
+        flat = np.ravel_multi_index((t, y, np.where(c < 0, shape[2] - 1, c), np.where(k < 0, shape[3] - 1, k)), shape)
+        success = df["success"].to_numpy(dtype=bool)
+        size = int(np.prod(shape))
+        counts = np.bincount(flat, minlength=size).reshape(shape).cumsum(axis=1)
+        successes = np.bincount(flat[success], minlength=size).reshape(shape).cumsum(axis=1)
+        # Payload totals per (type, year) for the per-type averages.
+        payload_sums = np.bincount(
+            t * len(self.years) + y, weights=df["payload"].to_numpy(dtype=float), minlength=shape[0] * shape[1],
+        ).reshape(shape[:2]).cumsum(axis=1)
+        return counts, successes, payload_sums
+
+    def append(self, df):
+        """A new cube with the missions in `df` added to these cells.
+
+        Only the new rows are binned; new types and years extend the axes.
+        The cube is left untouched, so sessions reading it never see a
+        half-applied update.
+        """
+        cube = object.__new__(MissionCube)
+        cube.types = self.types + [t for t in pd.unique(df["type"].astype(str)).tolist() if t not in self.types]
+        cube.years = np.union1d(self.years, df["year"].to_numpy())
+        cube.cost_labels, cube.crew_labels = self.cost_labels, self.crew_labels
+        # Cumulative value of each new year on the old axis: that of the latest old year at or before it.
+        take = np.searchsorted(self.years, cube.years, side="right")
+        grown = []
+        for old in (self.counts, self.successes, self.payload_sums):
+            padded = np.concatenate([np.zeros_like(old[:, :1]), old], axis=1)[:, take]
+            extra = np.zeros((len(cube.types) - len(self.types),) + padded.shape[1:], dtype=old.dtype)
+            grown.append(np.concatenate([padded, extra]))
+        cube.counts, cube.successes, cube.payload_sums = (a + d for a, d in zip(grown, cube._tally(df)))
+        return cube
+
+    def _year_slice(self, cube, year_max):
+        yi = len(self.years) - 1 if year_max is None else int(np.searchsorted(self.years, year_max, side="right")) - 1
+        return cube[:, yi] if yi >= 0 else np.zeros_like(cube[:, 0])
+
+    def _select(self, cube, mission_type=None, year_max=None):
+        sliced = self._year_slice(cube, year_max)
+        if mission_type is None or mission_type == "All":
+            return sliced.sum(axis=0)
+        if mission_type not in self.types:
+            return np.zeros_like(sliced[0])
+        return sliced[self.types.index(mission_type)]
+
+    @property
+    def total(self):
+        return int(self.counts[:, -1].sum())
+
+    def cost_bucket_rates(self, mission_type=None, year_max=None):
+        """(labels, success rates %, counts) per cost bucket."""
+        n = self._select(self.counts, mission_type, year_max).sum(axis=1)[:-1]
+        s = self._select(self.successes, mission_type, year_max).sum(axis=1)[:-1]
+        return self.cost_labels, _rate(s, n), n.tolist()
+
+    def crew_rates(self, mission_type=None, year_max=None):
+        """(labels, success rates %, counts) per crew group."""
+        n = self._select(self.counts, mission_type, year_max).sum(axis=0)[:-1]
+        s = self._select(self.successes, mission_type, year_max).sum(axis=0)[:-1]
+        return self.crew_labels, _rate(s, n), n.tolist()
+
+    def mean_payload_by_type(self, year_max=None):
+        """(types, mean payload kg) for every type with missions, types sorted by name."""
+        n = self._year_slice(self.counts, year_max).sum(axis=(1, 2))
+        total = self._year_slice(self.payload_sums, year_max)
+        types = [t for t in sorted(self.types) if n[self.types.index(t)]]
+        return types, [float(total[self.types.index(t)] / n[self.types.index(t)]) for t in types]
+
+    def outcomes_by_type(self, year_max=None):
+        """(types, success counts, failure counts)."""
+        n = self._year_slice(self.counts, year_max).sum(axis=(1, 2))
+        s = self._year_slice(self.successes, year_max).sum(axis=(1, 2))
+        return self.types, s.tolist(), (n - s).tolist()
+
+
+# ── Distribution summaries ────────────────────────────────────────────────────
+# Metric -> unit of the per-type median/p90 views; cost per kg is derived per mission.
+SUMMARY_METRICS = {"payload": "kg", "cost": "$M", "cost_per_kg": "$/kg"}
+SUMMARY_COLUMNS = ["type", "payload", "cost"]
+
+
+class QuantileSketch:
+    """Per-row quantile sketches of non-negative values with a fixed relative error.
+
+    Values fall into geometric buckets ``(γ^(k-1), γ^k]`` with ``γ = (1 + α) /
+    (1 - α)`` and each bucket answers with the one value within `α` of
+    everything it holds, so quantiles are within `relative_error` of the
+    exact ones at any scale. Unlike `StreamingHistogram`, whose range fits
+    its first chunk, the grid is fixed by `min_value` and `max_value`:
+    sketches of separate chunks merge by adding counts, and memory is
+    ``rows × buckets`` counts (about 1,700 buckets at 1 % over 1e-3..1e12).
+    Values at or below `min_value` count as zero; values above `max_value`
+    clamp to it.
+    """
+
+    def __init__(self, rows, relative_error=0.01, min_value=1e-3, max_value=1e12):
+        self.relative_error = relative_error
+        self.min_value, self.max_value = min_value, max_value
+        self.gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = np.log(self.gamma)
+        self.offset = int(np.floor(np.log(min_value) / self._log_gamma))
+        # Column 0 holds the zeros, column i the bucket with upper edge γ^(offset + i).
+        size = int(np.ceil(np.log(max_value) / self._log_gamma)) - self.offset + 1
+        self.counts = np.zeros((rows, size), dtype=np.int64)
+
+    @property
+    def n(self):
+        return self.counts.sum(axis=1)
+
+    def add(self, rows, values):
+        """Count `values` (NaN skipped) into the sketches of `rows`."""
+        rows = np.asarray(rows, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        keep = ~np.isnan(values)
+        rows, values = rows[keep], values[keep]
+        idx = np.zeros(len(values), dtype=np.int64)
+        positive = values > self.min_value
+        k = np.ceil(np.log(np.minimum(values[positive], self.max_value)) / self._log_gamma)
+        idx[positive] = np.clip(k.astype(np.int64) - self.offset, 1, self.counts.shape[1] - 1)
+        flat = rows * self.counts.shape[1] + idx
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+
+    def compatible(self, other):
+        return (self.relative_error, self.min_value, self.max_value) == \
+            (other.relative_error, other.min_value, other.max_value)
+
+    def _value_at_rank(self, cum, rank):
+        # Bucket value of the item at 0-based `rank` in each row.
+        j = np.minimum((cum <= rank[:, None]).sum(axis=1), self.counts.shape[1] - 1)
+        return np.where(j > 0, 2 * self.gamma ** (j + self.offset) / (self.gamma + 1), 0.0)
+
+    def quantile(self, q):
+        """Per-row quantile, interpolated between ranks as `np.quantile` does; NaN for empty rows.
+
+        Both neighbouring ranks are within `relative_error` of their exact
+        values, so the interpolation is too, however few values a row has.
+        """
+        cum = np.cumsum(self.counts, axis=1)
+        n = cum[:, -1]
+        rank = q * np.maximum(n - 1, 0)
+        lo, hi = np.floor(rank), np.ceil(rank)
+        below, above = self._value_at_rank(cum, lo), self._value_at_rank(cum, hi)
+        value = below + (above - below) * (rank - lo)
+        return np.where(n > 0, value, np.nan)
+
+
+def _summary_values(df):
+    # Metric -> float array per mission; cost per kg is NaN without a payload.
+    payload = df["payload"].to_numpy(dtype=float)
+    cost = df["cost"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per_kg = np.where(payload > 0, cost * 1e6 / payload, np.nan)
+    return {"payload": payload, "cost": cost, "cost_per_kg": per_kg}
+
+
+class TypeStats:
+    """Count, sum and quantile sketch of each `SUMMARY_METRICS` value per mission type.
+
+    The partial state of one chunk of missions: states of separate chunks
+    merge exactly for counts and sums and within the sketches' relative
+    error for quantiles, so a catalog of any size is summarised one bounded
+    chunk at a time.
+    """
+
+    def __init__(self, types=(), relative_error=0.01):
+        self.types = list(types)
+        self.relative_error = relative_error
+        self.rows = 0       # missions folded in
+        self.chunks = 0
+        self.sums = {m: np.zeros(len(self.types)) for m in SUMMARY_METRICS}
+        self.sketches = {m: QuantileSketch(len(self.types), relative_error) for m in SUMMARY_METRICS}
+
+    @classmethod
+    def from_frame(cls, df, relative_error=0.01):
+        """The state of one chunk; missions with missing or negative values skip that metric."""
+        # Factorizing the categorical codes avoids casting a million labels to str.
+        t, types = pd.factorize(df["type"])
+        stats = cls([str(v) for v in types], relative_error)
+        t = t.astype(np.int64)
+        for metric, values in _summary_values(df).items():
+            ok = np.isfinite(values) & (values >= 0) & (t >= 0)
+            stats.sums[metric] += np.bincount(t[ok], weights=values[ok], minlength=len(stats.types))
+            stats.sketches[metric].add(t[ok], values[ok])
+        stats.rows, stats.chunks = len(df), 1
+        return stats
+
+    def merge(self, other):
+        """A new state holding both; types new to this one are appended in order."""
+        if not self.sketches["payload"].compatible(other.sketches["payload"]):
+            raise ValueError("cannot merge type stats built with different sketch accuracy")
+        merged = TypeStats(self.types + [t for t in other.types if t not in self.types], self.relative_error)
+        for part in (self, other):
+            pos = np.array([merged.types.index(t) for t in part.types], dtype=np.int64)
+            for m in SUMMARY_METRICS:
+                merged.sums[m][pos] += part.sums[m]
+                merged.sketches[m].counts[pos] += part.sketches[m].counts
+        merged.rows, merged.chunks = self.rows + other.rows, self.chunks + other.chunks
+        return merged
+
+    def summary(self, metric):
+        """(types, counts, means, medians, p90s) of `metric` for every type with values, types sorted by name."""
+        sketch = self.sketches[metric]
+        n = sketch.n
+        keep = [self.types.index(t) for t in sorted(self.types) if n[self.types.index(t)]]
+        median, p90 = sketch.quantile(0.5)[keep], sketch.quantile(0.9)[keep]
+        return ([self.types[i] for i in keep], n[keep].tolist(), (self.sums[metric][keep] / n[keep]).tolist(),
+                median.tolist(), p90.tolist())
+
+
+def check_quantiles(df, stats, quantiles=(0.5, 0.9)):
+    """Rows comparing `stats`' sketched quantiles of `df` with `np.quantile` on the same missions.
+
+    One row per (type, metric, quantile) with both values and the relative
+    error, which should stay within the sketches' `relative_error`.
+    """
+    types = df["type"].astype(str).to_numpy()
+    rows = []
+    for metric, values in _summary_values(df).items():
+        ok = np.isfinite(values) & (values >= 0)
+        sketched = {q: dict(zip(stats.types, stats.sketches[metric].quantile(q))) for q in quantiles}
+        for t in sorted(stats.types):
+            group = values[ok & (types == t)]
+            if not len(group):
+                continue
+            for q in quantiles:
+                exact, approx = float(np.quantile(group, q)), float(sketched[q][t])
+                rows.append(dict(type=t, metric=metric, quantile=q, sketch=approx, exact=exact,
+                                 rel_err=abs(approx - exact) / exact if exact else float(approx != exact)))
+    return rows
@@ -0,0 +1,102 @@
+"""Altitude lookup tables for the drag-and-gravity launch model.
+
+Density follows the U.S. Standard Atmosphere 1976: seven temperature layers
+integrated hydrostatically up to 86 km, then its tabulated thermosphere.
+Gravity follows the inverse-square law. Evaluating either per step would
+cost more than the dynamics, so both are tabulated once on a uniform
+altitude grid and the integrator reads a row and interpolates. Above
+`TABLE_TOP_M` the air is taken as vacuum and gravity is computed directly.
+"""
+
+import numpy as np
+
+from rocketsim.simulation import G0
+
+EARTH_RADIUS_M = 6_371_000
+DRAG_CD = 0.5           # drag coefficient of the reference vehicle
+REF_AREA_M2 = 10.5      # cross-section of a ~3.7 m diameter core stage
+
+# Lower atmosphere: (base geopotential altitude m, base temperature K, lapse K/m).
+_LAYERS = (
+    (0,      288.15, -0.0065),
+    (11_000, 216.65,  0.0),
+    (20_000, 216.65,  0.001),
+    (32_000, 228.65,  0.0028),
+    (47_000, 270.65,  0.0),
+    (51_000, 270.65, -0.0028),
+    (71_000, 214.65, -0.002),
+)
+_P0 = 101_325.0         # Pa, sea level
+_R_AIR = 287.053        # J/(kg·K)
+_LOWER_TOP_M = 86_000   # geometric
+# Thermosphere density (geometric altitude m, kg/m³), interpolated log-linearly.
+_UPPER = (
+    (86_000, 6.958e-6), (100_000, 5.604e-7), (110_000, 9.708e-8), (120_000, 2.222e-8),
+    (130_000, 8.152e-9), (150_000, 2.076e-9), (200_000, 2.541e-10), (300_000, 1.916e-11),
+    (400_000, 2.803e-12), (500_000, 5.215e-13), (600_000, 1.137e-13), (700_000, 3.070e-14),
+    (800_000, 1.136e-14), (900_000, 5.759e-15), (1_000_000, 3.561e-15),
+)
+
+
+def inverse_square_gravity(alt_m):
+    return G0 * (EARTH_RADIUS_M / (EARTH_RADIUS_M + alt_m)) ** 2
+
+
+def _layer_state(dh, tb, lapse):
+    # Temperature and pressure ratio `dh` metres (geopotential) above a layer base.
+    if lapse:
+        t = tb + lapse * dh
+        return t, (tb / t) ** (G0 / (_R_AIR * lapse))
+    return np.full_like(dh, tb), np.exp(-G0 * dh / (_R_AIR * tb))
+
+
+def standard_density(alt_m):
+    """U.S. Standard Atmosphere 1976 density (kg/m³) at geometric altitudes in m, computed directly."""
+    z = np.asarray(alt_m, dtype=float)
+    h = EARTH_RADIUS_M * z / (EARTH_RADIUS_M + z)   # geopotential
+    lower_top = EARTH_RADIUS_M * _LOWER_TOP_M / (EARTH_RADIUS_M + _LOWER_TOP_M)
+    pressure = np.full(z.shape, _P0)
+    temperature = np.full(z.shape, _LAYERS[0][1])
+    p_base = _P0
+    for (hb, tb, lapse), top in zip(_LAYERS, [layer[0] for layer in _LAYERS[1:]] + [lower_top]):
+        in_layer = (h >= hb) & (h < top)
+        temperature[in_layer], ratio = _layer_state(h[in_layer] - hb, tb, lapse)
+        pressure[in_layer] = p_base * ratio
+        p_base *= _layer_state(np.array(top - hb, dtype=float), tb, lapse)[1]
+    rho = pressure / (_R_AIR * temperature)
+    upper_z, upper_rho = (np.array(c, dtype=float) for c in zip(*_UPPER))
+    log_upper = np.interp(z, upper_z, np.log(upper_rho), right=np.nan)
+    beyond = z > upper_z[-1]  # extend the last log-linear segment
+    slope = (np.log(upper_rho[-1]) - np.log(upper_rho[-2])) / (upper_z[-1] - upper_z[-2])
+    log_upper[beyond] = np.log(upper_rho[-1]) + slope * (z[beyond] - upper_z[-1])
+    return np.where(z < _LOWER_TOP_M, rho, np.exp(log_upper))
+
+
+ALT_STEP_M = 100
+TABLE_TOP_M = 2_000_000
+
+ALTITUDES = np.arange(0, TABLE_TOP_M + ALT_STEP_M, ALT_STEP_M, dtype=float)
+DENSITY = standard_density(ALTITUDES)
+GRAVITY = inverse_square_gravity(ALTITUDES)
+
+
+def _rows(values):
+    # (value, slope per grid step) as Python floats: list indexing is the
+    # cheapest lookup from the scalar integrator loop.
+    slope = np.append(np.diff(values), 0.0)
+    return values.tolist(), slope.tolist()
+
+
+DENSITY_ROWS = _rows(DENSITY)
+GRAVITY_ROWS = _rows(GRAVITY)
+
+
+def density(alt_m):
+    """Air density (kg/m³) at altitudes in m, interpolated from the table; 0 above it."""
+    return np.interp(alt_m, ALTITUDES, DENSITY, left=DENSITY[0], right=0.0)
+
+
+def gravity(alt_m):
+    """Gravitational acceleration (m/s²) at altitudes in m, from the table where it applies."""
+    alt_m = np.asarray(alt_m, dtype=float)
+    return np.where(alt_m <= TABLE_TOP_M, np.interp(alt_m, ALTITUDES, GRAVITY), inverse_square_gravity(alt_m))
@@ -0,0 +1,143 @@
+"""Headless batch evaluation of launch configurations.
+
+Streams a CSV or Parquet file of configurations through the engine in
+chunks and appends each chunk's results to the output as it goes, so
+memory stays bounded by the chunk size however long the file is:
+
+    python -m rocketsim.batch configs.parquet --out results.parquet
+    python -m rocketsim.batch configs.csv --out results.csv --method euler --chunk-size 50000
+
+Input needs the slider columns `thrust_kn`, `fuel_t`, `payload_t` and
+`burn_tps`; any other columns (an id, say) are passed through.
+"""
+
+import argparse
+import os
+import time
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from rocketsim.envelope import AXES, METRICS, flight_metrics
+
+CONFIG_COLUMNS = AXES
+BATCH_FORMATS = {".csv": "csv", ".parquet": "parquet", ".pq": "parquet"}
+
+
+class BatchSummary(NamedTuple):
+    rows: int
+    chunks: int
+    orbit: int          # configurations whose apogee clears ORBIT_ALT_M
+    seconds: float
+
+
+def _format(path):
+    fmt = BATCH_FORMATS.get(os.path.splitext(str(path))[1].lower())
+    if fmt is None:
+        raise ValueError(f"unsupported batch file {path!r}, expected one of {sorted(BATCH_FORMATS)}")
+    return fmt
+
+
+def read_configs(source, chunk_size=100_000):
+    """Yield frames of at most `chunk_size` configurations from a CSV or Parquet file."""
+    if _format(source) == "csv":
+        yield from pd.read_csv(source, chunksize=chunk_size)
+        return
+    import pyarrow.parquet as pq
+
+    for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+        yield batch.to_pandas()
+
+
+def evaluate_configs(df, method="closed"):
+    """`df` with the `METRICS` columns appended, computed in one vectorized pass."""
+    missing = [c for c in CONFIG_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"configuration file is missing columns {missing}")
+    values = flight_metrics(method, *(df[c].to_numpy(dtype=float) for c in CONFIG_COLUMNS))
+    out = df.copy()
+    for i, name in enumerate(METRICS):
+        out[name] = values[:, i]
+    out["orbit"] = out["orbit"].astype(bool)
+    return out
+
+
+class _ChunkWriter:
+    """Appends frames to a CSV or Parquet file, header/schema from the first one."""
+
+    def __init__(self, path, fmt):
+        self.path = path
+        self.fmt = fmt
+        self._parquet = None
+        self._started = False
+
+    def write(self, df):
+        if self.fmt == "csv":
+            df.to_csv(self.path, mode="a" if self._started else "w", header=not self._started, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table)
+        self._started = True
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def run_batch(source, out, method="closed", chunk_size=100_000, progress=None):
+    """Evaluate every configuration in `source` and write the results to `out`.
+
+    Chunks are written as soon as they are computed to a ``.partial`` file
+    next to `out`, which replaces `out` only once the whole input is done,
+    so readers never see a half-written result. `progress(rows_done)` is
+    called after each chunk.
+    """
+    partial = f"{out}.partial"
+    writer = _ChunkWriter(partial, _format(out))
+    rows = chunks = orbit = 0
+    start = time.perf_counter()
+    try:
+        for df in read_configs(source, chunk_size):
+            result = evaluate_configs(df, method)
+            writer.write(result)
+            rows += len(result)
+            chunks += 1
+            orbit += int(np.count_nonzero(result["orbit"]))
+            if progress:
+                progress(rows)
+        if not chunks:  # an empty input still gets a file with the result columns
+            writer.write(evaluate_configs(pd.DataFrame(columns=list(CONFIG_COLUMNS)), method))
+    except BaseException:
+        writer.close()
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    writer.close()
+    os.replace(partial, out)
+    return BatchSummary(rows, chunks, orbit, round(time.perf_counter() - start, 2))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m rocketsim.batch", description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="CSV or Parquet file of launch configurations")
+    parser.add_argument("--out", required=True, help="CSV or Parquet file for the results")
+    parser.add_argument("--method", choices=["closed", "euler"], default="closed")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    def progress(rows):
+        print(f"\r{rows:,} configurations", end="", flush=True)
+
+    summary = run_batch(args.source, args.out, args.method, args.chunk_size, progress)
+    print(f"\nwrote {args.out} ({summary.rows:,} rows, {summary.orbit:,} reach orbit, {args.method}) "
+          f"in {summary.seconds} s")
+
+
+if __name__ == "__main__":
+    main()
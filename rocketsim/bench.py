@@ -0,0 +1,329 @@
+"""Benchmarks for the simulation, data load, aggregations and figure construction.
+
+Every case runs against synthetic catalogs scaled from tens of rows to
+millions, and the timings and peak memory are written as JSON so two
+commits can be compared:
+
+    python -m rocketsim.bench run --out bench.json
+    python -m rocketsim.bench run --sizes 50 1000000 5000000 --cases load overview --out big.json
+    python -m rocketsim.bench compare base.json bench.json --threshold 1.2
+"""
+
+import argparse
+import functools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import NamedTuple
+
+import numpy as np
+
+from rocketsim.simulation import (
+    closed_form_metrics,
+    run_simulation,
+    run_simulation_adaptive,
+    run_simulation_atmospheric,
+    run_simulation_batch,
+    run_simulation_closed_form,
+)
+
+DEFAULT_SIZES = (50, 10_000, 100_000, 1_000_000)
+# Slider positions (thrust kN, fuel t, payload t, burn t/s): the app's
+# defaults, a fast burn to orbit, a slow burn that runs to MAX_STEPS and a
+# vehicle too heavy to lift off.
+SLIDER_CASES = {
+    "default": (3500, 200, 20, 1.5),
+    "orbit":   (8000, 500, 1, 5.0),
+    "long":    (8000, 500, 1, 0.5),
+    "grounded": (1000, 500, 100, 0.5),
+}
+BATCH_CONFIGS = {"euler": 10_000, "closed": 1_000_000}
+APPEND_ROWS = 1_000     # missions per incremental append
+
+
+class BenchResult(NamedTuple):
+    case: str
+    rows: int           # catalog rows, or configurations for batch cases; 0 if neither
+    repeats: int
+    best: float         # s
+    median: float       # s
+    peak_bytes: int     # tracemalloc peak of one call: Python and NumPy allocations
+
+
+def measure(fn, min_time=0.5, min_repeat=3, max_repeat=50):
+    """(repeats, best s, median s, peak bytes) of `fn()` after one warm-up call.
+
+    Repeats until both `min_repeat` runs and `min_time` seconds are done.
+    Memory is traced in one extra call so tracing does not skew the timings.
+    """
+    fn()
+    times = []
+    while len(times) < max_repeat and (len(times) < min_repeat or sum(times) < min_time):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return len(times), min(times), statistics.median(times), peak
+
+
+# ── Cases ─────────────────────────────────────────────────────────────────────
+def _random_configs(n, seed=0):
+    from rocketsim.envelope import SLIDER_GRID
+
+    rng = np.random.default_rng(seed)
+    return tuple(rng.uniform(lo, hi, n) for lo, hi, _ in SLIDER_GRID.values())
+
+
+def simulation_cases(policy):
+    """(name, rows, fn) for single runs at each slider setting, the batch paths and the trajectory chart.
+
+    Shared inputs are built on a case's first call, which `measure` does
+    not time, so cases filtered out by name cost nothing.
+    """
+    import plotly.graph_objects as go
+
+    from rocketsim.charts import figure_json, line_trace
+    from rocketsim.dispersion import run_dispersion
+
+    for label, sliders in SLIDER_CASES.items():
+        yield f"sim.euler.{label}", 0, lambda s=sliders: run_simulation(*s)
+        yield f"sim.atmosphere.{label}", 0, lambda s=sliders: run_simulation_atmospheric(*s)
+        yield f"sim.adaptive.{label}", 0, lambda s=sliders: run_simulation_adaptive(*s)
+        yield f"sim.closed.{label}", 0, lambda s=sliders: run_simulation_closed_form(*s)
+    configs = functools.cache(_random_configs)
+    n = BATCH_CONFIGS["euler"]
+    yield "sim.batch.euler", n, lambda: run_simulation_batch(*configs(n), trajectories=False)
+    n = BATCH_CONFIGS["closed"]
+    yield "sim.batch.closed", n, lambda: closed_form_metrics(*configs(n))
+    yield "sim.dispersion", 2000, lambda: list(run_dispersion(*SLIDER_CASES["default"], n_samples=2000, seed=0))
+
+    @functools.cache
+    def samples():
+        return run_simulation(*SLIDER_CASES["long"])[:3]
+
+    def trajectory():
+        times, alts, vels = samples()
+        return go.Figure([line_trace(times, alts, policy), line_trace(times, vels, policy)])
+
+    built = functools.cache(trajectory)
+    yield "figure.trajectory.build", 0, trajectory
+    yield "figure.trajectory.json", 0, lambda: figure_json(built())
+
+
+def catalog_cases(n_rows, workdir, policy):
+    """(name, rows, fn) for loading, filtering, aggregating and charting `n_rows` missions.
+
+    The catalog is synthesized, written and indexed on the first call of
+    the first case that needs it, so filtered-out sizes write nothing.
+    """
+    from rocketsim.aggregates import MissionCube
+    from rocketsim.charts import figure_json, scatter
+    from rocketsim.missions import (
+        APP_COLUMNS,
+        Catalog,
+        MissionIndex,
+        append_catalog,
+        catalog_fingerprint,
+        load_catalog,
+        load_missions,
+        scan_type_stats,
+        synthetic_missions,
+        write_missions,
+    )
+    from rocketsim.replay import replay_missions
+
+    paths = {fmt: os.path.join(workdir, f"missions-{n_rows}.{fmt}") for fmt in ("parquet", "csv")}
+
+    @functools.cache
+    def written():
+        df = synthetic_missions(n_rows)
+        for path in paths.values():
+            write_missions(df, path)
+        return paths
+
+    @functools.cache
+    def loaded():
+        df = load_missions(written()["parquet"], APP_COLUMNS)
+        return Catalog(df, MissionIndex(df), MissionCube(df), scan_type_stats(df), catalog_fingerprint(df), 0.0)
+
+    def df():
+        return loaded().data
+
+    def cube():
+        return loaded().cube
+
+    def select(mission_type, year_max):
+        return loaded().index.select.__wrapped__(mission_type, year_max)  # bypass the LRU so every call filters
+
+    def duration_line(d):
+        return d[d["success"] & (d["distance"] > 0)].sort_values("duration", kind="stable")
+
+    for fmt in paths:
+        yield f"load.{fmt}", n_rows, lambda f=fmt: load_missions(written()[f], APP_COLUMNS)
+    yield "load.catalog", n_rows, lambda: load_catalog(written()["parquet"], APP_COLUMNS)
+    yield "load.index", n_rows, lambda: MissionIndex(df())
+    yield "load.cube", n_rows, lambda: MissionCube(df())
+    yield "load.fingerprint", n_rows, lambda: catalog_fingerprint(df())
+    batch = functools.cache(lambda: synthetic_missions(APPEND_ROWS, seed=1))
+    yield "load.append", n_rows, lambda: append_catalog(loaded(), batch())
+
+    # One case per aggregation each tab draws, at its default and a narrowed filter.
+    yield "overview.select.all", n_rows, lambda: select("All", 2024)
+    yield "overview.select.type", n_rows, lambda: select("Scientific", 2015)
+    yield "overview.cost_buckets", n_rows, lambda: cube().cost_bucket_rates("Scientific", 2015)
+    yield "overview.duration_line", n_rows, lambda: duration_line(select("All", 2024))
+    yield "analysis.crew", n_rows, lambda: cube().crew_rates()
+    yield "analysis.outcomes", n_rows, lambda: cube().outcomes_by_type()
+    yield "insights.mean_payload", n_rows, lambda: cube().mean_payload_by_type()
+    yield "insights.sketch.frame", n_rows, lambda: scan_type_stats(df())
+    # Out of core: peak memory is bounded by one chunk, not the file.
+    yield "insights.sketch.parquet", n_rows, lambda: scan_type_stats(written()["parquet"])
+    yield "insights.quantiles", n_rows, lambda: loaded().stats.summary("cost_per_kg")
+    yield "replay.closed", n_rows, lambda: replay_missions(df(), "closed", workers=1)
+
+    def payload_fuel():
+        return scatter(select("All", 2024), "payload", "fuel_tonnes", policy, color="type",
+                       hover_name="name", hover_data={"year": True, "cost": True, "success_label": True})
+
+    def yield_cost():
+        return scatter(df(), "cost", "sci_yield", policy, color="type", hover_name="name", log_x=True)
+
+    for name, build in (("payload_fuel", payload_fuel), ("yield_cost", yield_cost)):
+        built = functools.cache(build)
+        yield f"figure.{name}.build", n_rows, build
+        yield f"figure.{name}.json", n_rows, lambda b=built: figure_json(b())
+
+
+# ── Runner ────────────────────────────────────────────────────────────────────
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                               text=True, cwd=os.path.dirname(os.path.abspath(__file__)), timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if out.returncode:
+        return None
+    return out.stdout.strip() + ("-dirty" if dirty.stdout.strip() else "")
+
+
+def environment():
+    """Commit, interpreter and library versions a result file was produced with."""
+    import pandas as pd
+    import plotly
+
+    return dict(
+        commit=_git_commit(),
+        created=time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        python=platform.python_version(),
+        numpy=np.__version__,
+        pandas=pd.__version__,
+        plotly=plotly.__version__,
+        platform=platform.platform(),
+        cpus=os.cpu_count(),
+    )
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, cases=None, min_time=0.5, progress=None):
+    """Run every case whose name starts with one of `cases` (all if None).
+
+    Returns ``{"meta": environment(), "results": [BenchResult._asdict(), ...]}``.
+    `progress(result)` is called as each case finishes.
+    """
+    from rocketsim.charts import RenderPolicy
+
+    policy = RenderPolicy.from_env()
+    wanted = tuple(cases) if cases else ("",)
+    results = []
+
+    def run(all_cases):
+        for name, rows, fn in all_cases:
+            if not name.startswith(wanted):
+                continue
+            result = BenchResult(name, rows, *measure(fn, min_time))
+            results.append(result._asdict())
+            if progress:
+                progress(result)
+
+    start = time.perf_counter()
+    run(simulation_cases(policy))
+    with tempfile.TemporaryDirectory(prefix="rocketsim-bench-") as workdir:
+        for n_rows in sorted(sizes):
+            run(catalog_cases(n_rows, workdir, policy))
+
+    meta = environment()
+    meta.update(sizes=sorted(sizes), render_policy=policy._asdict(), seconds=round(time.perf_counter() - start, 1))
+    try:
+        import resource
+
+        meta["max_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    except ImportError:  # Windows
+        pass
+    return dict(meta=meta, results=results)
+
+
+def compare(base, new, threshold=1.2):
+    """(case, rows, base best s, new best s, ratio) for cases in both runs, plus the regressions.
+
+    A regression is a case whose best time grew by more than `threshold`×.
+    """
+    before = {(r["case"], r["rows"]): r["best"] for r in base["results"]}
+    rows = [(r["case"], r["rows"], before[r["case"], r["rows"]], r["best"],
+             r["best"] / before[r["case"], r["rows"]] if before[r["case"], r["rows"]] else float("inf"))
+            for r in new["results"] if (r["case"], r["rows"]) in before]
+    return rows, [row for row in rows if row[4] > threshold]
+
+
+def _format_seconds(s):
+    return f"{s * 1e3:9.2f} ms" if s < 1 else f"{s:9.2f} s "
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m rocketsim.bench", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="run the benchmarks and write the results as JSON")
+    run.add_argument("--out", default="bench.json")
+    run.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="catalog rows")
+    run.add_argument("--cases", nargs="+", metavar="PREFIX", help="only cases starting with these, e.g. sim load")
+    run.add_argument("--min-time", type=float, default=0.5, help="seconds to spend timing each case")
+    cmp = sub.add_parser("compare", help="compare two result files")
+    cmp.add_argument("base")
+    cmp.add_argument("new")
+    cmp.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        with open(args.base) as f, open(args.new) as g:
+            base, new = json.load(f), json.load(g)
+        rows, regressions = compare(base, new, args.threshold)
+        print(f"{base['meta'].get('commit')} → {new['meta'].get('commit')}")
+        for case, n, before, after, ratio in rows:
+            flag = "  ← slower" if ratio > args.threshold else ""
+            print(f"{case:28} {n:>10,} {_format_seconds(before)} {_format_seconds(after)} {ratio:6.2f}×{flag}")
+        print(f"{len(regressions)} of {len(rows)} cases slower than {args.threshold}×")
+        sys.exit(1 if regressions else 0)
+
+    def progress(r):
+        print(f"{r.case:28} {r.rows:>10,} {_format_seconds(r.best)} best {_format_seconds(r.median)} median "
+              f"{r.peak_bytes / 2**20:9.1f} MB peak", flush=True)
+
+    report = run_benchmarks(args.sizes, args.cases, args.min_time, progress)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=1)
+    print(f"wrote {args.out} ({len(report['results'])} cases) in {report['meta']['seconds']} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Process-wide LRU cache for simulation results, optionally backed by SQLite."""
+
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+SCHEMA_VERSION = 1  # bump when the table layout or the disk key format changes
+
+
+def quantize_sliders(thrust_kn, fuel_t, payload_t, burn_tps):
+    """Snap slider values onto their step grid so equal positions share a key."""
+    return (
+        int(round(thrust_kn / 100)) * 100,
+        int(round(fuel_t / 10)) * 10,
+        int(round(payload_t)),
+        round(round(burn_tps * 10) / 10, 1),
+    )
+
+
+def code_version(*modules):
+    """Short digest of the modules' source files, for keying results they compute."""
+    digest = hashlib.sha1()
+    for module in modules:
+        with open(module.__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+class ResultCache:
+    """Thread-safe LRU keyed on hashable tuples, bounded by pickled size.
+
+    One instance is shared by every session in the server process. With a
+    `path`, entries are also written to a local SQLite file (itself LRU
+    bounded by `disk_max_bytes`) so a restarted server starts warm. Disk
+    keys carry the schema and the caller's `version` (see `code_version`),
+    so an upgraded server misses on results computed by older code, which
+    then age out of the file.
+    """
+
+    def __init__(self, max_bytes=64 * 2**20, path=None, disk_max_bytes=512 * 2**20, version=""):
+        self.max_bytes = max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.version = f"{SCHEMA_VERSION}:{version}"
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+        self._entries = OrderedDict()   # key -> (value, nbytes)
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._db = None
+        self._disk_bytes = 0
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, used REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+            self._db.commit()
+            # Counted once here and kept up to date by `put`, so trimming never scans the table.
+            self._disk_bytes = self._db.execute(
+                "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM results"
+            ).fetchone()[0]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            if self._db is not None:
+                disk_key = self._disk_key(key)
+                row = self._db.execute(
+                    "SELECT value FROM results WHERE key = ?", (disk_key,)
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE results SET used = ? WHERE key = ?", (time.time(), disk_key)
+                    )
+                    self._db.commit()
+                    self.disk_hits += 1
+                    value = pickle.loads(row[0])
+                    self._insert(key, value, len(row[0]))
+                    return value
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._insert(key, value, len(blob))
+            if self._db is not None:
+                disk_key = self._disk_key(key)
+                row = self._db.execute(
+                    "SELECT LENGTH(value) FROM results WHERE key = ?", (disk_key,)
+                ).fetchone()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?)", (disk_key, blob, time.time())
+                )
+                self._disk_bytes += len(blob) - (row[0] if row else 0)
+                self._trim_disk()
+                self._db.commit()
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for `key`, computing and storing it on a miss.
+
+        The computation runs outside the lock, so two sessions missing on the
+        same key at once may both compute it; the later result wins.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+                self._disk_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return dict(
+                entries=len(self._entries),
+                bytes=self._nbytes,
+                hits=self.hits,
+                disk_hits=self.disk_hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                hit_rate=(self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            )
+
+    # Callers hold the lock.
+    def _disk_key(self, key):
+        return f"{self.version}|{key!r}"
+
+    def _insert(self, key, value, nbytes):
+        if key in self._entries:
+            self._nbytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, nbytes)
+        self._nbytes += nbytes
+        while self._nbytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, dropped) = self._entries.popitem(last=False)
+            self._nbytes -= dropped
+            self.evictions += 1
+
+    def _trim_disk(self):
+        while self._disk_bytes > self.disk_max_bytes:
+            row = self._db.execute(
+                "SELECT key, LENGTH(value) FROM results ORDER BY used LIMIT 1"
+            ).fetchone()
+            if row is None:
+                self._disk_bytes = 0
+                break
+            self._db.execute("DELETE FROM results WHERE key = ?", (row[0],))
+            self._disk_bytes -= row[1]
@@ -0,0 +1,182 @@
+"""Scale-aware Plotly trace builders: WebGL, server-side binning, LTTB."""
+
+import contextlib
+import functools
+import os
+from typing import NamedTuple
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+
+class RenderPolicy(NamedTuple):
+    webgl_rows: int = 1_000        # scatters above this switch to WebGL
+    density_rows: int = 100_000    # ...and above this to a binned heatmap
+    density_bins: int = 120        # bins per axis for the heatmap
+    line_points: int = 2_000       # LTTB target for line charts
+    sample_every: int = 5          # trajectory samples: every Nth integrator step
+
+    @classmethod
+    def from_env(cls, prefix="ROCKET_"):
+        """Policy with any field overridden by e.g. ``ROCKET_LINE_POINTS=500``."""
+        return cls(**{
+            field: int(os.environ[prefix + field.upper()])
+            for field in cls._fields if prefix + field.upper() in os.environ
+        })
+
+
+# ── Downsampling ──────────────────────────────────────────────────────────────
+def lttb(x, y, n_out):
+    """Indices of a Largest-Triangle-Three-Buckets downsample of (x, y).
+
+    Keeps the first and last points and, from each of `n_out - 2` equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the next bucket's centroid, which preserves
+    peaks and turning points far better than striding.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def downsample(x, y, policy, n_out=None):
+    """(x, y) reduced to the policy's line budget; untouched if already small."""
+    keep = lttb(np.arange(len(x)) if _is_categorical(x) else x, y, n_out or policy.line_points)
+    if len(keep) == len(x):
+        return x, y
+    return _take(x, keep), _take(y, keep)
+
+
+def _is_categorical(x):
+    return np.asarray(x).dtype.kind in "OUS" or hasattr(x, "cat")
+
+
+def _take(values, keep):
+    return values.iloc[keep] if hasattr(values, "iloc") else np.asarray(values)[keep]
+
+
+# ── Scatter ───────────────────────────────────────────────────────────────────
+def scatter(df, x, y, policy, marker=None, log_x=False, **px_kwargs):
+    """`px.scatter` that scales with the number of rows.
+
+    Small frames render as SVG exactly as before, larger ones as WebGL
+    (`scattergl`), and past `policy.density_rows` the points are binned on
+    the server into a count heatmap so the figure size no longer depends
+    on the row count.
+    """
+    if len(df) > policy.density_rows:
+        return density_heatmap(df, x, y, policy, log_x=log_x,
+                               labels=px_kwargs.get("labels", {}), title=px_kwargs.get("title"))
+    import plotly.express as px  # ~70 ms on first use; most cold starts never need it
+
+    render_mode = "webgl" if len(df) > policy.webgl_rows else "svg"
+    fig = px.scatter(df, x=x, y=y, log_x=log_x, render_mode=render_mode, **px_kwargs)
+    if not fig.data:  # `color=` on an empty frame yields no traces, which st.plotly_chart rejects
+        fig.add_trace(go.Scatter(x=[], y=[], mode="markers", showlegend=False))
+    if marker:
+        fig.update_traces(marker=marker)
+    return fig
+
+
+def density_heatmap(df, x, y, policy, log_x=False, labels=None, title=None):
+    labels = labels or {}
+    xs = df[x].to_numpy(dtype=float)
+    ys = df[y].to_numpy(dtype=float)
+    ok = np.isfinite(xs) & np.isfinite(ys) & ((xs > 0) if log_x else True)
+    xs, ys = xs[ok], ys[ok]
+    bx = np.log10(xs) if log_x else xs
+    counts, xedges, yedges = np.histogram2d(bx, ys, bins=policy.density_bins)
+    xc = (xedges[:-1] + xedges[1:]) / 2
+    yc = (yedges[:-1] + yedges[1:]) / 2
+    counts[counts == 0] = np.nan
+    fig = go.Figure(go.Heatmap(
+        x=10 ** xc if log_x else xc, y=yc, z=counts.T,
+        colorscale=[[0, "#0d2a5e"], [0.5, "#00d4ff"], [1, "#39ff14"]],
+        colorbar=dict(title="Missions"),
+        hovertemplate=f"{labels.get(x, x)}: %{{x:,.3g}}<br>{labels.get(y, y)}: %{{y:,.3g}}"
+                      "<br>Missions: %{z:,}<extra></extra>",
+    ))
+    fig.update_layout(title=title, xaxis_title=labels.get(x, x), yaxis_title=labels.get(y, y))
+    if log_x:
+        fig.update_xaxes(type="log")
+    return fig
+
+
+def line_trace(x, y, policy, **kwargs):
+    """Scatter trace for a line series, LTTB-downsampled to the policy budget.
+
+    Switches to WebGL when the series is still longer than `webgl_rows`.
+    """
+    x, y = downsample(x, y, policy)
+    trace = go.Scattergl if len(x) > policy.webgl_rows else go.Scatter
+    return trace(x=x, y=y, **kwargs)
+
+
+def downsample_rows(df, y, policy):
+    """Rows of `df` kept by LTTB on series `y` against row position.
+
+    For charts whose traces share per-row text or hover data, so every
+    trace is cut at the same rows.
+    """
+    keep = lttb(np.arange(len(df)), y, policy.line_points)
+    return df if len(keep) == len(df) else df.iloc[keep]
+
+
+# ── Templates and memoized figures ────────────────────────────────────────────
+def register_template(name, layout, default=True):
+    """Register `layout` as Plotly template `name`, optionally as the default.
+
+    Figures pick the template up when they are created, so the theme is
+    validated once here instead of by an `update_layout` on every figure.
+    """
+    pio.templates[name] = go.layout.Template(layout=layout)
+    if default:
+        pio.templates.default = name
+    return name
+
+
+def figure_json(fig):
+    return pio.to_json(fig, validate=False)
+
+
+def memoize_figure(cache, version=None, section=None):
+    """Decorator caching a figure builder's output as JSON in `cache`.
+
+    The key is the builder's name, `version()` (e.g. a catalog fingerprint;
+    called per lookup so decorating does not force the data to load) and
+    the builder's positional arguments, which must be hashable filter state
+    rather than data. Callers get the JSON string back. On a miss the build
+    and the serialization run inside ``section("figure.<name>")`` and
+    ``section("serialize.<name>")`` context managers when one is given.
+    """
+    section = section or (lambda name: contextlib.nullcontext())
+
+    def decorate(build):
+        def compute(state):
+            with section(f"figure.{build.__name__}"):
+                fig = build(*state)
+            with section(f"serialize.{build.__name__}"):
+                return figure_json(fig)
+
+        @functools.wraps(build)
+        def cached(*state):
+            key = (build.__name__, version() if version else None) + state
+            return cache.get_or_compute(key, lambda: compute(state))
+        return cached
+    return decorate
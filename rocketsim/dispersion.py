@@ -0,0 +1,130 @@
+"""Monte Carlo dispersion of the launch model with streamed percentiles."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+import numpy as np
+
+from rocketsim.simulation import ORBIT_ALT_M, STRUCTURE_KG, run_simulation_batch
+
+
+class DispersionSnapshot(NamedTuple):
+    done: int               # samples folded in so far
+    total: int
+    times: np.ndarray       # s
+    p5: np.ndarray          # km
+    p50: np.ndarray         # km
+    p95: np.ndarray         # km
+    p_orbit: float          # share of samples above the LEO threshold
+    bin_width: np.ndarray   # km, per-time resolution of the percentiles
+
+
+class StreamingHistogram:
+    """Per-column histograms of non-negative values, mergeable chunk by chunk.
+
+    Each column starts with a range fitted to the first chunk and doubles
+    it (merging neighbouring bins) whenever a later value overflows, so
+    memory is fixed at `columns × bins` counts however many samples arrive.
+    Quantiles interpolate linearly inside a bin; their error is at most
+    one bin width, which `bin_width` reports.
+    """
+
+    def __init__(self, columns, bins=512):
+        self.bins = bins
+        self.counts = np.zeros((columns, bins), dtype=np.int64)
+        self.hi = np.zeros(columns)
+        self.n = 0
+
+    @property
+    def bin_width(self):
+        return self.hi / self.bins
+
+    def add(self, values):
+        values = np.asarray(values, dtype=float)            # (samples, columns)
+        col_max = values.max(axis=0)
+        fresh = self.hi == 0
+        self.hi[fresh] = np.maximum(col_max[fresh] * 1.25, 1e-3)
+        for c in np.flatnonzero(col_max >= self.hi):
+            while col_max[c] >= self.hi[c]:
+                merged = self.counts[c, 0::2] + self.counts[c, 1::2]
+                self.counts[c] = 0
+                self.counts[c, : self.bins // 2] = merged
+                self.hi[c] *= 2
+
+        idx = np.minimum((values / self.bin_width).astype(np.int64), self.bins - 1)
+        flat = idx + np.arange(values.shape[1]) * self.bins
+        self.counts += np.bincount(flat.ravel(), minlength=self.counts.size).reshape(self.counts.shape)
+        self.n += values.shape[0]
+
+    def quantile(self, q):
+        cum = np.cumsum(self.counts, axis=1)
+        target = q * self.n
+        j = np.minimum((cum < target).sum(axis=1), self.bins - 1)
+        rows = np.arange(len(j))
+        below = np.where(j > 0, cum[rows, np.maximum(j - 1, 0)], 0)
+        in_bin = np.maximum(self.counts[rows, j], 1)
+        frac = np.clip((target - below) / in_bin, 0, 1)
+        return (j + frac) * self.bin_width
+
+
+def _run_chunk(nominal, tolerances, n, seed):
+    thrust_kn, fuel_t, payload_t, burn_tps = nominal
+    thrust_tol, burn_tol, dry_tol = tolerances
+    rng = np.random.default_rng(seed)
+    dry_kg = (payload_t * 1000 + STRUCTURE_KG) * (1 + dry_tol * rng.standard_normal(n))
+    r = run_simulation_batch(
+        thrust_kn * (1 + thrust_tol * rng.standard_normal(n)),
+        fuel_t,
+        np.maximum(dry_kg - STRUCTURE_KG, 0) / 1000,
+        np.maximum(burn_tps * (1 + burn_tol * rng.standard_normal(n)), 1e-3),
+    )
+    # After landing a run sits on the ground.
+    return r.times, np.nan_to_num(r.alts, nan=0.0), int((r.max_alt > ORBIT_ALT_M).sum())
+
+
+def run_dispersion(thrust_kn, fuel_t, payload_t, burn_tps,
+                   thrust_tol=0.02, burn_tol=0.02, dry_tol=0.02,
+                   n_samples=2000, chunk_size=250, workers=None, seed=None):
+    """Yield a `DispersionSnapshot` after every finished chunk of samples.
+
+    Thrust, burn rate and dry mass (payload + structure) are each scaled by
+    ``1 + tol · N(0, 1)``. Chunks run as vectorized batches, spread over a
+    process pool of `workers` processes (all cores by default; 1 runs
+    inline), and are folded into streaming histograms as they complete.
+    """
+    workers = workers or os.cpu_count() or 1
+    nominal = (thrust_kn, fuel_t, payload_t, burn_tps)
+    tolerances = (thrust_tol, burn_tol, dry_tol)
+    sizes = [min(chunk_size, n_samples - i) for i in range(0, n_samples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(nominal, tolerances, n, s) for n, s in zip(sizes, seeds)]
+
+    hist = None
+    orbit = 0
+
+    def fold(times, alts, hits):
+        nonlocal hist, orbit
+        if hist is None:
+            hist = StreamingHistogram(alts.shape[1])
+        hist.add(alts)
+        orbit += hits
+        return DispersionSnapshot(
+            done=hist.n, total=n_samples, times=times,
+            p5=hist.quantile(0.05), p50=hist.quantile(0.5), p95=hist.quantile(0.95),
+            p_orbit=orbit / hist.n, bin_width=hist.bin_width,
+        )
+
+    if workers == 1:
+        for task in tasks:
+            yield fold(*_run_chunk(*task))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, *task) for task in tasks]
+        try:
+            for future in as_completed(futures):
+                yield fold(*future.result())
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,164 @@
+"""Precomputed performance envelope over the SIMULATION slider grid.
+
+Build once offline, then interpolate metrics instead of simulating:
+
+    python -m rocketsim.envelope build --out envelope.npy
+    python -m rocketsim.envelope build --out envelope.npy --method closed
+
+The default "euler" table is stepped like the app's default integrator,
+including its 3000 s cap, so it agrees with the SIMULATION cards (about
+ten minutes on one core; ``--stride 2 2 5 2`` is a quick coarse build).
+The closed-form table takes seconds but its apogees are uncapped.
+"""
+
+import argparse
+import json
+import time
+from itertools import product
+
+import numpy as np
+
+from rocketsim.simulation import ORBIT_ALT_M, closed_form_metrics, run_simulation_batch
+
+# (min, max, step) of each slider, in the order of the table axes.
+SLIDER_GRID = dict(
+    thrust_kn=(1000, 8000, 100),
+    fuel_t=(50, 500, 10),
+    payload_t=(1, 100, 1),
+    burn_tps=(0.5, 5.0, 0.1),
+)
+AXES = tuple(SLIDER_GRID)
+METRICS = ("max_alt", "max_vel", "burn_end", "orbit")
+
+
+def axis_values(name, stride=1):
+    lo, hi, step = SLIDER_GRID[name]
+    n = int(round((hi - lo) / step)) + 1
+    return np.round(lo + np.arange(0, n, stride) * step, 6)
+
+
+def flight_metrics(method, thrust, fuel, payload, burn):
+    """`METRICS` for broadcastable arrays of slider values, stacked on the last axis.
+
+    Only the vectorized models are accepted: "closed" (analytic) and
+    "euler" (the app's fixed-step integrator, stepped as one batch).
+    """
+    if method == "closed":
+        m = closed_form_metrics(thrust, fuel, payload, burn)
+        max_alt, max_vel, burn_end = m.max_alt, m.max_vel, m.burn_end
+    elif method == "euler":
+        r = run_simulation_batch(thrust, fuel, payload, burn, trajectories=False)
+        max_alt, max_vel, burn_end = r.max_alt, r.max_vel, r.burn_end
+    else:
+        raise ValueError(f"unknown method {method!r}, expected 'closed' or 'euler'")
+    return np.stack([max_alt, max_vel, burn_end, max_alt > ORBIT_ALT_M], axis=-1)
+
+
+def build_envelope(path, stride=(1, 1, 1, 1), method="euler", progress=None):
+    """Write the metric table for every (subsampled) slider combination.
+
+    The table is a float32 ``.npy`` of shape (thrust, fuel, payload, burn, 4)
+    filled one thrust plane at a time, so memory stays bounded by a single
+    plane. Axis values and the model used go to a JSON sidecar.
+    """
+    axes = [axis_values(name, s) for name, s in zip(AXES, stride)]
+    shape = tuple(len(a) for a in axes) + (len(METRICS),)
+    table = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=shape)
+
+    fuel, payload, burn = np.meshgrid(*axes[1:], indexing="ij")
+    start = time.perf_counter()
+    for i, thrust in enumerate(axes[0]):
+        table[i] = flight_metrics(method, np.full(fuel.shape, thrust), fuel, payload, burn)
+        if progress:
+            progress(i + 1, len(axes[0]))
+    table.flush()
+    del table
+
+    meta = dict(
+        method=method,
+        axes={name: a.tolist() for name, a in zip(AXES, axes)},
+        metrics=list(METRICS),
+        build_seconds=round(time.perf_counter() - start, 2),
+    )
+    with open(_meta_path(path), "w") as f:
+        json.dump(meta, f)
+    return meta
+
+
+def _meta_path(path):
+    return str(path).rsplit(".npy", 1)[0] + ".json"
+
+
+class Envelope:
+    """Lazily memory-mapped view of a table written by `build_envelope`."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(_meta_path(path)) as f:
+            self.meta = json.load(f)
+        self.method = self.meta["method"]
+        self.axes = [np.asarray(self.meta["axes"][name]) for name in AXES]
+        self._table = None
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = np.load(self.path, mmap_mode="r")
+        return self._table
+
+    def _index(self, axis, value):
+        return int(np.abs(self.axes[axis] - value).argmin())
+
+    def interpolate(self, thrust_kn, fuel_t, payload_t, burn_tps):
+        """Metrics as a dict, interpolated multilinearly between the surrounding grid points."""
+        lows, weights = [], []
+        for axis, value in zip(self.axes, (thrust_kn, fuel_t, payload_t, burn_tps)):
+            value = float(np.clip(value, axis[0], axis[-1]))
+            j = int(np.clip(np.searchsorted(axis, value, side="right") - 1, 0, max(len(axis) - 2, 0)))
+            span = axis[j + 1] - axis[j] if len(axis) > 1 else 1.0
+            lows.append(j)
+            weights.append(0.0 if len(axis) == 1 else (value - axis[j]) / span)
+        out = np.zeros(len(METRICS))
+        for corner in product((0, 1), repeat=len(AXES)):
+            w = 1.0
+            idx = []
+            for j, c, wt, axis in zip(lows, corner, weights, self.axes):
+                w *= wt if c else 1 - wt
+                idx.append(min(j + c, len(axis) - 1))
+            if w:
+                out += w * self.table[tuple(idx)]
+        return dict(zip(METRICS, out.tolist()))
+
+    def min_thrust_for_orbit(self, payload_t):
+        """Lowest tabulated thrust (kN) reaching LEO, per (fuel, burn rate).
+
+        Returns a (fuel, burn) array with NaN where no thrust on the grid
+        gets there. Apogee grows with thrust, so the first orbiting plane
+        along the thrust axis is the minimum.
+        """
+        orbit = np.asarray(self.table[:, :, self._index(2, payload_t), :, METRICS.index("orbit")]) > 0
+        first = orbit.argmax(axis=0)
+        return np.where(orbit.any(axis=0), self.axes[0][first], np.nan)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m rocketsim.envelope", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="precompute the envelope table")
+    build.add_argument("--out", default="envelope.npy")
+    build.add_argument("--method", choices=["closed", "euler"], default="euler")
+    build.add_argument("--stride", type=int, nargs=4, default=[1, 1, 1, 1],
+                       metavar=("THRUST", "FUEL", "PAYLOAD", "BURN"),
+                       help="keep every n-th value of each slider axis")
+    args = parser.parse_args(argv)
+
+    def progress(done, total):
+        print(f"\r{done}/{total} thrust planes", end="", flush=True)
+
+    meta = build_envelope(args.out, tuple(args.stride), args.method, progress)
+    shape = " × ".join(str(len(a)) for a in meta["axes"].values())
+    print(f"\nwrote {args.out} ({shape} grid, {meta['method']}) in {meta['build_seconds']} s")
+
+
+if __name__ == "__main__":
+    main()
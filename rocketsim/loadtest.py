@@ -0,0 +1,388 @@
+"""Multi-session load test of the dashboard against a local Streamlit server.
+
+Starts the app (or attaches to a running one with ``--url``), opens N
+websocket sessions that speak the browser's protocol, and has each one
+replay a random mix of Overview filter changes, simulation slider moves
+and tab switches. Widgets inside a fragment rerun just that fragment, as
+they do in a browser. Reports rerun latency percentiles, throughput and
+the server's CPU and memory as JSON:
+
+    python -m rocketsim.loadtest --sessions 8 --duration 30 --out loadtest.json
+    python -m rocketsim.loadtest --sessions 32 --mix overview=1 simulation=3 tabs=1 --think 0.5
+    python -m rocketsim.loadtest --url ws://localhost:8501 --pid 4242 --sessions 16
+
+Server CPU and memory come from ``/proc`` and are only reported on Linux.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+DEFAULT_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "rocketlauncher.py")
+DEFAULT_MIX = {"overview": 3, "simulation": 4, "tabs": 2}
+OVERVIEW_TAB, SIMULATION_TAB = "◈ OVERVIEW", "◈ SIMULATION"
+SIMULATION_SLIDERS = ("Thrust (kN)", "Initial Fuel Mass (tonnes)", "Payload Mass (tonnes)", "Burn Rate (t/s)")
+
+
+def percentile(values, q):
+    """`q`-th percentile (0-100) of `values` by linear interpolation, nan if empty."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+# ── Protocol client ───────────────────────────────────────────────────────────
+class Session:
+    """One browser-like websocket session.
+
+    Keeps the widget values it has set and sends all of them with every
+    rerun request, learns widget ids, options and fragment ids from the
+    deltas it receives, and times each rerun from request to
+    ``script_finished``. Use it as a context manager, or call `close`, to
+    shut the websocket.
+    """
+
+    def __init__(self, url, timeout=120):
+        try:
+            from streamlit.proto.BackMsg_pb2 import BackMsg
+            from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+            from streamlit.proto.WidgetStates_pb2 import WidgetState
+            from websockets.sync.client import connect
+        except ImportError as exc:
+            raise ImportError("the load test requires streamlit and websockets>=12; pip install -r requirements.txt") from exc
+        self._BackMsg, self._ForwardMsg, self._WidgetState = BackMsg, ForwardMsg, WidgetState
+        self._exit = contextlib.ExitStack()
+        self.ws = self._exit.enter_context(connect(f"{url.rstrip('/')}/_stcore/stream", subprotocols=["streamlit"],
+                                                   max_size=None, open_timeout=timeout))
+        self.timeout = timeout
+        self.widgets = {}       # (kind, label) -> (id, proto, fragment id)
+        self.tabs = []          # tab labels in order
+        self.tab_widget = None
+        self.states = {}        # widget id -> WidgetState
+        self.errors = []        # exceptions the app rendered
+
+    def close(self):
+        self._exit.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def rerun(self, fragment_id=""):
+        """Request a rerun; returns (seconds, bytes received)."""
+        msg = self._BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+        start = time.perf_counter()
+        self.ws.send(msg.SerializeToString())
+        received = 0
+        while True:
+            raw = self.ws.recv(timeout=self.timeout)
+            received += len(raw)
+            fm = self._ForwardMsg()
+            fm.ParseFromString(raw)
+            kind = fm.WhichOneof("type")
+            if kind == "delta":
+                self._learn(fm.delta)
+            elif kind == "script_finished":
+                return time.perf_counter() - start, received
+
+    def _learn(self, delta):
+        kind = delta.WhichOneof("type")
+        if kind == "new_element":
+            element = delta.new_element
+            name = element.WhichOneof("type")
+            proto = getattr(element, name)
+            if name == "exception":
+                self.errors.append(f"{proto.type}: {proto.message}")
+            elif getattr(proto, "id", "") and hasattr(proto, "label"):
+                self.widgets[(name, proto.label)] = (proto.id, proto, delta.fragment_id)
+        elif kind == "add_block":
+            block = delta.add_block
+            name = block.WhichOneof("type")
+            if name == "tab_container":
+                self.tab_widget = block.tab_container.id
+                self.tabs = []
+            elif name == "tab":
+                self.tabs.append(block.tab.label)
+
+    @property
+    def open_tab(self):
+        state = self.states.get(self.tab_widget)
+        return state.string_value if state else self.tabs[0]
+
+    def set_value(self, kind, label, value):
+        """Set a slider (number), selectbox/radio (option) or tab (label) and rerun what it belongs to."""
+        if kind == "tab":
+            state = self._WidgetState(id=self.tab_widget, string_value=value)
+            fragment_id = ""
+        else:
+            widget_id, _, fragment_id = self.widgets[(kind, label)]
+            state = self._WidgetState(id=widget_id)
+            if kind == "slider":
+                state.double_array_value.data.append(value)
+            else:
+                state.string_value = value
+        self.states[state.id] = state
+        return self.rerun(fragment_id)
+
+
+# ── Interaction mix ───────────────────────────────────────────────────────────
+def _switch_tab(session, rng, samples, label=None):
+    label = label or rng.choice([t for t in session.tabs if t != session.open_tab])
+    samples.append(("tabs",) + session.set_value("tab", None, label))
+
+
+def _open(session, tab, samples):
+    if session.open_tab != tab:
+        _switch_tab(session, None, samples, tab)
+
+
+def _overview(session, rng, samples):
+    _open(session, OVERVIEW_TAB, samples)
+    _, selectbox, _ = session.widgets[("selectbox", "Filter by Mission Type")]
+    if rng.random() < 0.5:
+        samples.append(("overview",) + session.set_value("selectbox", selectbox.label, rng.choice(selectbox.options)))
+    else:
+        _, slider, _ = session.widgets[("slider", "Max Year")]
+        samples.append(("overview",) + session.set_value("slider", slider.label, rng.randint(int(slider.min), int(slider.max))))
+
+
+def _simulation(session, rng, samples):
+    # A drag: a few successive releases of one slider moving in one direction.
+    _open(session, SIMULATION_TAB, samples)
+    _, slider, _ = session.widgets[("slider", rng.choice(SIMULATION_SLIDERS))]
+    state = session.states.get(slider.id)
+    value = state.double_array_value.data[0] if state else slider.default[0]
+    direction = rng.choice((-1, 1))
+    for _ in range(rng.randint(1, 4)):
+        value = min(max(value + direction * slider.step * rng.randint(1, 5), slider.min), slider.max)
+        samples.append(("simulation",) + session.set_value("slider", slider.label, round(value, 6)))
+
+
+ACTIONS = {"overview": _overview, "simulation": _simulation, "tabs": _switch_tab}
+
+
+def run_session(url, mix, deadline, think, seed, results):
+    """Drive one session until `deadline`.
+
+    Appends (samples, app exception messages, failure or None) to `results`, where
+    samples are (action, seconds, bytes received) per rerun.
+    """
+    rng = random.Random(seed)
+    samples, errors = [], []
+    failure = None
+    try:
+        with Session(url) as session:
+            errors = session.errors
+            samples.append(("connect",) + session.rerun())
+            names, weights = zip(*mix.items())
+            while time.perf_counter() < deadline:
+                ACTIONS[rng.choices(names, weights)[0]](session, rng, samples)
+                if think:
+                    time.sleep(rng.expovariate(1 / think))
+    except Exception as exc:  # reported, so one broken session does not end the run
+        failure = f"{type(exc).__name__}: {exc}"
+    finally:
+        results.append((samples, errors, failure))
+
+
+# ── Server process ────────────────────────────────────────────────────────────
+class ProcessSampler(threading.Thread):
+    """Polls a process's CPU time and resident memory from ``/proc`` in the background."""
+
+    def __init__(self, pid, interval=0.2):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak_rss = 0
+        self._stop_event = threading.Event()
+
+    def cpu_seconds(self):
+        with open(f"/proc/{self.pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+    def rss(self):
+        with open(f"/proc/{self.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+        return 0
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.peak_rss = max(self.peak_rss, self.rss())
+            except OSError:
+                return
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def start_server(app=DEFAULT_APP, port=None, timeout=60):
+    """Start ``streamlit run app`` headless on a free port; returns (process, ws url)."""
+    port = port or _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", app, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return proc, f"ws://localhost:{port}"
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"streamlit did not become healthy on port {port} within {timeout} s")
+
+
+# ── Runner ────────────────────────────────────────────────────────────────────
+def _summary(latencies):
+    return dict(count=len(latencies), mean=statistics.fmean(latencies) if latencies else float("nan"),
+                p50=percentile(latencies, 50), p95=percentile(latencies, 95), p99=percentile(latencies, 99),
+                max=max(latencies, default=float("nan")))
+
+
+def run_load_test(sessions=8, duration=30.0, mix=None, think=0.0, url=None, pid=None, app=DEFAULT_APP,
+                  seed=0, progress=None):
+    """Run `sessions` concurrent sessions for `duration` seconds and return the report dict.
+
+    Without `url` a server for `app` is started (and stopped) here, so its
+    CPU and memory can be sampled; pass `pid` with `url` to sample an
+    existing server. Latencies are client-side, request to script finish.
+    """
+    from rocketsim.bench import environment
+
+    mix = mix or DEFAULT_MIX
+    proc = None
+    if url is None:
+        proc, url = start_server(app)
+        pid = proc.pid
+    try:
+        sampler = ProcessSampler(pid) if pid and os.path.exists(f"/proc/{pid}") else None
+        # One warm-up session pays for the cold start (imports, data load) so
+        # it is not charged to the measured sessions.
+        with Session(url) as warm:
+            warm.rerun()
+        rss_idle = sampler.rss() if sampler else None
+        cpu_start = sampler.cpu_seconds() if sampler else None
+        if sampler:
+            sampler.start()
+
+        results = []
+        start = time.perf_counter()
+        deadline = start + duration
+        threads = [threading.Thread(target=run_session, args=(url, mix, deadline, think, seed + i, results))
+                   for i in range(sessions)]
+        for t in threads:
+            t.start()
+        while any(t.is_alive() for t in threads):
+            for t in threads:
+                t.join(timeout=1)
+            if progress:
+                progress(min(time.perf_counter() - start, duration), duration)
+        wall = time.perf_counter() - start
+        server = {}
+        if sampler:
+            sampler.stop()
+            cpu = sampler.cpu_seconds() - cpu_start
+            server = dict(cpu_seconds=round(cpu, 2), cpu_cores=round(cpu / wall, 2),
+                          rss_idle_mb=round(rss_idle / 2**20, 1), rss_peak_mb=round(sampler.peak_rss / 2**20, 1),
+                          rss_per_session_mb=round(max(sampler.peak_rss - rss_idle, 0) / sessions / 2**20, 2))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=30)
+
+    samples = [s for session_samples, _, _ in results for s in session_samples if s[0] != "connect"]
+    latencies = [s[1] for s in samples]
+    by_action = {name: _summary([s[1] for s in samples if s[0] == name]) for name in sorted({s[0] for s in samples})}
+    meta = environment()
+    meta.update(sessions=sessions, duration=duration, mix=mix, think=think, url=url, seed=seed)
+    return dict(
+        meta=meta,
+        reruns=_summary(latencies),
+        by_action=by_action,
+        throughput=len(latencies) / wall,
+        received_mb=round(sum(s[2] for s in samples) / 2**20, 1),
+        errors=sorted({e for _, errors, _ in results for e in errors}),
+        failures=[failure for _, _, failure in results if failure],
+        server=server,
+    )
+
+
+def _parse_mix(items):
+    mix = {}
+    for item in items:
+        name, _, weight = item.partition("=")
+        if name not in ACTIONS:
+            raise argparse.ArgumentTypeError(f"unknown action {name!r}, expected one of {sorted(ACTIONS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m rocketsim.loadtest", description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of load after warm-up")
+    parser.add_argument("--mix", nargs="+", metavar="ACTION=WEIGHT", help=f"default: {DEFAULT_MIX}")
+    parser.add_argument("--think", type=float, default=0.0, help="mean pause between actions, s")
+    parser.add_argument("--url", help="ws:// or http:// base URL of a running server instead of starting one")
+    parser.add_argument("--pid", type=int, help="process id of the --url server, to sample its CPU and memory")
+    parser.add_argument("--app", default=DEFAULT_APP)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="loadtest.json")
+    args = parser.parse_args(argv)
+    url = args.url.replace("http://", "ws://").replace("https://", "wss://") if args.url else None
+
+    def progress(done, total):
+        print(f"\r{done:,.0f}/{total:,.0f} s", end="", flush=True)
+
+    report = run_load_test(args.sessions, args.duration, _parse_mix(args.mix) if args.mix else None,
+                           args.think, url, args.pid, args.app, args.seed, progress)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=1)
+    r, server = report["reruns"], report["server"]
+    print(f"\n{r['count']:,} reruns · {report['throughput']:.1f}/s · p50 {r['p50'] * 1e3:,.0f} ms · "
+          f"p95 {r['p95'] * 1e3:,.0f} ms · p99 {r['p99'] * 1e3:,.0f} ms · {len(report['errors'])} app errors · "
+          f"{len(report['failures'])} failed sessions")
+    for name, s in report["by_action"].items():
+        print(f"  {name:11} {s['count']:6,} · p50 {s['p50'] * 1e3:7,.0f} ms · p95 {s['p95'] * 1e3:7,.0f} ms · "
+              f"p99 {s['p99'] * 1e3:7,.0f} ms")
+    if server:
+        print(f"server · {server['cpu_cores']} cores busy · RSS {server['rss_idle_mb']} → {server['rss_peak_mb']} MB "
+              f"· {server['rss_per_session_mb']} MB per session")
+    print(f"wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
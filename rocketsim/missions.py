@@ -0,0 +1,464 @@
+"""Mission catalog: built-in sample data, columnar file loaders and incremental appends."""
+
+import hashlib
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from rocketsim.aggregates import SUMMARY_COLUMNS, MissionCube, TypeStats
+
+# ── Schema ────────────────────────────────────────────────────────────────────
+# Explicit compact dtypes so million-row catalogs stay small in memory.
+MISSION_SCHEMA = {
+    "name":      "string",
+    "type":      "category",
+    "year":      "int16",
+    "payload":   "float32",    # kg
+    "fuel":      "float32",    # kg
+    "cost":      "float32",    # $M
+    "duration":  "int32",      # days
+    "distance":  "float64",    # km, up to ~6e9
+    "crew":      "int8",
+    "success":   "bool",
+    "sci_yield": "int8",
+}
+# Derived column -> source column it is computed from.
+DERIVED_COLUMNS = {"fuel_tonnes": "fuel", "success_label": "success"}
+SUCCESS_LABELS = pd.CategoricalDtype(["Failure", "Success"])
+
+# Columns each dashboard tab reads; pass one to `load_missions(columns=...)`.
+TAB_COLUMNS = {
+    "overview": ["name", "type", "year", "payload", "fuel_tonnes", "cost", "success",
+                 "success_label", "distance", "duration"],
+    "analysis": ["name", "type", "year", "cost", "crew", "success", "success_label", "sci_yield"],
+    "insights": ["type", "payload", "cost"],
+}
+APP_COLUMNS = list(dict.fromkeys(c for cols in TAB_COLUMNS.values() for c in cols))
+
+# Published launch cost per kg to LEO by rocket family, USD.
+COST_PER_KG_TO_LEO = {
+    "Falcon 9":       2780,
+    "Atlas V":        8500,
+    "Delta IV Heavy": 13000,
+    "SLS":            54500,
+    "Falcon Heavy":   1900,
+    "Electron":       7500,
+}
+
+# Missions per chunk when a catalog is streamed rather than loaded whole.
+CHUNK_ROWS = 250_000
+
+FILE_FORMATS = {
+    ".parquet": "parquet", ".pq": "parquet",
+    ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow",
+    ".csv": "csv",
+}
+
+
+# ── Built-in sample catalog ───────────────────────────────────────────────────
+BUILTIN_MISSIONS = [
+    # ISS Resupply
+    dict(name="CRS-1",      type="ISS",        year=2012, payload=905,   fuel=505000, cost=133,  duration=18,      distance=7700,       crew=0, success=True,  sci_yield=2),
+    dict(name="CRS-3",      type="ISS",        year=2014, payload=2095,  fuel=510000, cost=139,  duration=35,      distance=15500,      crew=0, success=True,  sci_yield=3),
+    dict(name="CRS-5",      type="ISS",        year=2015, payload=1898,  fuel=508000, cost=141,  duration=28,      distance=12200,      crew=0, success=True,  sci_yield=3),
+    dict(name="CRS-7",      type="ISS",        year=2015, payload=1898,  fuel=512000, cost=143,  duration=0,       distance=0,          crew=0, success=False, sci_yield=0),
+    dict(name="CRS-9",      type="ISS",        year=2016, payload=2257,  fuel=515000, cost=150,  duration=34,      distance=14800,      crew=0, success=True,  sci_yield=4),
+    dict(name="CRS-11",     type="ISS",        year=2017, payload=2708,  fuel=520000, cost=152,  duration=27,      distance=11800,      crew=0, success=True,  sci_yield=3),
+    dict(name="CRS-13",     type="ISS",        year=2017, payload=2205,  fuel=518000, cost=148,  duration=29,      distance=12600,      crew=0, success=True,  sci_yield=3),
+    dict(name="CRS-15",     type="ISS",        year=2018, payload=2697,  fuel=521000, cost=153,  duration=33,      distance=14400,      crew=0, success=True,  sci_yield=4),
+    dict(name="CRS-17",     type="ISS",        year=2019, payload=2490,  fuel=519000, cost=155,  duration=27,      distance=11800,      crew=0, success=True,  sci_yield=3),
+    dict(name="CRS-20",     type="ISS",        year=2020, payload=1977,  fuel=516000, cost=157,  duration=62,      distance=27000,      crew=0, success=True,  sci_yield=5),
+    dict(name="CRS-22",     type="ISS",        year=2021, payload=3328,  fuel=525000, cost=162,  duration=91,      distance=39700,      crew=0, success=True,  sci_yield=6),
+    dict(name="CRS-24",     type="ISS",        year=2022, payload=3005,  fuel=523000, cost=165,  duration=34,      distance=14800,      crew=0, success=True,  sci_yield=4),
+    # Scientific
+    dict(name="Mars Odyssey",  type="Scientific", year=2001, payload=376,  fuel=340000, cost=297,  duration=2373, distance=460000000,  crew=0, success=True,  sci_yield=9),
+    dict(name="Mars Express",  type="Scientific", year=2003, payload=666,  fuel=365000, cost=330,  duration=7300, distance=400000000,  crew=0, success=True,  sci_yield=9),
+    dict(name="MER-A Spirit",  type="Scientific", year=2003, payload=185,  fuel=330000, cost=400,  duration=2555, distance=480000000,  crew=0, success=True,  sci_yield=10),
+    dict(name="Cassini",       type="Scientific", year=2004, payload=2523, fuel=720000, cost=3270, duration=7300, distance=1500000000, crew=0, success=True,  sci_yield=10),
+    dict(name="New Horizons",  type="Scientific", year=2006, payload=478,  fuel=290000, cost=700,  duration=3468, distance=5900000000, crew=0, success=True,  sci_yield=10),
+    dict(name="Phoenix",       type="Scientific", year=2007, payload=350,  fuel=280000, cost=420,  duration=300,  distance=680000000,  crew=0, success=True,  sci_yield=7),
+    dict(name="LRO",           type="Scientific", year=2009, payload=1916, fuel=340000, cost=583,  duration=1825, distance=384000,     crew=0, success=True,  sci_yield=8),
+    dict(name="Curiosity",     type="Scientific", year=2011, payload=899,  fuel=440000, cost=2500, duration=4380, distance=560000000,  crew=0, success=True,  sci_yield=10),
+    dict(name="MAVEN",         type="Scientific", year=2013, payload=809,  fuel=420000, cost=671,  duration=3650, distance=710000000,  crew=0, success=True,  sci_yield=8),
+    dict(name="OSIRIS-REx",    type="Scientific", year=2016, payload=2110, fuel=550000, cost=800,  duration=2555, distance=270000000,  crew=0, success=True,  sci_yield=9),
+    dict(name="InSight",       type="Scientific", year=2018, payload=694,  fuel=310000, cost=813,  duration=1460, distance=485000000,  crew=0, success=True,  sci_yield=8),
+    dict(name="Perseverance",  type="Scientific", year=2020, payload=1025, fuel=450000, cost=2700, duration=1460, distance=500000000,  crew=0, success=True,  sci_yield=10),
+    dict(name="DART",          type="Scientific", year=2021, payload=610,  fuel=290000, cost=330,  duration=365,  distance=11000000,   crew=0, success=True,  sci_yield=7),
+    # Commercial
+    dict(name="AsiaSat 6",    type="Commercial", year=2014, payload=4200,  fuel=525000,  cost=62,  duration=0,  distance=35786, crew=0, success=True,  sci_yield=1),
+    dict(name="Eutelsat 115W",type="Commercial", year=2015, payload=4707,  fuel=538000,  cost=65,  duration=0,  distance=35786, crew=0, success=True,  sci_yield=1),
+    dict(name="SES-9",        type="Commercial", year=2016, payload=5271,  fuel=545000,  cost=70,  duration=0,  distance=35786, crew=0, success=True,  sci_yield=1),
+    dict(name="Iridium-1",    type="Commercial", year=2017, payload=9600,  fuel=560000,  cost=82,  duration=1,  distance=780,   crew=0, success=True,  sci_yield=2),
+    dict(name="Arabsat-6A",   type="Commercial", year=2019, payload=6465,  fuel=1150000, cost=150, duration=0,  distance=35786, crew=0, success=True,  sci_yield=1),
+    dict(name="Starlink-1",   type="Commercial", year=2019, payload=15400, fuel=550000,  cost=50,  duration=0,  distance=550,   crew=0, success=True,  sci_yield=1),
+    dict(name="Starlink-10",  type="Commercial", year=2020, payload=15400, fuel=548000,  cost=50,  duration=0,  distance=550,   crew=0, success=True,  sci_yield=1),
+    dict(name="ViaSat-3",     type="Commercial", year=2023, payload=6400,  fuel=1160000, cost=165, duration=1,  distance=35786, crew=0, success=True,  sci_yield=2),
+    dict(name="Astra-1P",     type="Commercial", year=2024, payload=5200,  fuel=530000,  cost=68,  duration=0,  distance=35786, crew=0, success=True,  sci_yield=1),
+    # Military
+    dict(name="USA-193",    type="Military", year=2006, payload=2300, fuel=490000, cost=800,  duration=1, distance=350,   crew=0, success=False, sci_yield=1),
+    dict(name="WGS-1",      type="Military", year=2007, payload=5987, fuel=542000, cost=350,  duration=1, distance=35786, crew=0, success=True,  sci_yield=1),
+    dict(name="MUOS-1",     type="Military", year=2012, payload=6740, fuel=555000, cost=500,  duration=1, distance=35786, crew=0, success=True,  sci_yield=1),
+    dict(name="GPS-IIF-4",  type="Military", year=2013, payload=1630, fuel=440000, cost=120,  duration=1, distance=20200, crew=0, success=True,  sci_yield=2),
+    dict(name="SBIRS Geo-3",type="Military", year=2017, payload=4500, fuel=535000, cost=1400, duration=1, distance=35786, crew=0, success=True,  sci_yield=2),
+    dict(name="USA-290",    type="Military", year=2019, payload=3800, fuel=520000, cost=950,  duration=1, distance=35786, crew=0, success=True,  sci_yield=1),
+    dict(name="GPS-III SV04",type="Military",year=2021, payload=4311, fuel=530000, cost=500,  duration=1, distance=20200, crew=0, success=True,  sci_yield=2),
+    dict(name="AEHF-6",     type="Military", year=2020, payload=6170, fuel=548000, cost=2000, duration=1, distance=35786, crew=0, success=True,  sci_yield=1),
+    # Lunar / Crewed
+    dict(name="Crew Dragon DM-2",type="Lunar", year=2020, payload=12200, fuel=549000, cost=55,   duration=62,  distance=8500,  crew=2, success=True, sci_yield=7),
+    dict(name="Crew-1",          type="Lunar", year=2020, payload=12200, fuel=549000, cost=55,   duration=167, distance=72000, crew=4, success=True, sci_yield=8),
+    dict(name="Crew-2",          type="Lunar", year=2021, payload=12200, fuel=549000, cost=55,   duration=199, distance=86000, crew=4, success=True, sci_yield=8),
+    dict(name="Crew-3",          type="Lunar", year=2021, payload=12200, fuel=549000, cost=55,   duration=175, distance=76000, crew=4, success=True, sci_yield=8),
+    dict(name="Artemis I",       type="Lunar", year=2022, payload=27000, fuel=2770000,cost=4100, duration=25,  distance=450000,crew=0, success=True, sci_yield=9),
+    dict(name="Crew-4",          type="Lunar", year=2022, payload=12200, fuel=549000, cost=55,   duration=170, distance=74000, crew=4, success=True, sci_yield=8),
+    dict(name="Crew-5",          type="Lunar", year=2022, payload=12200, fuel=549000, cost=55,   duration=157, distance=68000, crew=4, success=True, sci_yield=8),
+    dict(name="Crew-6",          type="Lunar", year=2023, payload=12200, fuel=549000, cost=55,   duration=186, distance=81000, crew=4, success=True, sci_yield=9),
+]
+
+
+# ── Loaders ───────────────────────────────────────────────────────────────────
+def _source_columns(columns):
+    if columns is None:
+        return None
+    wanted = [DERIVED_COLUMNS.get(c, c) for c in columns]
+    return list(dict.fromkeys(c for c in wanted if c in MISSION_SCHEMA))
+
+
+def _read_arrow_table(path, fmt, columns):
+    try:
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(f"reading {fmt} mission files requires pyarrow") from exc
+    # Memory-mapped reads let the OS share the file's pages between server
+    # processes instead of each one copying it onto its heap.
+    if fmt == "parquet":
+        return pq.read_table(path, columns=columns, memory_map=True)
+    return feather.read_table(path, columns=columns, memory_map=True)
+
+
+def apply_schema(df, columns=None):
+    """Cast to `MISSION_SCHEMA` and add the derived columns that are requested."""
+    df = df.astype({c: t for c, t in MISSION_SCHEMA.items() if c in df.columns}, copy=False)
+    wanted = columns or list(df.columns) + list(DERIVED_COLUMNS)
+    if "fuel_tonnes" in wanted and "fuel" in df.columns:
+        df["fuel_tonnes"] = df["fuel"] / 1000
+    if "success_label" in wanted and "success" in df.columns:
+        df["success_label"] = pd.Categorical.from_codes(df["success"].astype("int8"), dtype=SUCCESS_LABELS)
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    return df
+
+
+def load_missions(source=None, columns=None):
+    """Load the mission catalog with the compact schema applied.
+
+    `source` is None for the built-in sample, or a Parquet, Arrow/Feather or
+    CSV path. `columns` projects the read onto just those columns (derived
+    ones pull in their source column), so a tab only pays for what it shows.
+    """
+    read_cols = _source_columns(columns)
+    if source is None:
+        df = pd.DataFrame(BUILTIN_MISSIONS)
+        if read_cols is not None:
+            df = df[read_cols]
+        return apply_schema(df, columns)
+
+    fmt = FILE_FORMATS.get(os.path.splitext(str(source))[1].lower())
+    if fmt is None:
+        raise ValueError(f"unsupported mission file {source!r}, expected one of {sorted(FILE_FORMATS)}")
+    if fmt == "csv":
+        df = pd.read_csv(source, usecols=read_cols,
+                         dtype={c: t for c, t in MISSION_SCHEMA.items() if t != "bool"})
+    else:
+        df = _read_arrow_table(source, fmt, read_cols).to_pandas(split_blocks=True)
+    return apply_schema(df, columns)
+
+
+def iter_missions(source=None, columns=None, chunk_rows=CHUNK_ROWS):
+    """Yield the catalog as frames of at most `chunk_rows` missions, schema applied.
+
+    Like `load_missions`, but Parquet and Arrow record batches and CSV
+    blocks are read one chunk at a time, so memory is bounded by the chunk
+    however large the file. `source` may also be a loaded frame, which is
+    sliced without copying.
+    """
+    if source is None or isinstance(source, pd.DataFrame):
+        df = load_missions(None, columns) if source is None else source
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows]
+        return
+
+    read_cols = _source_columns(columns)
+    fmt = FILE_FORMATS.get(os.path.splitext(str(source))[1].lower())
+    if fmt is None:
+        raise ValueError(f"unsupported mission file {source!r}, expected one of {sorted(FILE_FORMATS)}")
+    if fmt == "csv":
+        with pd.read_csv(source, usecols=read_cols, chunksize=chunk_rows,
+                         dtype={c: t for c, t in MISSION_SCHEMA.items() if t != "bool"}) as reader:
+            for chunk in reader:
+                yield apply_schema(chunk, columns)
+        return
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(f"reading {fmt} mission files requires pyarrow") from exc
+    if fmt == "parquet":
+        batches = pq.ParquetFile(source, memory_map=True).iter_batches(chunk_rows, columns=read_cols)
+    else:
+        reader = pa.ipc.open_file(pa.memory_map(str(source)))
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    for batch in batches:
+        if read_cols is not None:
+            batch = batch.select(read_cols)
+        for start in range(0, batch.num_rows, chunk_rows):
+            yield apply_schema(batch.slice(start, chunk_rows).to_pandas(), columns)
+
+
+def scan_type_stats(source=None, chunk_rows=CHUNK_ROWS, relative_error=0.01):
+    """`TypeStats` of a catalog file or frame, merged chunk by chunk from `iter_missions`."""
+    stats = TypeStats(relative_error=relative_error)
+    for chunk in iter_missions(source, SUMMARY_COLUMNS, chunk_rows):
+        stats = stats.merge(TypeStats.from_frame(chunk, relative_error))
+    return stats
+
+
+def write_missions(df, path):
+    """Write a catalog in the format implied by `path`'s extension."""
+    fmt = FILE_FORMATS.get(os.path.splitext(str(path))[1].lower())
+    df = apply_schema(df[[c for c in MISSION_SCHEMA if c in df.columns]])
+    if fmt == "parquet":
+        df.to_parquet(path, index=False)
+    elif fmt == "arrow":
+        df.reset_index(drop=True).to_feather(path)
+    elif fmt == "csv":
+        df.to_csv(path, index=False)
+    else:
+        raise ValueError(f"unsupported mission file {path!r}, expected one of {sorted(FILE_FORMATS)}")
+
+
+def synthetic_missions(n_rows, seed=0):
+    """`n_rows` missions resampled from the built-in sample, deterministic per `seed`.
+
+    Numeric columns get lognormal jitter and years are redrawn, so the
+    filters and charts see realistic spread at any scale; names stay unique.
+    """
+    rng = np.random.default_rng(seed)
+    base = pd.DataFrame(BUILTIN_MISSIONS)
+    df = base.iloc[rng.integers(0, len(base), n_rows)].reset_index(drop=True)
+    for col in ("payload", "fuel", "cost", "distance"):
+        df[col] = df[col] * rng.lognormal(0.0, 0.2, n_rows)
+    df["duration"] = np.rint(df["duration"] * rng.lognormal(0.0, 0.2, n_rows)).astype("int64")
+    df["year"] = rng.integers(2000, 2025, n_rows)
+    df["name"] = df["name"] + " #" + pd.Series(np.arange(n_rows)).astype(str)
+    return apply_schema(df[list(MISSION_SCHEMA)])
+
+
+def catalog_fingerprint(df):
+    """Short content hash of a catalog, for keying caches on the data version."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=8)
+    digest.update(",".join(df.columns).encode())
+    return digest.hexdigest()
+
+
+# ── Filter index ──────────────────────────────────────────────────────────────
+class MissionIndex:
+    """Year-sorted layout of the catalog for the Overview filters.
+
+    `by_year` holds every row ordered by year; per type, an array of row
+    positions into it lists that type's rows (already in year order) with an
+    offset table per type. A (mission_type, year_max) selection is then one
+    binary search: "All" is a positional slice of `by_year`, a view with no
+    copy, and a single type gathers its selected rows. Besides the catalog
+    this keeps one sorted copy of it and two integer arrays over its rows for
+    O(log n) filters; the LRU of recent selections also holds the gathered
+    per-type frames.
+    """
+
+    def __init__(self, df):
+        self.by_year = df.iloc[np.argsort(df["year"].to_numpy(), kind="stable")]
+        self._group_types()
+
+    def _group_types(self):
+        self._years = self.by_year["year"].to_numpy()
+        types = self.by_year["type"].astype(str).to_numpy()
+        self.types = sorted(pd.unique(types).tolist())
+        # Small integer codes sort stably in linear time, so each group keeps `by_year`'s order.
+        codes = pd.Categorical(types, categories=self.types).codes
+        self._type_rows = np.argsort(codes, kind="stable")
+        self._type_years = self._years[self._type_rows]
+        sorted_codes = codes[self._type_rows]
+        self._offsets = {
+            t: (int(np.searchsorted(sorted_codes, i, side="left")),
+                int(np.searchsorted(sorted_codes, i, side="right")))
+            for i, t in enumerate(self.types)
+        }
+        self.select = lru_cache(maxsize=64)(self._select)
+
+    def append(self, df):
+        """A new index over these rows followed by `df`'s, without re-sorting the catalog.
+
+        Only the new rows are sorted by year; each is then placed after the
+        existing rows of the same year, so the layout matches a full rebuild
+        and the merge costs one linear copy plus a linear regrouping by type.
+        """
+        new = df.iloc[np.argsort(df["year"].to_numpy(), kind="stable")]
+        index = object.__new__(MissionIndex)
+        index.by_year = _merge(self.by_year, new, np.searchsorted(self._years, new["year"].to_numpy(), side="right"))
+        index._group_types()
+        return index
+
+    def _select(self, mission_type="All", year_max=None):
+        if mission_type in (None, "All"):
+            end = len(self._years) if year_max is None else int(np.searchsorted(self._years, year_max, side="right"))
+            return self.by_year.iloc[:end]
+        if mission_type not in self._offsets:
+            return self.by_year.iloc[:0]
+        lo, hi = self._offsets[mission_type]
+        end = hi if year_max is None else lo + int(np.searchsorted(self._type_years[lo:hi], year_max, side="right"))
+        return self.by_year.iloc[self._type_rows[lo:end]]
+
+
+def _merge(old, new, positions):
+    # Rows of `new` inserted into `old` before the given positions, in order.
+    order = np.insert(np.arange(len(old)), positions, np.arange(len(old), len(old) + len(new)))
+    return concat_missions([old, new], ignore_index=False).iloc[order]
+
+
+def concat_missions(frames, ignore_index=True):
+    """`pd.concat` that keeps "type" categorical when the frames saw different types."""
+    frames = [f for f in frames if len(f.columns)]
+    if all(isinstance(f["type"].dtype, pd.CategoricalDtype) for f in frames if "type" in f.columns):
+        categories = list(dict.fromkeys(c for f in frames if "type" in f.columns for c in f["type"].cat.categories))
+        frames = [f.assign(type=f["type"].cat.set_categories(categories)) if "type" in f.columns else f
+                  for f in frames]
+    return pd.concat(frames, ignore_index=ignore_index)
+
+
+# ── Catalog bundle ────────────────────────────────────────────────────────────
+class Catalog(NamedTuple):
+    data: pd.DataFrame
+    index: MissionIndex
+    cube: MissionCube
+    stats: TypeStats    # per-type distributions for the Insights views
+    version: str        # `catalog_fingerprint` of `data`
+    seconds: float      # wall time to load and index
+
+
+def load_catalog(source=None, columns=None):
+    """`load_missions` plus everything the dashboard derives from the frame once."""
+    start = time.perf_counter()
+    df = load_missions(source, columns)
+    return Catalog(df, MissionIndex(df), MissionCube(df), scan_type_stats(df), catalog_fingerprint(df),
+                   time.perf_counter() - start)
+
+
+# ── Incremental ingestion ─────────────────────────────────────────────────────
+def _check_columns(catalog, new):
+    missing = [c for c in _source_columns(list(catalog.data.columns)) if c not in new.columns]
+    if missing:
+        raise ValueError(f"appended missions lack columns {missing}")
+
+
+def append_catalog(catalog, new):
+    """`catalog` plus the missions in the frame `new`, derived incrementally.
+
+    The index merges the new rows in, the cube and the type stats add their
+    counts, sums and sketches, and the version chains the previous one with the new rows' fingerprint,
+    so nothing is recomputed over the existing rows. `catalog` is unchanged.
+    """
+    columns = list(catalog.data.columns)
+    _check_columns(catalog, new)
+    new = apply_schema(new[[c for c in MISSION_SCHEMA if c in new.columns]], columns)
+    data = concat_missions([catalog.data, new])
+    added = data.iloc[len(catalog.data):]
+    version = hashlib.blake2b(f"{catalog.version}+{catalog_fingerprint(added)}".encode(), digest_size=8)
+    return catalog._replace(data=data, index=catalog.index.append(added), cube=catalog.cube.append(added),
+                            stats=catalog.stats.merge(scan_type_stats(added)), version=version.hexdigest())
+
+
+class CatalogStore:
+    """The live catalog, grown by `append` and by files dropped into an inbox.
+
+    Each append builds the next `Catalog` from the current one and swaps it
+    in, so readers always get one consistent version and a cold reload is
+    never needed. Inbox files are read in modification order and stay in
+    place: a restarted process loads the base catalog and replays the inbox.
+    Each file's rows are appended once: a file that grows contributes only
+    its new rows, and one whose already appended rows change is rejected
+    rather than appended again. Write a file elsewhere and rename it in,
+    since a file is read as soon as it appears; files that fail to load are
+    kept in `rejected`.
+    """
+
+    def __init__(self, catalog, inbox=None, poll_seconds=2.0):
+        self.catalog = catalog
+        self.inbox = inbox
+        self.poll_seconds = poll_seconds
+        self.ingested = {}      # inbox file -> rows appended from it, in first-append order
+        self.rejected = {}      # inbox file -> error
+        self._files = {}        # inbox file -> ((mtime_ns, size) last read, rows consumed, their fingerprint)
+        self._polled = None
+        self._lock = threading.Lock()
+
+    def append(self, new):
+        """Append the missions in the frame `new` and return the resulting catalog."""
+        with self._lock:
+            self.catalog = append_catalog(self.catalog, new)
+            return self.catalog
+
+    def _inbox_files(self):
+        try:
+            entries = [e for e in os.scandir(self.inbox)
+                       if e.is_file() and not e.name.startswith(".")
+                       and os.path.splitext(e.name)[1].lower() in FILE_FORMATS]
+        except FileNotFoundError:
+            return []
+        files = [(e.stat().st_mtime_ns, e.name, e.stat().st_size) for e in entries]
+        return [f for f in sorted(files) if self._files.get(f[1], (None,))[0] != (f[0], f[2])]
+
+    def _new_rows(self, name, frame):
+        # Rows of inbox file `name` not yet appended; raises if appended ones changed.
+        _, consumed, digest = self._files.get(name, (None, 0, None))
+        if consumed and (len(frame) < consumed or catalog_fingerprint(frame.iloc[:consumed]) != digest):
+            raise ValueError(f"file changed after {consumed:,} of its rows were appended; "
+                             "inbox files may only grow by appending rows")
+        return frame.iloc[consumed:]
+
+    def refresh(self):
+        """Append new inbox files, checking at most every `poll_seconds`; returns the current catalog."""
+        if self.inbox is None or (self._polled is not None and time.monotonic() - self._polled < self.poll_seconds):
+            return self.catalog
+        if not self._lock.acquire(blocking=False):
+            return self.catalog  # another session is appending; it will swap in the result
+        try:
+            self._polled = time.monotonic()
+            frames = []
+            for mtime_ns, name, size in self._inbox_files():
+                entry = self._files.get(name, (None, 0, None))
+                self._files[name] = ((mtime_ns, size),) + entry[1:]
+                try:
+                    frame = load_missions(os.path.join(self.inbox, name))
+                    _check_columns(self.catalog, frame)
+                    new = self._new_rows(name, frame)
+                except Exception as exc:  # one bad drop must not take the app down
+                    self.rejected[name] = f"{type(exc).__name__}: {exc}"
+                    continue
+                self.rejected.pop(name, None)
+                self._files[name] = ((mtime_ns, size), len(frame), catalog_fingerprint(frame))
+                if len(new):
+                    frames.append(new)
+                    self.ingested[name] = self.ingested.get(name, 0) + len(new)
+            if frames:
+                self.catalog = append_catalog(self.catalog, concat_missions(frames))
+        finally:
+            self._lock.release()
+        return self.catalog
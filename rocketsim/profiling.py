@@ -0,0 +1,286 @@
+"""Opt-in wall-time and allocation profiling of named sections of a rerun.
+
+Off by default; set ``ROCKET_PROFILE=1`` to time sections and trace their
+allocations (``ROCKET_PROFILE_MEMORY=0`` keeps the timings but skips
+tracemalloc, which makes allocation-heavy code such as a catalog load
+several times slower while it runs). With
+``ROCKET_PROFILE_PATH`` the process-wide metrics are also written to that
+file, as JSON for a ``.json`` path and Prometheus text otherwise.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import NamedTuple
+
+_OFF = contextlib.nullcontext()
+SESSION_WINDOW = 300    # s a session counts as active after its last rerun
+
+
+class SectionStats(NamedTuple):
+    name: str
+    calls: int
+    seconds: float      # inclusive of nested sections
+    alloc_bytes: int    # net traced allocations left behind
+    peak_bytes: int     # highest traced memory above the section's start
+
+
+class FragmentRerun(NamedTuple):
+    name: str
+    seconds: float
+    sections: list      # SectionStats, slowest first
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start", "start_mem", "peak")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler._stack()
+        if self.profiler.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:  # keep the enclosing section's peak before resetting it
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self.start_mem = self.peak = current
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        stack = self.profiler._stack()
+        stack.pop()
+        alloc = peak = 0
+        if self.profiler.trace_memory:
+            current, traced_peak = tracemalloc.get_traced_memory()
+            self.peak = max(self.peak, traced_peak)
+            alloc, peak = current - self.start_mem, self.peak - self.start_mem
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, self.peak)
+        self.profiler.record(self.name, seconds, alloc, peak)
+        return False
+
+
+class Profiler:
+    """Process-wide section timings, plus a per-rerun view for the thread running it.
+
+    `section(name)` is a context manager; when the profiler is disabled it
+    is a shared no-op, so instrumented code costs nothing in production.
+    Sections recorded between `begin_rerun` and `end_rerun` on the same
+    thread, or inside `fragment` for a fragment rerun, also make up that
+    rerun's breakdown. tracemalloc counts the whole process, so allocations
+    of concurrent reruns blur into each other.
+    """
+
+    def __init__(self, enabled=False, trace_memory=True, path=None):
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.path = path
+        self.reruns = 0
+        self.rerun_seconds = 0.0
+        self._totals = {}       # name -> [calls, seconds, alloc, max seconds]
+        self._sessions = {}     # session id -> last rerun, epoch s
+        self._fragments = {}    # session id -> fragment name -> its latest FragmentRerun
+        self._fragment_totals = {}  # fragment name -> [reruns, seconds]
+        self._captured = {}     # capture key -> SectionStats recorded under it
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @classmethod
+    def from_env(cls, prefix="ROCKET_"):
+        def flag(name, default):
+            return os.environ.get(prefix + name, default).lower() in ("1", "true", "yes", "on")
+
+        return cls(flag("PROFILE", "0"), flag("PROFILE_MEMORY", "1"), os.environ.get(prefix + "PROFILE_PATH"))
+
+    def section(self, name):
+        return _Section(self, name) if self.enabled else _OFF
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def record(self, name, seconds, alloc_bytes=0, peak_bytes=0):
+        with self._lock:
+            total = self._totals.setdefault(name, [0, 0.0, 0, 0.0])
+            total[0] += 1
+            total[1] += seconds
+            total[2] += alloc_bytes
+            total[3] = max(total[3], seconds)
+        rerun = getattr(self._local, "rerun", None)
+        if rerun is not None:
+            _add(rerun, name, 1, seconds, alloc_bytes, peak_bytes)
+
+    # ── Reruns and sessions ──────────────────────────────────────────────────
+    def begin_rerun(self, session_id=None):
+        if not self.enabled:
+            return
+        self._local.rerun = {}
+        with self._lock:
+            self._sessions[session_id] = time.time()
+
+    def end_rerun(self, seconds):
+        """This thread's `SectionStats` since `begin_rerun`, slowest first."""
+        rerun = getattr(self._local, "rerun", None)
+        self._local.rerun = None
+        if rerun is None:
+            return []
+        with self._lock:
+            self.reruns += 1
+            self.rerun_seconds += seconds
+        return _sorted(rerun)
+
+    @contextlib.contextmanager
+    def fragment(self, name, session_id=None, alone=True):
+        """Open a rerun record around a fragment body that Streamlit reruns `alone`.
+
+        Fragment reruns skip the script's own `begin_rerun`/`end_rerun`; their
+        breakdown is kept per session for `fragment_reruns`. Inside a full
+        rerun, or a fragment nested in one being rerun, this adds nothing.
+        """
+        if not self.enabled or not alone or getattr(self._local, "fragment", None) is not None:
+            yield
+            return
+        self.begin_rerun(session_id)
+        self._local.fragment = name
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            self._local.fragment = None
+            sections = _sorted(self._local.rerun)
+            self._local.rerun = None
+            with self._lock:
+                total = self._fragment_totals.setdefault(name, [0, 0.0])
+                total[0] += 1
+                total[1] += seconds
+                self._fragments.setdefault(session_id, {})[name] = FragmentRerun(name, seconds, sections)
+
+    def fragment_reruns(self, session_id=None):
+        """The latest `FragmentRerun` of each fragment this session reran on its own, slowest first."""
+        with self._lock:
+            return sorted(self._fragments.get(session_id, {}).values(), key=lambda f: -f.seconds)
+
+    # ── Work on other threads ────────────────────────────────────────────────
+    @contextlib.contextmanager
+    def capture(self, key):
+        """Keep the sections this thread records inside the block under `key`.
+
+        For work a worker thread does on a session's behalf: the session
+        that waits on it calls `attach(key)` to count it in its own rerun.
+        """
+        if not self.enabled:
+            yield
+            return
+        outer = getattr(self._local, "rerun", None)
+        self._local.rerun = captured = {}
+        try:
+            yield
+        finally:
+            self._local.rerun = outer
+            with self._lock:
+                self._captured[key] = _sorted(captured)
+
+    def attach(self, key):
+        """Add the sections captured under `key` to this thread's rerun; the process totals already have them."""
+        rerun = getattr(self._local, "rerun", None)
+        if rerun is None:
+            return
+        with self._lock:
+            captured = self._captured.get(key, ())
+        for s in captured:
+            _add(rerun, *s)
+
+    def sessions(self, window=SESSION_WINDOW):
+        """(sessions with a rerun in the last `window` s, sessions seen since start)."""
+        now = time.time()
+        with self._lock:
+            return sum(now - seen < window for seen in self._sessions.values()), len(self._sessions)
+
+    # ── Export ───────────────────────────────────────────────────────────────
+    def snapshot(self, caches=None):
+        """Process-wide metrics as a JSON-ready dict; `caches` maps names to `ResultCache.stats()`-style dicts."""
+        active, seen = self.sessions()
+        with self._lock:
+            sections = {name: dict(calls=c, seconds=round(s, 6), alloc_bytes=a, max_seconds=round(m, 6))
+                        for name, (c, s, a, m) in sorted(self._totals.items())}
+            reruns = dict(count=self.reruns, seconds=round(self.rerun_seconds, 6))
+            fragments = {name: dict(reruns=c, seconds=round(s, 6))
+                         for name, (c, s) in sorted(self._fragment_totals.items())}
+        return dict(time=time.time(), sessions=dict(active=active, seen=seen), reruns=reruns,
+                    fragments=fragments, sections=sections, caches=caches or {})
+
+    def to_prometheus(self, caches=None):
+        snap = self.snapshot(caches)
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP rocket_{name} {help_text}")
+            lines.append(f"# TYPE rocket_{name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                lines.append(f"rocket_{name}{{{label_text}}} {value}" if label_text else f"rocket_{name} {value}")
+
+        metric("sessions_active", "gauge", f"Sessions with a rerun in the last {SESSION_WINDOW} s.",
+               [({}, snap["sessions"]["active"])])
+        metric("sessions_seen_total", "counter", "Sessions seen since the process started.",
+               [({}, snap["sessions"]["seen"])])
+        metric("reruns_total", "counter", "Completed full-script reruns.", [({}, snap["reruns"]["count"])])
+        metric("rerun_seconds_total", "counter", "Wall time of completed full-script reruns.",
+               [({}, snap["reruns"]["seconds"])])
+        metric("fragment_reruns_total", "counter", "Reruns of each fragment on its own.",
+               [({"fragment": f}, v["reruns"]) for f, v in snap["fragments"].items()])
+        metric("fragment_rerun_seconds_total", "counter", "Wall time of each fragment's own reruns.",
+               [({"fragment": f}, v["seconds"]) for f, v in snap["fragments"].items()])
+        for key, name, kind, help_text in (
+            ("calls", "section_calls_total", "counter", "Times each profiled section ran."),
+            ("seconds", "section_seconds_total", "counter", "Wall time in each section, nested sections included."),
+            ("alloc_bytes", "section_alloc_bytes_total", "counter", "Net traced allocations left by each section."),
+            ("max_seconds", "section_max_seconds", "gauge", "Slowest single run of each section."),
+        ):
+            metric(name, kind, help_text, [({"section": s}, v[key]) for s, v in snap["sections"].items()])
+        for key, kind in (("hits", "counter"), ("disk_hits", "counter"), ("misses", "counter"),
+                          ("evictions", "counter"), ("entries", "gauge"), ("bytes", "gauge"),
+                          ("hit_rate", "gauge")):
+            samples = [({"cache": c}, v[key]) for c, v in snap["caches"].items() if key in v]
+            if samples:
+                suffix = "_total" if kind == "counter" else ""
+                metric(f"cache_{key}{suffix}", kind, f"Cache {key.replace('_', ' ')}.", samples)
+        return "\n".join(lines) + "\n"
+
+    def write(self, caches=None, path=None):
+        """Write the metrics to `path` (default `self.path`), replacing the file atomically."""
+        path = path or self.path
+        if path.lower().endswith(".json"):
+            text = json.dumps(self.snapshot(caches), indent=1)
+        else:
+            text = self.to_prometheus(caches)
+        partial = f"{path}.partial.{threading.get_ident()}"
+        with open(partial, "w") as f:
+            f.write(text)
+        os.replace(partial, path)
+
+
+def _add(rerun, name, calls, seconds, alloc_bytes, peak_bytes):
+    c, s, alloc, peak = rerun.get(name, (0, 0.0, 0, 0))
+    rerun[name] = (c + calls, s + seconds, alloc + alloc_bytes, max(peak, peak_bytes))
+
+
+def _sorted(rerun):
+    return sorted((SectionStats(name, *v) for name, v in rerun.items()), key=lambda s: -s.seconds)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,120 @@
+"""Replay of catalog missions through the launch model.
+
+Each mission's recorded payload and fuel become a slider configuration: the
+catalog has no engine data, so every vehicle gets the same liftoff
+thrust-to-weight ratio, specific impulse and tankage mass per tonne of
+fuel, which fix its thrust, burn rate and dry mass. Distinct configurations run once, as vectorized batches spread over
+a process pool, and the predicted apogee and orbit reachability come back
+as columns aligned with the catalog:
+
+    python -m rocketsim.replay missions.parquet --out replay.parquet
+    python -m rocketsim.replay missions.csv --out replay.csv --method closed --workers 1
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from rocketsim.envelope import AXES, flight_metrics
+from rocketsim.simulation import G0, STRUCTURE_KG
+
+LIFTOFF_TWR = 1.4       # thrust / weight at ignition
+ISP_S = 300             # s, specific impulse
+TANK_FRACTION = 0.1     # stage dry mass per kg of fuel, on top of STRUCTURE_KG
+REPLAY_COLUMNS = ("pred_apogee_km", "pred_max_vel", "pred_burn_end", "pred_orbit")
+
+
+def mission_configs(df, twr=LIFTOFF_TWR, isp_s=ISP_S, tank_fraction=TANK_FRACTION):
+    """(thrust kN, fuel t, payload t, burn t/s) arrays for the missions in `df`.
+
+    The model's payload carries the stage's tankage as well, so bigger
+    stages are not free. Thrust lifts the fuelled vehicle at `twr`; the
+    burn rate is the mass flow that thrust needs at `isp_s`. Burn rates are
+    in the model's slider units (100 kg/s) and, like thrust, can exceed the
+    slider ranges.
+    """
+    payload_kg = df["payload"].to_numpy(dtype=float)
+    if "fuel" in df.columns:
+        fuel_kg = df["fuel"].to_numpy(dtype=float)
+    else:  # the app's projection keeps only the derived tonnes
+        fuel_kg = df["fuel_tonnes"].to_numpy(dtype=float) * 1000
+    payload_kg = payload_kg + tank_fraction * fuel_kg
+    thrust_n = twr * (payload_kg + fuel_kg + STRUCTURE_KG) * G0
+    return thrust_n / 1000, fuel_kg / 1000, payload_kg / 1000, thrust_n / (isp_s * G0) / 100
+
+
+def _metrics(method, configs):
+    return flight_metrics(method, *configs.T)
+
+
+def replay_missions(df, method="euler", workers=None, chunk_size=20_000, progress=None):
+    """Frame indexed like `df` with the slider configuration and `REPLAY_COLUMNS` of each mission.
+
+    `method` is "euler" (the app's integrator, stepped in batches) or
+    "closed" (analytic). Chunks of distinct configurations run on
+    `workers` processes (all cores by default; 1, or a single chunk, runs
+    inline). `progress(done, total)` is called as chunks finish.
+    """
+    configs = np.column_stack(mission_configs(df)) if len(df) else np.empty((0, len(AXES)))
+    unique, inverse = np.unique(configs, axis=0, return_inverse=True)
+    chunks = [unique[i:i + chunk_size] for i in range(0, len(unique), chunk_size)]
+    workers = min(workers or os.cpu_count() or 1, len(chunks)) or 1
+
+    results = []
+    if workers == 1:
+        for chunk in chunks:
+            results.append(_metrics(method, chunk))
+            if progress:
+                progress(sum(map(len, results)), len(unique))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_metrics, method, chunk) for chunk in chunks]
+            try:
+                for future in futures:
+                    results.append(future.result())
+                    if progress:
+                        progress(sum(map(len, results)), len(unique))
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    values = (np.concatenate(results) if results else np.empty((0, 4)))[inverse.ravel()]
+    out = pd.DataFrame(configs, index=df.index, columns=list(AXES))
+    out["pred_apogee_km"] = values[:, 0] / 1000
+    out["pred_max_vel"] = values[:, 1]
+    out["pred_burn_end"] = values[:, 2]
+    out["pred_orbit"] = values[:, 3].astype(bool)
+    return out
+
+
+def main(argv=None):
+    from rocketsim.missions import load_missions
+
+    parser = argparse.ArgumentParser(prog="python -m rocketsim.replay", description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="Parquet, Arrow/Feather or CSV mission catalog")
+    parser.add_argument("--out", required=True, help="CSV or Parquet file for the catalog with replay columns")
+    parser.add_argument("--method", choices=["euler", "closed"], default="euler")
+    parser.add_argument("--workers", type=int, help="processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    def progress(done, total):
+        print(f"\r{done:,} / {total:,} configurations", end="", flush=True)
+
+    start = time.perf_counter()
+    df = load_missions(args.source)
+    replay = replay_missions(df, args.method, args.workers, progress=progress)
+    out = df.join(replay)
+    if args.out.lower().endswith((".parquet", ".pq")):
+        out.to_parquet(args.out, index=False)
+    else:
+        out.to_csv(args.out, index=False)
+    print(f"\nwrote {args.out} ({len(out):,} missions, {int(replay['pred_orbit'].sum()):,} predicted to reach orbit, "
+          f"{args.method}) in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
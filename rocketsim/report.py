@@ -0,0 +1,142 @@
+"""Dashboard report export: figures and tables rendered off the script thread.
+
+`build_report` takes figure specs (the JSON the dashboard already caches,
+or callables returning it) and tables, and renders them as one
+self-contained HTML page, a zip of PNG images or a zip data bundle. Each
+figure or table is rendered as a separate task on an optional executor,
+typically a process pool, so a large export neither holds the server's
+GIL nor blocks the session that asked for it.
+"""
+
+import importlib.util
+import io
+import json
+import time
+import zipfile
+from concurrent.futures import Future
+from html import escape
+from typing import NamedTuple
+
+# format -> (label, MIME type, file extension)
+REPORT_FORMATS = {
+    "html": ("Self-contained HTML", "text/html", ".html"),
+    "png":  ("PNG images (zip)", "application/zip", ".zip"),
+    "data": ("Data bundle (zip)", "application/zip", ".zip"),
+}
+IMAGE_SIZE = (1200, 600)    # px
+
+_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ background: #020818; color: #c8e0ff; font-family: monospace; margin: 2rem auto; max-width: 1400px; }}
+h1 {{ color: #00d4ff; font-size: 1.4rem; letter-spacing: 0.1em; }}
+table {{ border-collapse: collapse; margin: 1rem 0 2rem; }}
+td {{ border: 1px solid #0d2a5e; padding: 0.3rem 0.8rem; }}
+.figure {{ margin-bottom: 2rem; }}
+</style></head>
+<body><h1>{title}</h1>
+<table>{meta}</table>
+{figures}
+</body></html>
+"""
+
+
+class Report(NamedTuple):
+    file_name: str
+    mime: str
+    data: bytes
+    seconds: float
+
+
+def _require_kaleido():
+    if importlib.util.find_spec("kaleido") is None:
+        raise ImportError("PNG export requires kaleido (pip install kaleido)")
+
+
+def render_figure(spec, fmt, include_plotlyjs=False):
+    """A figure's JSON `spec` as an HTML fragment (str) or, for "png", image bytes."""
+    import plotly.io as pio
+
+    fig = json.loads(spec)
+    if fmt == "png":
+        _require_kaleido()
+        width, height = IMAGE_SIZE
+        return pio.to_image(fig, format="png", width=width, height=height, validate=False)
+    return pio.to_html(fig, include_plotlyjs=include_plotlyjs, full_html=False, validate=False,
+                       config={"displaylogo": False})
+
+
+def render_table(df):
+    """A frame as CSV bytes."""
+    return df.to_csv(index=False).encode()
+
+
+def _run(executor, fn, *args):
+    if executor is not None:
+        return executor.submit(fn, *args)
+    future = Future()
+    future.set_result(fn(*args))
+    return future
+
+
+def build_report(title, figures, tables=(), fmt="html", meta=None, executor=None, progress=None):
+    """Render `figures` and `tables` into a `Report`.
+
+    `figures` is a sequence of (name, spec) where spec is figure JSON or a
+    zero-argument callable returning it; callables are resolved here, in
+    order, so cached specs cost a lookup. `tables` is a sequence of (name,
+    frame or callable) and goes only into the "data" bundle. `meta` is a
+    dict shown in the HTML header and written to the bundle. Renders run
+    on `executor` when given (inline otherwise). `progress(done, total,
+    label)` is called as each step finishes.
+    """
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"unknown report format {fmt!r}, expected one of {sorted(REPORT_FORMATS)}")
+    if fmt == "png":
+        _require_kaleido()
+    start = time.perf_counter()
+    meta = dict(meta or {}, created=time.strftime("%Y-%m-%d %H:%M:%S"))
+    tables = list(tables) if fmt == "data" else []
+    total = 2 * len(figures) + 2 * len(tables)
+    done = 0
+
+    def step(label):
+        nonlocal done
+        done += 1
+        if progress:
+            progress(done, total, label)
+
+    specs = []
+    for name, spec in figures:
+        specs.append((name, spec() if callable(spec) else spec))
+        step(f"figure {name}")
+    frames = []
+    for name, frame in tables:
+        frames.append((name, frame() if callable(frame) else frame))
+        step(f"table {name}")
+
+    _, mime, ext = REPORT_FORMATS[fmt]
+    buffer = io.BytesIO()
+    if fmt == "html":
+        tasks = [(name, _run(executor, render_figure, spec, fmt, i == 0)) for i, (name, spec) in enumerate(specs)]
+        parts = []
+        for name, task in tasks:
+            parts.append(f'<div class="figure" id="{escape(name)}">{task.result()}</div>')
+            step(f"rendered {name}")
+        rows = "".join(f"<tr><td>{escape(str(k))}</td><td>{escape(str(v))}</td></tr>" for k, v in meta.items())
+        buffer.write(_PAGE.format(title=escape(title), meta=rows, figures="\n".join(parts)).encode())
+    else:
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as bundle:
+            if fmt == "png":
+                tasks = [(f"{name}.png", _run(executor, render_figure, spec, fmt)) for name, spec in specs]
+            else:
+                for name, spec in specs:
+                    bundle.writestr(f"figures/{name}.json", spec)
+                    step(f"wrote {name}")
+                tasks = [(f"{name}.csv", _run(executor, render_table, frame)) for name, frame in frames]
+            for path, task in tasks:
+                bundle.writestr(path, task.result())
+                step(f"rendered {path}")
+            bundle.writestr("report.json", json.dumps(dict(meta, title=title), indent=1, default=str))
+    stem = "".join(c if c.isalnum() else "-" for c in title.lower()).strip("-")
+    return Report(f"{stem}{ext}", mime, buffer.getvalue(), time.perf_counter() - start)
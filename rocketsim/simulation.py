@@ -0,0 +1,579 @@
+"""Launch simulation: constant thrust, constant burn rate, constant g, no drag.
+
+`run_simulation_atmospheric` is the exception: the same stepping with drag
+and altitude-dependent gravity from `rocketsim.atmosphere`'s tables. Both
+stepped models are also available as generators of trajectory chunks
+(`stream_simulation`, `stream_simulation_atmospheric`) for progressive
+rendering; the run functions just collect them. Chart samples are
+float32 arrays, which Plotly sends to the browser as binary typed arrays;
+the flight metrics stay in full precision.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+# ── Model constants ──────────────────────────────────────────────────────────
+G0 = 9.81               # m/s²
+DT = 2                  # s, fixed Euler step
+MAX_STEPS = 1500        # hard cap → 3000 s of flight
+SAMPLE_EVERY = 5        # keep every 5th step for the chart
+TRAJECTORY_DTYPE = np.float32   # chart samples: ~7 significant digits
+STRUCTURE_KG = 5000     # dry structure added to the payload
+ORBIT_ALT_M = 200_000   # "Orbit Reached" threshold
+CHUNK_SAMPLES = 50      # chart samples per streamed chunk
+
+
+# ── Single run ────────────────────────────────────────────────────────────────
+class TrajectoryChunk(NamedTuple):
+    times: np.ndarray   # s, samples so far (views of the run's buffers)
+    alts: np.ndarray    # km
+    vels: np.ndarray    # m/s
+    max_alt: float      # m, so far
+    max_vel: float      # m/s, so far
+    burn_end: float     # s, 0 until the fuel runs out
+    done: bool          # last chunk of the run
+
+
+def collect_trajectory(chunks, on_chunk=None):
+    """The ``(times, alts, vels, max_alt, max_vel, burn_end)`` of a run from its `TrajectoryChunk`s.
+
+    Chunks are views of buffers the run fills in place, so the last one
+    already holds the whole trajectory and nothing is concatenated.
+    `on_chunk(times, alts, vels, chunk)` is called after each chunk with the
+    samples so far; stopping early (an exception from it, or closing the
+    generator) abandons the run.
+    """
+    for chunk in chunks:
+        if on_chunk:
+            on_chunk(chunk.times, chunk.alts, chunk.vels, chunk)
+    return chunk.times, chunk.alts, chunk.vels, chunk.max_alt, chunk.max_vel, chunk.burn_end
+
+
+def _trajectory_buffers(n_samples):
+    # (times, alts, vels), preallocated for a run that never lands; sample 0 is the pad.
+    return tuple(np.zeros(n_samples, dtype=TRAJECTORY_DTYPE) for _ in range(3))
+
+
+def run_simulation(thrust_kn, fuel_t, payload_t, burn_tps, sample_every=SAMPLE_EVERY):
+    return collect_trajectory(stream_simulation(thrust_kn, fuel_t, payload_t, burn_tps, chunk_samples=None,
+                                                sample_every=sample_every))
+
+
+def stream_simulation(thrust_kn, fuel_t, payload_t, burn_tps, chunk_samples=CHUNK_SAMPLES,
+                      sample_every=SAMPLE_EVERY):
+    """`run_simulation` as a generator of `TrajectoryChunk`s every `chunk_samples` samples (None: one chunk).
+
+    One chart sample is kept every `sample_every` steps.
+    """
+    chunk_samples = chunk_samples or MAX_STEPS
+    thrust_n  = thrust_kn * 1000       # N
+    fuel_kg   = fuel_t   * 1000        # kg
+    payload_kg = payload_t * 1000      # kg
+    burn_kgs  = burn_tps  * 100        # kg/s
+    g = G0
+    dt = DT
+
+    fuel, vel, alt = fuel_kg, 0.0, 0.0
+    dry_mass = payload_kg + STRUCTURE_KG
+    times, alts, vels = _trajectory_buffers(MAX_STEPS // sample_every + 1)
+    k, sent = 1, 0      # samples written, and as of the last chunk
+    max_alt = max_vel = burn_end = 0
+
+    for step in range(1, MAX_STEPS + 1):
+        t = step * dt
+        total_mass = dry_mass + fuel
+        if fuel > 0:
+            fuel = max(0, fuel - burn_kgs * dt)
+            if fuel == 0 and burn_end == 0:
+                burn_end = t
+            accel = (thrust_n / total_mass) - g
+        else:
+            accel = -g
+        vel += accel * dt
+        alt += vel * dt
+        if alt < 0 and vel < 0:
+            alt = 0
+            break
+        if alt < 0:
+            alt = 0
+        max_alt = max(max_alt, alt)
+        max_vel = max(max_vel, vel)
+        if step % sample_every == 0:
+            times[k] = t
+            alts[k] = alt / 1000
+            vels[k] = vel
+            k += 1
+            if k - sent >= chunk_samples:
+                yield TrajectoryChunk(times[:k], alts[:k], vels[:k], max_alt, max_vel, burn_end, False)
+                sent = k
+
+    yield TrajectoryChunk(times[:k], alts[:k], vels[:k], max_alt, max_vel, burn_end, True)
+
+
+def run_simulation_atmospheric(thrust_kn, fuel_t, payload_t, burn_tps, sample_every=SAMPLE_EVERY):
+    """`run_simulation` with drag and altitude-dependent gravity.
+
+    Same fixed step and outputs, plus drag through the 1976 standard
+    atmosphere and inverse-square gravity, both read from the altitude
+    tables in `rocketsim.atmosphere` and linearly interpolated, so a step
+    costs a few list lookups however detailed the atmosphere model is.
+    """
+    return collect_trajectory(stream_simulation_atmospheric(thrust_kn, fuel_t, payload_t, burn_tps,
+                                                            chunk_samples=None, sample_every=sample_every))
+
+
+def stream_simulation_atmospheric(thrust_kn, fuel_t, payload_t, burn_tps, chunk_samples=CHUNK_SAMPLES,
+                                  sample_every=SAMPLE_EVERY):
+    """`run_simulation_atmospheric` as a generator of `TrajectoryChunk`s."""
+    from rocketsim.atmosphere import (
+        ALT_STEP_M, DENSITY_ROWS, DRAG_CD, EARTH_RADIUS_M, GRAVITY_ROWS, REF_AREA_M2,
+    )
+
+    thrust_n  = thrust_kn * 1000
+    fuel_kg   = fuel_t   * 1000
+    payload_kg = payload_t * 1000
+    burn_kgs  = burn_tps  * 100
+    dt = DT
+    chunk_samples = chunk_samples or MAX_STEPS
+    rho_v, rho_s = DENSITY_ROWS
+    g_v, g_s = GRAVITY_ROWS
+    last_row = len(rho_v) - 1
+    per_metre = 1 / ALT_STEP_M
+    drag_k = 0.5 * DRAG_CD * REF_AREA_M2
+    gm = G0 * EARTH_RADIUS_M ** 2
+
+    fuel, vel, alt = fuel_kg, 0.0, 0.0
+    dry_mass = payload_kg + STRUCTURE_KG
+    times, alts, vels = _trajectory_buffers(MAX_STEPS // sample_every + 1)
+    k, sent = 1, 0      # samples written, and as of the last chunk
+    max_alt = max_vel = burn_end = 0
+
+    for step in range(1, MAX_STEPS + 1):
+        t = step * dt
+        total_mass = dry_mass + fuel
+        x = alt * per_metre
+        i = int(x)
+        if i < last_row:
+            frac = x - i
+            g = g_v[i] + g_s[i] * frac
+            drag = drag_k * (rho_v[i] + rho_s[i] * frac) * vel * abs(vel) / total_mass
+        else:  # vacuum above the tables
+            r = EARTH_RADIUS_M + alt
+            g = gm / (r * r)
+            drag = 0.0
+        if fuel > 0:
+            fuel = max(0, fuel - burn_kgs * dt)
+            if fuel == 0 and burn_end == 0:
+                burn_end = t
+            accel = (thrust_n / total_mass) - g - drag
+        else:
+            accel = -g - drag
+        vel += accel * dt
+        alt += vel * dt
+        if alt < 0 and vel < 0:
+            alt = 0
+            break
+        if alt < 0:
+            alt = 0
+        max_alt = max(max_alt, alt)
+        max_vel = max(max_vel, vel)
+        if step % sample_every == 0:
+            times[k] = t
+            alts[k] = alt / 1000
+            vels[k] = vel
+            k += 1
+            if k - sent >= chunk_samples:
+                yield TrajectoryChunk(times[:k], alts[:k], vels[:k], max_alt, max_vel, burn_end, False)
+                sent = k
+
+    yield TrajectoryChunk(times[:k], alts[:k], vels[:k], max_alt, max_vel, burn_end, True)
+
+
+# ── Batch runs ────────────────────────────────────────────────────────────────
+class BatchResult(NamedTuple):
+    times: np.ndarray       # (samples,) shared sample clock, s
+    alts: np.ndarray        # (n, samples) km, NaN after landing
+    vels: np.ndarray        # (n, samples) m/s, NaN after landing
+    n_samples: np.ndarray   # (n,) valid samples per run
+    max_alt: np.ndarray     # (n,) m
+    max_vel: np.ndarray     # (n,) m/s
+    burn_end: np.ndarray    # (n,) s, 0 if fuel never ran out
+
+
+def run_simulation_batch(thrust_kn, fuel_t, payload_t, burn_tps, trajectories=True):
+    """Advance many launch configurations together.
+
+    Takes broadcastable arrays of slider values and steps every run in one
+    NumPy pass, masking each out as it lands. Metrics match `run_simulation`
+    for each configuration; row `i` of `alts`/`vels` holds the same
+    `TRAJECTORY_DTYPE` samples up to `n_samples[i]`.
+    """
+    thrust_n, fuel, payload_kg, burn_kgs = np.broadcast_arrays(
+        np.asarray(thrust_kn, dtype=float) * 1000,
+        np.asarray(fuel_t, dtype=float) * 1000,
+        np.asarray(payload_t, dtype=float) * 1000,
+        np.asarray(burn_tps, dtype=float) * 100,
+    )
+    shape = thrust_n.shape
+    thrust_n, payload_kg, burn_kgs = (a.ravel() for a in (thrust_n, payload_kg, burn_kgs))
+    fuel = fuel.ravel().copy()
+    n = fuel.size
+    dt = DT
+
+    dry_mass = payload_kg + STRUCTURE_KG
+    burn_dt = burn_kgs * dt
+    vel = np.zeros(n)
+    alt = np.zeros(n)
+    max_alt = np.zeros(n)
+    max_vel = np.zeros(n)
+    burn_end = np.zeros(n)
+    active = np.ones(n, dtype=bool)
+
+    n_cols = MAX_STEPS // SAMPLE_EVERY + 1
+    times = (np.arange(n_cols) * (SAMPLE_EVERY * dt)).astype(TRAJECTORY_DTYPE)
+    n_samples = np.ones(n, dtype=np.int64)
+    if trajectories:
+        alts = np.full((n, n_cols), np.nan, dtype=TRAJECTORY_DTYPE)
+        vels = np.full((n, n_cols), np.nan, dtype=TRAJECTORY_DTYPE)
+        alts[:, 0] = 0.0
+        vels[:, 0] = 0.0
+    else:
+        alts = vels = None
+
+    for step in range(1, MAX_STEPS + 1):
+        idx = np.flatnonzero(active)
+        if not idx.size:
+            break
+        t = step * dt
+        f = fuel[idx]
+        burning = f > 0
+        accel = np.where(burning, thrust_n[idx] / (dry_mass[idx] + f) - G0, -G0)
+        f_new = np.where(burning, np.maximum(0, f - burn_dt[idx]), f)
+        burn_end[idx[burning & (f_new == 0) & (burn_end[idx] == 0)]] = t
+        fuel[idx] = f_new
+
+        v = vel[idx] + accel * dt
+        a = alt[idx] + v * dt
+        landed = (a < 0) & (v < 0)
+        a = np.maximum(a, 0)
+        vel[idx] = v
+        alt[idx] = a
+
+        live = idx[~landed]
+        active[idx[landed]] = False
+        max_alt[live] = np.maximum(max_alt[live], alt[live])
+        max_vel[live] = np.maximum(max_vel[live], vel[live])
+        if step % SAMPLE_EVERY == 0 and live.size:
+            col = step // SAMPLE_EVERY
+            n_samples[live] = col + 1
+            if trajectories:
+                alts[live, col] = alt[live] / 1000
+                vels[live, col] = vel[live]
+
+    def _shaped(a):
+        return a.reshape(shape + a.shape[1:])
+
+    return BatchResult(
+        times=times,
+        alts=_shaped(alts) if trajectories else None,
+        vels=_shaped(vels) if trajectories else None,
+        n_samples=_shaped(n_samples),
+        max_alt=_shaped(max_alt),
+        max_vel=_shaped(max_vel),
+        burn_end=_shaped(burn_end),
+    )
+
+
+# ── Adaptive integrator ───────────────────────────────────────────────────────
+# Dormand–Prince 5(4) tableau.
+_DP_C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0)
+_DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DP_E = (71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
+_ALT, _VEL, _FUEL = 0, 1, 2
+_ATOL = np.array([1e-3, 1e-5, 1e-3])   # m, m/s, kg
+
+
+class AdaptiveResult(NamedTuple):
+    times: np.ndarray       # s, evenly spaced over the whole flight
+    alts: np.ndarray        # km
+    vels: np.ndarray        # m/s
+    max_alt: float          # m, at apogee
+    max_vel: float          # m/s
+    burn_end: float         # s, 0 if the rocket never lifts off
+    apogee_t: float         # s
+    impact_t: float         # s
+    n_steps: int            # accepted steps
+    n_evals: int            # derivative evaluations
+
+
+def _hermite(seg, t):
+    t0, t1, y0, y1, f0, f1 = seg
+    h = t1 - t0
+    s = (t - t0) / h
+    h00 = (1 + 2 * s) * (1 - s) ** 2
+    h10 = s * (1 - s) ** 2
+    h01 = s * s * (3 - 2 * s)
+    h11 = s * s * (s - 1)
+    return h00 * y0 + h10 * h * f0 + h01 * y1 + h11 * h * f1
+
+
+def _find_root(seg, i, tol):
+    # Illinois false position on one component of the step's interpolant.
+    a, b = seg[0], seg[1]
+    fa, fb = seg[2][i], seg[3][i]
+    side = 0
+    while b - a > tol:
+        m = (a * fb - b * fa) / (fb - fa)
+        fm = _hermite(seg, m)[i]
+        if fm * fb > 0:
+            b, fb = m, fm
+            if side == -1:
+                fa /= 2
+            side = -1
+        elif fm * fa > 0:
+            a, fa = m, fm
+            if side == 1:
+                fb /= 2
+            side = 1
+        else:
+            return m
+    return (a + b) / 2
+
+
+def run_simulation_adaptive(thrust_kn, fuel_t, payload_t, burn_tps,
+                            rtol=1e-6, n_samples=301):
+    """Error-controlled Dormand–Prince 5(4) run of the launch model.
+
+    Burnout, apogee and ground impact are located by root-finding on each
+    step's interpolant rather than at step boundaries, and the flight is
+    integrated until impact instead of being cut at 3000 s. The trajectory
+    is resampled to `n_samples` evenly spaced points for the chart.
+    """
+    thrust_n = thrust_kn * 1000
+    payload_kg = payload_t * 1000
+    burn_kgs = burn_tps * 100
+    dry_mass = payload_kg + STRUCTURE_KG
+    y = np.array([0.0, 0.0, fuel_t * 1000.0])
+
+    if thrust_n / (dry_mass + y[_FUEL]) <= G0:
+        return AdaptiveResult(*_trajectory_buffers(1), 0.0, 0.0, 0.0, 0.0, 0.0, 0, 0)
+
+    # The burn phase is integrated on its smooth extension past fuel = 0 so
+    # the burnout root can be located on an exact (linear) fuel interpolant.
+    def deriv(y, burning):
+        if burning:
+            return np.array([y[_VEL], thrust_n / (dry_mass + y[_FUEL]) - G0, -burn_kgs])
+        return np.array([y[_VEL], -G0, 0.0])
+
+    t = 0.0
+    k1 = deriv(y, True)
+    n_evals, n_steps = 1, 0
+    h = 1.0
+    burning = True
+    to_burnout = False
+    burn_end = apogee_t = impact_t = 0.0
+    max_alt = max_vel = 0.0
+    segments = []
+
+    while True:
+        if burning:
+            # Keep the extended burn away from zero mass.
+            h = min(h, (y[_FUEL] + dry_mass / 2) / burn_kgs)
+        k = [k1]
+        for stage in range(1, 7):
+            yi = y + h * sum(a * kj for a, kj in zip(_DP_A[stage], k))
+            k.append(deriv(yi, burning))
+        n_evals += 6
+        y_new = yi
+        err = h * sum(e * kj for e, kj in zip(_DP_E, k))
+        scale = _ATOL + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        err_norm = float(np.sqrt(np.mean((err / scale) ** 2)))
+        if err_norm > 1:
+            h *= max(0.2, 0.9 * err_norm ** -0.2)
+            to_burnout = False
+            continue
+
+        seg = (t, t + h, y, y_new, k1, k[6])
+        tol = 1e-9 * max(1.0, t + h)
+
+        # Burnout: re-take the step so it ends exactly on the discontinuity.
+        if burning and (to_burnout or y_new[_FUEL] <= 0):
+            if not to_burnout:
+                t_b = _find_root(seg, _FUEL, tol)
+                if t + h - t_b > tol:
+                    h = t_b - t
+                    to_burnout = True
+                    continue
+            to_burnout = False
+            y_new = y_new.copy()
+            y_new[_FUEL] = 0.0
+            burning = False
+            burn_end = float(t + h)
+            k_next = deriv(y_new, False)
+            n_evals += 1
+        else:
+            k_next = k[6]
+
+        n_steps += 1
+        segments.append(seg)
+        max_vel = max(max_vel, y_new[_VEL])
+
+        if not burning and y[_VEL] > 0 >= y_new[_VEL]:
+            apogee_t = float(_find_root(seg, _VEL, tol))
+            max_alt = max(max_alt, float(_hermite(seg, apogee_t)[_ALT]))
+        max_alt = max(max_alt, y_new[_ALT])
+
+        if y_new[_ALT] < 0 and y_new[_VEL] < 0:
+            impact_t = float(_find_root(seg, _ALT, tol))
+            break
+
+        t, y, k1 = t + h, y_new, k_next
+        h *= min(5.0, 0.9 * max(err_norm, 1e-10) ** -0.2)
+
+    times = np.linspace(0.0, impact_t, n_samples)
+    _, alts, vels = _trajectory_buffers(n_samples)
+    j = 0
+    for i, ts in enumerate(times):
+        while segments[j][1] < ts and j < len(segments) - 1:
+            j += 1
+        ys = _hermite(segments[j], ts)
+        alts[i] = max(ys[_ALT], 0.0) / 1000
+        vels[i] = ys[_VEL]
+
+    return AdaptiveResult(
+        times=times.astype(TRAJECTORY_DTYPE), alts=alts, vels=vels,
+        max_alt=float(max_alt), max_vel=float(max_vel), burn_end=burn_end,
+        apogee_t=apogee_t, impact_t=impact_t, n_steps=n_steps, n_evals=n_evals,
+    )
+
+
+# ── Closed form ───────────────────────────────────────────────────────────────
+class ClosedFormMetrics(NamedTuple):
+    max_alt: np.ndarray     # m
+    max_vel: np.ndarray     # m/s
+    burn_end: np.ndarray    # s
+    apogee_t: np.ndarray    # s
+    impact_t: np.ndarray    # s
+    lifted: np.ndarray      # bool, thrust exceeds weight at ignition
+
+
+class ClosedFormResult(NamedTuple):
+    times: np.ndarray       # s
+    alts: np.ndarray        # km
+    vels: np.ndarray        # m/s
+    max_alt: float
+    max_vel: float
+    burn_end: float
+    apogee_t: float
+    impact_t: float
+
+
+def closed_form_metrics(thrust_kn, fuel_t, payload_t, burn_tps):
+    """Analytic flight metrics for broadcastable arrays of slider values.
+
+    The burn phase follows the rocket equation with gravity loss and the
+    coast is plain projectile motion, so nothing is stepped. These are the
+    values the integrators converge to as their step size shrinks.
+    """
+    thrust_n = np.asarray(thrust_kn, dtype=float) * 1000
+    fuel_kg = np.asarray(fuel_t, dtype=float) * 1000
+    dry_mass = np.asarray(payload_t, dtype=float) * 1000 + STRUCTURE_KG
+    burn_kgs = np.asarray(burn_tps, dtype=float) * 100
+
+    m0 = dry_mass + fuel_kg
+    lifted = thrust_n / m0 > G0
+    ve = thrust_n / burn_kgs
+    tb = fuel_kg / burn_kgs
+    log_ratio = np.log(m0 / dry_mass)
+    vb = ve * log_ratio - G0 * tb
+    hb = ve * (tb - dry_mass / burn_kgs * log_ratio) - G0 * tb ** 2 / 2
+
+    apogee_t = tb + vb / G0
+    max_alt = hb + vb ** 2 / (2 * G0)
+    impact_t = tb + (vb + np.sqrt(np.maximum(vb ** 2 + 2 * G0 * hb, 0))) / G0
+
+    zero = np.zeros_like(max_alt)
+    return ClosedFormMetrics(
+        max_alt=np.where(lifted, max_alt, zero),
+        max_vel=np.where(lifted, vb, zero),
+        burn_end=np.where(lifted, tb, zero),
+        apogee_t=np.where(lifted, apogee_t, zero),
+        impact_t=np.where(lifted, impact_t, zero),
+        lifted=lifted,
+    )
+
+
+def closed_form_state(t, thrust_kn, fuel_t, payload_t, burn_tps):
+    """Altitude (m) and velocity (m/s) at times `t` for one configuration."""
+    t = np.asarray(t, dtype=float)
+    thrust_n = thrust_kn * 1000
+    dry_mass = payload_t * 1000 + STRUCTURE_KG
+    burn_kgs = burn_tps * 100
+    m0 = dry_mass + fuel_t * 1000
+    ve = thrust_n / burn_kgs
+    tb = fuel_t * 1000 / burn_kgs
+
+    tt = np.minimum(t, tb)
+    m = m0 - burn_kgs * tt
+    log_ratio = np.log(m0 / m)
+    v_burn = ve * log_ratio - G0 * tt
+    h_burn = ve * (tt - m / burn_kgs * log_ratio) - G0 * tt ** 2 / 2
+
+    dt = np.maximum(t - tb, 0)
+    vel = v_burn - G0 * dt
+    alt = np.maximum(h_burn + v_burn * dt - G0 * dt ** 2 / 2, 0)
+    return alt, vel
+
+
+def run_simulation_closed_form(thrust_kn, fuel_t, payload_t, burn_tps, n_points=301):
+    """O(1) metrics plus a trajectory sampled at `n_points` for the chart."""
+    m = closed_form_metrics(thrust_kn, fuel_t, payload_t, burn_tps)
+    if not m.lifted:
+        return ClosedFormResult(*_trajectory_buffers(1), 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    times = np.linspace(0.0, float(m.impact_t), n_points)
+    alt, vel = closed_form_state(times, thrust_kn, fuel_t, payload_t, burn_tps)
+    return ClosedFormResult(
+        times=times.astype(TRAJECTORY_DTYPE),
+        alts=(alt / 1000).astype(TRAJECTORY_DTYPE),
+        vels=vel.astype(TRAJECTORY_DTYPE),
+        max_alt=float(m.max_alt),
+        max_vel=float(m.max_vel),
+        burn_end=float(m.burn_end),
+        apogee_t=float(m.apogee_t),
+        impact_t=float(m.impact_t),
+    )
+
+
+def validate_closed_form(thrust_kn, fuel_t, payload_t, burn_tps, rtol=1e-9):
+    """Compare the closed form with both stepped integrators.
+
+    Returns one row per metric with the analytic value, the adaptive and
+    Euler results, and each integrator's relative error.
+    """
+    exact = run_simulation_closed_form(thrust_kn, fuel_t, payload_t, burn_tps, n_points=2)
+    adaptive = run_simulation_adaptive(thrust_kn, fuel_t, payload_t, burn_tps, rtol=rtol, n_samples=2)
+    euler = run_simulation(thrust_kn, fuel_t, payload_t, burn_tps)
+
+    def rel(a, b):
+        return abs(a - b) / abs(b) if b else float(a != b)
+
+    rows = []
+    for name, ex, ad, eu in [
+        ("max_alt", exact.max_alt, adaptive.max_alt, euler[3]),
+        ("max_vel", exact.max_vel, adaptive.max_vel, euler[4]),
+        ("burn_end", exact.burn_end, adaptive.burn_end, euler[5]),
+    ]:
+        rows.append(dict(metric=name, closed_form=ex, adaptive=ad, euler=eu,
+                         adaptive_rel_err=rel(ad, ex), euler_rel_err=rel(eu, ex)))
+    return rows
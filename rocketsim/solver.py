@@ -0,0 +1,135 @@
+"""Inverse solver: find the slider value that hits a target apogee or velocity."""
+
+import math
+import time
+from typing import NamedTuple
+
+from rocketsim.envelope import AXES, SLIDER_GRID
+from rocketsim.simulation import (
+    closed_form_metrics,
+    run_simulation,
+    run_simulation_adaptive,
+    run_simulation_atmospheric,
+)
+
+QUANTITIES = ("max_alt", "max_vel")
+
+
+class SolveResult(NamedTuple):
+    parameter: str
+    value: float            # continuous solution, nan if unreachable
+    slider_value: float     # nearest slider step that still meets the target
+    achieved: float         # quantity at `slider_value`
+    iterations: int
+    evaluations: int
+    seconds: float
+    converged: bool
+    message: str
+
+
+def _evaluate(method, params):
+    if method == "closed":
+        m = closed_form_metrics(*params)
+        return dict(max_alt=float(m.max_alt), max_vel=float(m.max_vel))
+    if method == "adaptive":
+        r = run_simulation_adaptive(*params, n_samples=2)
+        return dict(max_alt=r.max_alt, max_vel=r.max_vel)
+    if method == "euler":
+        r = run_simulation(*params)
+        return dict(max_alt=r[3], max_vel=r[4])
+    if method == "atmosphere":
+        r = run_simulation_atmospheric(*params)
+        return dict(max_alt=r[3], max_vel=r[4])
+    raise ValueError(f"unknown method {method!r}, expected 'euler', 'atmosphere', 'adaptive' or 'closed'")
+
+
+def solve_parameter(parameter, target, thrust_kn, fuel_t, payload_t, burn_tps,
+                    quantity="max_alt", method="closed", goal=None, scan=9, xtol=1e-3, ftol=1e-6):
+    """Search one slider for the smallest (or largest) value reaching `target`.
+
+    The other three sliders stay fixed. `goal` is ``"min"`` by default and
+    ``"max"`` for payload. A coarse scan of `scan` points from the preferred
+    end of the slider brackets the first crossing, which Illinois false
+    position then refines to `xtol` slider steps (or to within `ftol` of the
+    target), so a handful of model evaluations replace a manual slider
+    sweep. `slider_value` rounds the answer onto the slider grid in the
+    direction that still meets the target.
+    """
+    if parameter not in AXES:
+        raise ValueError(f"unknown parameter {parameter!r}, expected one of {AXES}")
+    if quantity not in QUANTITIES:
+        raise ValueError(f"unknown quantity {quantity!r}, expected one of {QUANTITIES}")
+    goal = goal or ("max" if parameter == "payload_t" else "min")
+    if goal not in ("min", "max"):
+        raise ValueError(f"unknown goal {goal!r}, expected 'min' or 'max'")
+
+    start = time.perf_counter()
+    params = dict(thrust_kn=thrust_kn, fuel_t=fuel_t, payload_t=payload_t, burn_tps=burn_tps)
+    evaluations = 0
+
+    def f(x):
+        nonlocal evaluations
+        evaluations += 1
+        params[parameter] = x
+        return _evaluate(method, tuple(params[a] for a in AXES))[quantity] - target
+
+    lo, hi, step = SLIDER_GRID[parameter]
+    grid = [lo + (hi - lo) * i / (scan - 1) for i in range(scan)]
+    if goal == "max":
+        grid.reverse()
+
+    miss = None
+    for x in grid:
+        fx = f(x)
+        if fx >= 0:
+            break
+        miss = (x, fx)
+    else:
+        return SolveResult(
+            parameter, math.nan, math.nan, math.nan, 0, evaluations,
+            time.perf_counter() - start, False,
+            f"target not reachable for any {parameter} in {lo}–{hi}",
+        )
+
+    iterations = 0
+    if miss is not None:
+        # `a` misses the target, `b` meets it; keep that invariant.
+        (a, fa), (b, fb) = miss, (x, fx)
+        side = stalled = 0
+        while abs(b - a) > xtol * step and iterations < 100:
+            iterations += 1
+            width = abs(b - a)
+            m = (a * fb - b * fa) / (fb - fa)
+            # Switch to bisection for good once the bracket stops halving,
+            # e.g. across the lift-off discontinuity.
+            if stalled >= 3 or not min(a, b) < m < max(a, b):
+                m = (a + b) / 2
+            fm = f(m)
+            if 0 <= fm <= ftol * abs(target):
+                b = m
+                break
+            if fm >= 0:
+                b, fb = m, fm
+                if side == -1:
+                    fa /= 2
+                side = -1
+            else:
+                a, fa = m, fm
+                if side == 1:
+                    fb /= 2
+                side = 1
+            if abs(b - a) > width / 2:
+                stalled += 1
+            elif stalled < 3:
+                stalled = 0
+        x = b
+
+    steps = (x - lo) / step
+    steps = math.ceil(steps - 1e-9) if goal == "min" else math.floor(steps + 1e-9)
+    snapped = round(min(max(lo + steps * step, lo), hi), 6)
+    achieved = f(snapped) + target
+    return SolveResult(
+        parameter, x, snapped, achieved, iterations, evaluations,
+        time.perf_counter() - start, True,
+        f"{goal}imum {parameter} reaching the target",
+    )